@@ -12,6 +12,143 @@ CAT_API_URL = os.getenv("CAT_API_URL", )
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://mongo:27017")
 DB_NAME = "catapi"
 
+# MongoDB connection pool (one Motor client per process, created on startup)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 0))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", 0)) or None
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", 0)) or None
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 30000))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", 20000))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", 0)) or None
+MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "")  # e.g. "zstd,snappy,zlib"
+MONGO_READ_PREFERENCE = os.getenv("MONGO_READ_PREFERENCE", "primary")
+MONGO_LIST_READ_PREFERENCE = os.getenv("MONGO_LIST_READ_PREFERENCE", "secondaryPreferred")  # GET /users
+MONGO_HEALTH_TIMEOUT = float(os.getenv("MONGO_HEALTH_TIMEOUT", 2))
+
 # Pagination settings
 DEFAULT_PAGINATION_LIMIT = int(os.getenv("DEFAULT_PAGINATION_LIMIT", 20))
-MAX_PAGINATION_LIMIT = int(os.getenv("MAX_PAGINATION_LIMIT", 100))
\ No newline at end of file
+MAX_PAGINATION_LIMIT = int(os.getenv("MAX_PAGINATION_LIMIT", 100))
+
+# Upstream HTTP client (shared connection pool)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30.0))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10.0))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 5.0))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() == "true"
+
+# Breed cache (in-process TTL/LRU with stale-while-revalidate)
+BREED_CACHE_ENABLED = os.getenv("BREED_CACHE_ENABLED", "true").lower() == "true"
+BREED_CACHE_TTL_LIST = float(os.getenv("BREED_CACHE_TTL_LIST", 3600))
+BREED_CACHE_TTL_DETAIL = float(os.getenv("BREED_CACHE_TTL_DETAIL", 3600))
+BREED_CACHE_TTL_SEARCH = float(os.getenv("BREED_CACHE_TTL_SEARCH", 600))
+BREED_CACHE_STALE_TTL = float(os.getenv("BREED_CACHE_STALE_TTL", 86400))
+BREED_CACHE_MAX_ENTRIES = int(os.getenv("BREED_CACHE_MAX_ENTRIES", 1024))
+BREED_CACHE_MAX_BYTES = int(os.getenv("BREED_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+# Breed snapshot mode (serve listing, lookups and search from a local catalogue)
+BREED_SNAPSHOT_ENABLED = os.getenv("BREED_SNAPSHOT_ENABLED", "false").lower() == "true"
+BREED_SNAPSHOT_REFRESH_INTERVAL = float(os.getenv("BREED_SNAPSHOT_REFRESH_INTERVAL", 3600))
+
+# Batch breed lookups
+BREED_BATCH_MAX_IDS = int(os.getenv("BREED_BATCH_MAX_IDS", 100))
+BREED_BATCH_CONCURRENCY = int(os.getenv("BREED_BATCH_CONCURRENCY", 10))
+
+# NDJSON exports
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 500))
+
+# MongoDB indexes
+# Defaults to on only when MONGO_URL is set, so breed-only deployments never connect at startup
+MONGO_ENSURE_INDEXES = os.getenv("MONGO_ENSURE_INDEXES", str("MONGO_URL" in os.environ)).lower() == "true"
+MONGO_INDEXES_STRICT = os.getenv("MONGO_INDEXES_STRICT", "false").lower() == "true"
+
+# Username allocation
+USERNAME_ALLOCATION_RETRIES = int(os.getenv("USERNAME_ALLOCATION_RETRIES", 5))
+
+# Bulk user creation
+USER_BULK_MAX_ROWS = int(os.getenv("USER_BULK_MAX_ROWS", 100000))
+USER_BULK_CHUNK_SIZE = int(os.getenv("USER_BULK_CHUNK_SIZE", 1000))
+USER_BULK_ALLOCATION_CONCURRENCY = int(os.getenv("USER_BULK_ALLOCATION_CONCURRENCY", 20))
+
+# Password hashing
+PASSWORD_HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "scrypt")  # scrypt | pbkdf2_sha256
+PASSWORD_SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", 2 ** 14))
+PASSWORD_SCRYPT_R = int(os.getenv("PASSWORD_SCRYPT_R", 8))
+PASSWORD_SCRYPT_P = int(os.getenv("PASSWORD_SCRYPT_P", 1))
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", 600000))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+
+# User cache (per-username profile and password verifier)
+USER_CACHE_ENABLED = os.getenv("USER_CACHE_ENABLED", "true").lower() == "true"
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", 300))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", 20000))
+USER_CACHE_MAX_BYTES = int(os.getenv("USER_CACHE_MAX_BYTES", 8 * 1024 * 1024))
+
+# Login failed-attempt limiter (sliding window)
+LOGIN_RATE_LIMIT_ENABLED = os.getenv("LOGIN_RATE_LIMIT_ENABLED", "true").lower() == "true"
+LOGIN_FAILURE_WINDOW = float(os.getenv("LOGIN_FAILURE_WINDOW", 300))
+LOGIN_MAX_FAILURES_PER_USERNAME = int(os.getenv("LOGIN_MAX_FAILURES_PER_USERNAME", 5))
+LOGIN_MAX_FAILURES_PER_IP = int(os.getenv("LOGIN_MAX_FAILURES_PER_IP", 50))
+# Where failure counters live, so all workers share one limit ("sqlite", "mongo", "kv"; empty = per process).
+# Defaults to the breed cache store and reuses its SQLite path, MongoDB collection and KV URL.
+LOGIN_RATE_LIMIT_STORE = os.getenv("LOGIN_RATE_LIMIT_STORE", os.getenv("BREED_CACHE_STORE", ""))
+
+# Shared breed cache tier ("memory", "sqlite", "mongo", "kv" or empty to disable)
+BREED_CACHE_STORE = os.getenv("BREED_CACHE_STORE", "")
+BREED_CACHE_SQLITE_PATH = os.getenv("BREED_CACHE_SQLITE_PATH", ".cache/breed_cache.sqlite3")
+BREED_CACHE_MONGO_COLLECTION = os.getenv("BREED_CACHE_MONGO_COLLECTION", "breed_cache")
+BREED_CACHE_KV_URL = os.getenv("BREED_CACHE_KV_URL", "kv://localhost:6379/0")  # Redis protocol (RESP)
+BREED_CACHE_SYNC_INTERVAL = float(os.getenv("BREED_CACHE_SYNC_INTERVAL", 5))  # 0 disables invalidation polling
+BREED_CACHE_STORE_TIMEOUT = float(os.getenv("BREED_CACHE_STORE_TIMEOUT", 0.5))  # per store call; a timeout is a miss
+
+# HTTP caching of serialized responses (ETag / Cache-Control)
+BREED_RESPONSE_CACHE_TTL = float(os.getenv("BREED_RESPONSE_CACHE_TTL", 60))
+BREED_RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("BREED_RESPONSE_CACHE_MAX_ENTRIES", 2048))
+BREED_RESPONSE_CACHE_MAX_BYTES = int(os.getenv("BREED_RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+BREED_HTTP_MAX_AGE = int(os.getenv("BREED_HTTP_MAX_AGE", 300))
+BREED_RESPONSE_PRECOMPRESS = os.getenv("BREED_RESPONSE_PRECOMPRESS", "true").lower() == "true"
+
+# Response compression (gzip always; br and zstd when brotli / zstandard are installed)
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))  # smaller bodies are sent as is
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 5))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", 3))
+
+# Upstream resilience (TheCatAPI): per-endpoint timeouts, retries, circuit breaker, hedging
+UPSTREAM_TIMEOUT_LIST = float(os.getenv("UPSTREAM_TIMEOUT_LIST", 10))
+UPSTREAM_TIMEOUT_DETAIL = float(os.getenv("UPSTREAM_TIMEOUT_DETAIL", 3))
+UPSTREAM_TIMEOUT_SEARCH = float(os.getenv("UPSTREAM_TIMEOUT_SEARCH", 5))
+UPSTREAM_RETRIES = int(os.getenv("UPSTREAM_RETRIES", 2))
+UPSTREAM_RETRY_BASE_DELAY = float(os.getenv("UPSTREAM_RETRY_BASE_DELAY", 0.1))
+UPSTREAM_RETRY_MAX_DELAY = float(os.getenv("UPSTREAM_RETRY_MAX_DELAY", 2))
+UPSTREAM_BREAKER_FAILURES = int(os.getenv("UPSTREAM_BREAKER_FAILURES", 5))
+UPSTREAM_BREAKER_RESET = float(os.getenv("UPSTREAM_BREAKER_RESET", 30))
+UPSTREAM_HEDGE_DELAY = float(os.getenv("UPSTREAM_HEDGE_DELAY", 0))  # 0 disables hedging
+
+# Metrics (Prometheus text format at /metrics)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# Production server (python -m app.serve)
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", 8000))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", 0))  # 0 = one per CPU available to the process (affinity, cgroup quota)
+SERVER_LOOP = os.getenv("SERVER_LOOP", "auto")  # auto | uvloop | asyncio
+SERVER_HTTP = os.getenv("SERVER_HTTP", "auto")  # auto | httptools | h11
+SERVER_BACKLOG = int(os.getenv("SERVER_BACKLOG", 2048))
+SERVER_KEEPALIVE = int(os.getenv("SERVER_KEEPALIVE", 5))
+SERVER_GRACEFUL_TIMEOUT = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", 30))
+SERVER_LIMIT_CONCURRENCY = int(os.getenv("SERVER_LIMIT_CONCURRENCY", 0)) or None
+SERVER_PROXY_HEADERS = os.getenv("SERVER_PROXY_HEADERS", "true").lower() == "true"
+# Proxies whose X-Forwarded-For is trusted; the per-IP login limit sees the proxy's address otherwise
+SERVER_FORWARDED_ALLOW_IPS = os.getenv("SERVER_FORWARDED_ALLOW_IPS", "127.0.0.1")
+BREED_WARM_ON_STARTUP = os.getenv("BREED_WARM_ON_STARTUP", "true").lower() == "true"
+
+# Breed images (local disk cache, background prefetch and thumbnails)
+BREED_IMAGE_CACHE_DIR = os.getenv("BREED_IMAGE_CACHE_DIR", ".cache/breed_images")
+BREED_IMAGE_PREFETCH_ENABLED = os.getenv("BREED_IMAGE_PREFETCH_ENABLED", "false").lower() == "true"
+BREED_IMAGE_PREFETCH_CONCURRENCY = int(os.getenv("BREED_IMAGE_PREFETCH_CONCURRENCY", 4))
+BREED_IMAGE_THUMBNAIL_SIZE = int(os.getenv("BREED_IMAGE_THUMBNAIL_SIZE", 256))
+BREED_IMAGE_DOWNLOAD_TIMEOUT = float(os.getenv("BREED_IMAGE_DOWNLOAD_TIMEOUT", 15))
+BREED_IMAGE_MAX_BYTES = int(os.getenv("BREED_IMAGE_MAX_BYTES", 10 * 1024 * 1024))
+BREED_IMAGE_HTTP_MAX_AGE = int(os.getenv("BREED_IMAGE_HTTP_MAX_AGE", 86400))
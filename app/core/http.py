@@ -0,0 +1,92 @@
+# Config
+from app.core.config import (
+    HTTP2_ENABLED,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_TIMEOUT,
+)
+
+# Metrics
+from app.core.metrics import registry
+
+# External
+from typing import List, Optional
+import httpx
+
+try:
+    import h2
+except ImportError:  # HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+    h2 = None
+
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Build an AsyncClient configured with the pool limits and timeouts from settings.
+
+    Returns:
+        - httpx.AsyncClient: A new client owning its own connection pool.
+
+    Raises:
+        - RuntimeError: If HTTP2_ENABLED is set but the h2 package is not installed.
+    """
+    if HTTP2_ENABLED and h2 is None:
+        raise RuntimeError('HTTP2_ENABLED=true needs the h2 package: pip install "httpx[http2]"')
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+    return httpx.AsyncClient(limits=limits, timeout=timeout, http2=HTTP2_ENABLED)
+
+
+async def start_http_client() -> httpx.AsyncClient:
+    """
+    Create the process-wide client. Called once from the application lifespan.
+
+    Returns:
+        - httpx.AsyncClient: The shared client.
+    """
+    return get_http_client()
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared client and release its pooled connections.
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared client, creating it lazily when the lifespan has not run
+    (e.g. when services are used directly from scripts or tests).
+
+    Returns:
+        - httpx.AsyncClient: The shared client.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+def _pool_samples() -> List[tuple]:
+    # httpcore does not expose pool usage publicly; report nothing if its internals change
+    pool = getattr(getattr(_client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return []
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return [({"state": "active"}, len(connections) - idle), ({"state": "idle"}, idle)]
+
+
+registry.gauge_callback("upstream_pool_connections", "Connections in the TheCatAPI client pool.", _pool_samples)
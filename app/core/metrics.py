@@ -0,0 +1,218 @@
+# External
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import time
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[Dict[str, str], float]
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """
+    Base class: a named metric family rendered in the Prometheus text format.
+    """
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self.samples()]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Histogram(Metric):
+    """
+    Fixed-bucket histogram. observe() is a bisect and two additions per call; buckets
+    are only made cumulative when rendered.
+    """
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (last is +Inf)], sum
+        self._series: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1][0] += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """
+        Observe the duration of the block in seconds.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def samples(self) -> List[str]:
+        lines = []
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                bucket = _format_labels(self.labelnames, labels, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{bucket} {cumulative}")
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class CallbackMetric(Metric):
+    """
+    Gauge or counter whose samples are read from the application when scraped, so
+    existing stats (cache sizes, breaker state, pool usage) cost nothing per request.
+    """
+    def __init__(self, name: str, documentation: str, kind: str, collect: Callable[[], Iterable[Sample]]):
+        super().__init__(name, documentation)
+        self.kind = kind
+        self.collect = collect
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(labels.keys(), labels.values())} {_format_value(value)}"
+            for labels, value in self.collect()
+        ]
+
+
+class MetricsRegistry:
+    """
+    Process-local metrics registry.
+    """
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_callback(self, name: str, documentation: str, collect: Callable[[], Iterable[Sample]]) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, "gauge", collect))
+
+    def counter_callback(self, name: str, documentation: str, collect: Callable[[], Iterable[Sample]]) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, "counter", collect))
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+        """
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "Latency of HTTP requests handled by the API.", ("method", "route", "status")
+)
+upstream_request_duration = registry.histogram(
+    "upstream_request_duration_seconds", "Latency of TheCatAPI requests, per attempt.", ("endpoint", "outcome")
+)
+mongo_operation_duration = registry.histogram(
+    "mongo_operation_duration_seconds", "Latency of MongoDB operations.", ("collection", "operation")
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording http_request_duration_seconds. Requests are labelled with
+    the route template (e.g. /breeds/{breed_id}) rather than the raw path to keep the
+    number of series bounded; unmatched paths share the "unmatched" label.
+    """
+    def __init__(self, app, excluded_paths: Iterable[str] = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - start,
+                scope["method"],
+                getattr(route, "path_format", None) or getattr(route, "path", None) or "unmatched",
+                str(status_code),
+            )
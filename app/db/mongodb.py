@@ -1,7 +1,286 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from app.core.config import MONGO_URL, DB_NAME
+from pymongo import ASCENDING, IndexModel, ReadPreference
+from pymongo.errors import PyMongoError
+from pymongo.monitoring import ConnectionPoolListener
+from app.core.config import (
+    DB_NAME,
+    MONGO_COMPRESSORS,
+    MONGO_CONNECT_TIMEOUT_MS,
+    MONGO_HEALTH_TIMEOUT,
+    MONGO_INDEXES_STRICT,
+    MONGO_LIST_READ_PREFERENCE,
+    MONGO_MAX_IDLE_TIME_MS,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_READ_PREFERENCE,
+    MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    MONGO_SOCKET_TIMEOUT_MS,
+    MONGO_URL,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS,
+)
+from app.core.metrics import mongo_operation_duration, registry
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import threading
+import time
 
 
-client = AsyncIOMotorClient(MONGO_URL)
-db = client[DB_NAME]
-users_collection = db["users"]
\ No newline at end of file
+logger = logging.getLogger(__name__)
+
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
+
+def read_preference(name: str):
+    """
+    Map a read preference mode name (as in connection strings) to its pymongo object.
+
+    Raises:
+        - ValueError: If the mode is unknown.
+    """
+    try:
+        return READ_PREFERENCES[name]
+    except KeyError:
+        raise ValueError(f"Unknown read preference '{name}'")
+
+
+class PoolMonitor(ConnectionPoolListener):
+    """
+    Track connection pool usage per server from pymongo's CMAP events. Events arrive
+    on driver threads, so counters are guarded by a lock.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers: Dict[str, Dict[str, int]] = {}
+
+    def _update(self, address, **changes: int) -> None:
+        key = f"{address[0]}:{address[1]}"
+        with self._lock:
+            server = self._servers.setdefault(key, {"open": 0, "in_use": 0, "waiting": 0, "checkout_failures": 0})
+            for field, change in changes.items():
+                server[field] = max(0, server[field] + change)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{"address": address, **counters} for address, counters in sorted(self._servers.items())]
+
+    def pool_created(self, event) -> None:
+        self._update(event.address)
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        with self._lock:
+            self._servers.pop(f"{event.address[0]}:{event.address[1]}", None)
+
+    def connection_created(self, event) -> None:
+        self._update(event.address, open=1)
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        self._update(event.address, open=-1)
+
+    def connection_check_out_started(self, event) -> None:
+        self._update(event.address, waiting=1)
+
+    def connection_check_out_failed(self, event) -> None:
+        self._update(event.address, waiting=-1, checkout_failures=1)
+
+    def connection_checked_out(self, event) -> None:
+        self._update(event.address, waiting=-1, in_use=1)
+
+    def connection_checked_in(self, event) -> None:
+        self._update(event.address, in_use=-1)
+
+
+pool_monitor = PoolMonitor()
+_client: Optional[AsyncIOMotorClient] = None
+
+
+def create_mongo_client() -> AsyncIOMotorClient:
+    """
+    Build a Motor client with the pool, timeout, compression and read preference settings.
+
+    Returns:
+        - AsyncIOMotorClient: A new client owning its own connection pool.
+    """
+    options = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": MONGO_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": MONGO_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": MONGO_SOCKET_TIMEOUT_MS,
+        "readPreference": MONGO_READ_PREFERENCE,
+    }
+    if MONGO_COMPRESSORS:
+        # zstd and snappy need the optional zstandard / python-snappy packages
+        options["compressors"] = MONGO_COMPRESSORS
+    options = {name: value for name, value in options.items() if value is not None}
+    return AsyncIOMotorClient(MONGO_URL, event_listeners=[pool_monitor], **options)
+
+
+def get_mongo_client() -> AsyncIOMotorClient:
+    """
+    Return the process-wide client, creating it on first use so deployments that
+    never touch MongoDB (e.g. breed-only) never open a pool.
+
+    Returns:
+        - AsyncIOMotorClient: The shared client.
+    """
+    global _client
+    if _client is None:
+        _client = create_mongo_client()
+    return _client
+
+
+def close_mongo_client() -> None:
+    """
+    Close the Motor client and its connection pool, if it was created. Called from the application lifespan.
+    """
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+class LazyCollection:
+    """
+    Collection handle that services import by name at module load; the client is only
+    created, and the underlying Motor collection resolved, when it is first used.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._bound = None
+
+    def _resolve(self):
+        client = get_mongo_client()
+        if self._bound is None or self._bound[0] is not client:
+            self._bound = (client, client[DB_NAME][self.name])
+        return self._bound[1]
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._resolve(), attribute)
+
+
+users_collection = LazyCollection("users")
+username_counters_collection = LazyCollection("username_counters")
+
+# Unique usernames, and a compound index that covers login lookups by username
+USER_INDEXES = [
+    IndexModel([("username", ASCENDING)], name="username_unique", unique=True),
+    IndexModel(
+        [("username", ASCENDING), ("password", ASCENDING), ("name", ASCENDING), ("lastname", ASCENDING)],
+        name="username_login_covering",
+    ),
+]
+
+# Last known index build state, reported by ensure_indexes
+index_state = {"status": "pending", "missing": [], "error": None}
+
+
+async def ensure_indexes(strict: bool = MONGO_INDEXES_STRICT) -> dict:
+    """
+    Create the indexes the services rely on and verify they exist.
+
+    Args:
+        - strict (bool): Raise instead of logging when an index is missing or cannot be built.
+
+    Returns:
+        - dict: Index build state ("ready" or "degraded", missing index names and error).
+
+    Raises:
+        - RuntimeError: In strict mode, if any required index is missing.
+    """
+    expected = [index.document["name"] for index in USER_INDEXES]
+    index_state.update(status="building", missing=[], error=None)
+
+    try:
+        await users_collection.create_indexes(USER_INDEXES)
+    except PyMongoError as error:
+        # e.g. duplicate usernames preventing the unique index, or Mongo unreachable
+        index_state["error"] = str(error)
+
+    try:
+        existing = await users_collection.index_information()
+        index_state["missing"] = [name for name in expected if name not in existing]
+    except PyMongoError as error:
+        index_state["missing"] = expected
+        index_state["error"] = index_state["error"] or str(error)
+
+    index_state["status"] = "degraded" if index_state["missing"] else "ready"
+    if index_state["missing"]:
+        message = f"Missing users indexes {index_state['missing']}: {index_state['error']}"
+        if strict:
+            raise RuntimeError(message)
+        logger.warning(message)
+    else:
+        logger.info("Users indexes ready: %s", ", ".join(expected))
+    return dict(index_state)
+
+
+async def database_health(timeout: float = MONGO_HEALTH_TIMEOUT) -> dict:
+    """
+    Ping the database and report latency, connection pool usage and index state.
+
+    Args:
+        - timeout (float): Seconds to wait for the ping, so an unreachable server does not
+          hold the request for the whole server selection timeout.
+
+    Returns:
+        - dict: "status" is "ok" or "unavailable"; "ping_ms" is None when the ping failed.
+    """
+    servers = pool_monitor.snapshot()
+    in_use = sum(server["in_use"] for server in servers)
+    capacity = MONGO_MAX_POOL_SIZE * len(servers)
+    report = {
+        "status": "ok",
+        "ping_ms": None,
+        "error": None,
+        "pool": {
+            "max_size": MONGO_MAX_POOL_SIZE,
+            "min_size": MONGO_MIN_POOL_SIZE,
+            "in_use": in_use,
+            "waiting": sum(server["waiting"] for server in servers),
+            "utilization": round(in_use / capacity, 4) if capacity else 0.0,
+            "servers": servers,
+        },
+        "read_preference": {"default": MONGO_READ_PREFERENCE, "list_users": MONGO_LIST_READ_PREFERENCE},
+        "indexes": dict(index_state),
+    }
+
+    start = time.perf_counter()
+    try:
+        with mongo_operation_duration.time("admin", "ping"):
+            await asyncio.wait_for(get_mongo_client()[DB_NAME].command("ping"), timeout)
+        report["ping_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    except asyncio.TimeoutError:
+        report.update(status="unavailable", error=f"Ping timed out after {timeout}s")
+    except PyMongoError as error:
+        report.update(status="unavailable", error=str(error))
+    return report
+
+
+def _pool_samples() -> List[tuple]:
+    samples = []
+    for server in pool_monitor.snapshot():
+        samples.append(({"server": server["address"], "state": "in_use"}, server["in_use"]))
+        samples.append(({"server": server["address"], "state": "idle"}, max(0, server["open"] - server["in_use"])))
+        samples.append(({"server": server["address"], "state": "waiting"}, server["waiting"]))
+    return samples
+
+
+registry.gauge_callback("mongo_pool_connections", "Connections in the MongoDB pool per server.", _pool_samples)
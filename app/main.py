@@ -1,13 +1,119 @@
 # FastAPI
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
 # Routers
-from app.routers import breeds, users
+from app.routers import breeds, health, users
 
+# Config
+from app.core.config import (
+    BREED_CACHE_STORE,
+    BREED_CACHE_SYNC_INTERVAL,
+    BREED_IMAGE_PREFETCH_ENABLED,
+    BREED_SNAPSHOT_ENABLED,
+    BREED_WARM_ON_STARTUP,
+    METRICS_ENABLED,
+    MONGO_ENSURE_INDEXES,
+    MONGO_INDEXES_STRICT,
+)
+from app.core.http import close_http_client, start_http_client
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, registry
 
-app = FastAPI()
+# MongoDB
+from app.db.mongodb import close_mongo_client, ensure_indexes
+
+# Services
+from app.services.breed import BreedService
+from app.services.breed_image import BreedImageService
+from app.services.user import UserService
+
+# Utils
+from app.utils.security import shutdown_hash_executor
+
+# External
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the shared upstream HTTP client on startup and close it on shutdown,
+    so pooled connections to TheCatAPI are reused across requests. In snapshot
+    mode the breed catalogue is loaded up front and refreshed in the background.
+    The breed cache is warmed from the shared store when one is configured, which is
+    then polled for invalidations made by other workers, and the breed catalogue is
+    prefetched so each worker serves its first requests warm.
+    Breed reference images can be prefetched into the disk cache in the background.
+    Users indexes are ensured on startup when MONGO_ENSURE_INDEXES is on (the default when
+    MONGO_URL is set), which opens the MongoDB client; strict mode refuses to start without them.
+    Otherwise the client is created on first use, so breed-only deployments never open it.
+    On shutdown pending work is drained and the HTTP and MongoDB clients are closed.
+    """
+    await start_http_client()
+
+    index_builder = None
+    if MONGO_ENSURE_INDEXES:
+        if MONGO_INDEXES_STRICT:
+            await ensure_indexes(strict=True)
+        else:
+            # Don't hold up startup (or breed-only deployments) on MongoDB
+            index_builder = asyncio.create_task(ensure_indexes(strict=False))
+
+    try:
+        warmed = await BreedService.warm_cache()
+        if warmed:
+            logger.info("Warmed breed cache with %d persisted entries", warmed)
+    except Exception:
+        logger.warning("Could not warm the breed cache from the shared store", exc_info=True)
+
+    refresher = None
+    if BREED_SNAPSHOT_ENABLED or BREED_WARM_ON_STARTUP:
+        try:
+            # Served from the warmed cache when possible; the refresher fetches upstream later
+            await BreedService.get_catalogue()
+        except Exception:
+            logger.warning("Initial breed catalogue load failed; it will be loaded on first use", exc_info=True)
+    if BREED_SNAPSHOT_ENABLED:
+        refresher = asyncio.create_task(BreedService.run_snapshot_refresher())
+
+    cache_sync = None
+    if BREED_CACHE_STORE and BREED_CACHE_SYNC_INTERVAL > 0:
+        cache_sync = asyncio.create_task(BreedService.run_cache_sync())
+
+    image_prefetcher = None
+    if BREED_IMAGE_PREFETCH_ENABLED:
+        image_prefetcher = asyncio.create_task(BreedImageService.run_prefetcher())
+
+    yield
+
+    for task in (refresher, index_builder, cache_sync, image_prefetcher):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    await BreedService.close_store()
+    await UserService.close_store()
+    await close_http_client()
+    close_mongo_client()
+    # Waits for hashes already running, so keep the loop free while it does
+    await asyncio.to_thread(shutdown_hash_executor)
+
+
+app = FastAPI(lifespan=lifespan)
+
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(content=registry.render(), media_type=CONTENT_TYPE)
 
 
 # Register routers
 app.include_router(breeds.router, prefix="/breeds", tags=["Breeds"])
 app.include_router(users.router, prefix="/users", tags=["Users"])
+app.include_router(health.router, prefix="/health", tags=["Health"])
@@ -1,5 +1,12 @@
+# FastAPI
+from fastapi import Query
+
+# Models
+from app.models.common import PaginatedResponse
+
+# External
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class WeightModel(BaseModel):
@@ -51,3 +58,60 @@ class BreedModel(BaseModel):
     country_codes: Optional[str] = None
     country_code: Optional[str] = None
     social_needs: Optional[int] = None
+
+
+# Parametrized once at import rather than on every response
+BreedPage = PaginatedResponse[BreedModel]
+
+
+class BreedBatchError(BaseModel):
+    """
+    A breed ID that could not be resolved in a batch lookup.
+    """
+    id: str
+    status_code: int
+    detail: str
+
+
+class BreedBatchResponse(BaseModel):
+    """
+    Result of a batch lookup: found breeds in request order plus per-ID errors.
+    """
+    results: List[BreedModel]
+    errors: List[BreedBatchError]
+
+
+class BreedQueryParams:
+    """
+    Filter and sort parameters for the breed listing.
+        - filter: Repeatable trait condition, e.g. "energy_level>=4" or "indoor=1".
+        - sort: Comma-separated trait names, "-" prefix for descending, e.g. "-energy_level,name".
+        - origin: Exact origin country (case-insensitive).
+        - country_code: Country code (case-insensitive).
+    """
+    def __init__(
+        self,
+        filters: List[str] = Query([], alias="filter", description="Trait condition such as energy_level>=4"),
+        sort: Optional[str] = Query(None, description="Sort keys such as -energy_level,name"),
+        origin: Optional[str] = Query(None),
+        country_code: Optional[str] = Query(None),
+    ):
+        self.filters = filters
+        self.sort = sort
+        self.origin = origin
+        self.country_code = country_code
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.filters or self.sort or self.origin or self.country_code)
+
+    def as_query(self) -> List[Tuple[str, str]]:
+        """
+        Return the parameters as query pairs, to be preserved in pagination links.
+        """
+        pairs = [("filter", expression) for expression in self.filters]
+        for name in ("sort", "origin", "country_code"):
+            value = getattr(self, name)
+            if value is not None:
+                pairs.append((name, value))
+        return pairs
@@ -5,7 +5,7 @@ from fastapi import Query
 from app.core.config import DEFAULT_PAGINATION_LIMIT, MAX_PAGINATION_LIMIT
 
 # External
-from typing import Generic, Optional, TypeVar, List
+from typing import FrozenSet, Generic, Iterable, List, Optional, Tuple, Type, TypeVar
 from pydantic import BaseModel
 
 
@@ -26,6 +26,54 @@ class PaginationParams:
         self.limit = limit
         self.page = page
 
+class FieldSelection:
+    """
+    Response shaping parameters for list endpoints.
+        - fields: Comma-separated item fields to return, e.g. "id,name,origin" (all when omitted).
+        - exclude_none: Leave null fields out of the items.
+    """
+    def __init__(
+        self,
+        fields: Optional[str] = Query(None, description="Comma-separated item fields to return, e.g. id,name,origin"),
+        exclude_none: bool = Query(False, description="Leave null fields out of the items"),
+    ):
+        names = [name.strip() for name in (fields or "").split(",") if name.strip()]
+        self.fields: Optional[FrozenSet[str]] = frozenset(names) if names else None
+        self.exclude_none = exclude_none
+
+    @property
+    def is_empty(self) -> bool:
+        return self.fields is None and not self.exclude_none
+
+    def as_query(self) -> List[Tuple[str, str]]:
+        """
+        Return the parameters as query pairs, to be preserved in pagination links.
+        """
+        pairs = []
+        if self.fields is not None:
+            pairs.append(("fields", ",".join(sorted(self.fields))))
+        if self.exclude_none:
+            pairs.append(("exclude_none", "true"))
+        return pairs
+
+    def check(self, model: Type[BaseModel]) -> None:
+        """
+        Check the selected fields against the item model.
+
+        Raises:
+            - ValueError: If a selected field does not exist on the item model.
+        """
+        unknown = sorted((self.fields or frozenset()) - set(model.model_fields))
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+    def encode(self, item: BaseModel) -> bytes:
+        """
+        Encode one item to JSON with only the selected fields.
+        """
+        return item.model_dump_json(include=self.fields, exclude_none=self.exclude_none).encode()
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """
     Generic paginated response schema.
@@ -34,9 +82,27 @@ class PaginatedResponse(BaseModel, Generic[T]):
         - page: Current page number.
         - next: URL for the next page (if any).
         - previous: URL for the previous page (if any).
+        - total: Total number of items, when it was requested or is known for free.
     """
     results: List[T]
     limit: int
     page: int
     next: Optional[str]
     previous: Optional[str]
+    total: Optional[int] = None
+
+
+def encode_page(page: PaginatedResponse, results: Iterable[bytes]) -> bytes:
+    """
+    Encode a page to JSON around already encoded results, in the same layout as
+    serializing it through its response model.
+
+    Args:
+        - page (PaginatedResponse): Page whose envelope (limit, page, links, total) is encoded.
+        - results (Iterable[bytes]): JSON encoding of each result.
+
+    Returns:
+        - bytes: JSON body.
+    """
+    envelope = page.model_dump_json(exclude={"results"}).encode()
+    return b'{"results":[' + b",".join(results) + b"]," + envelope[1:]
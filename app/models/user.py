@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import List, Optional
 
 
 class UserBaseModel(BaseModel):
@@ -17,3 +18,15 @@ class UserLoginModel(BaseModel):
 
 class UserResponseModel(UserBaseModel):
     username: str
+
+
+class UserBulkResult(BaseModel):
+    index: int
+    username: Optional[str] = None
+    error: Optional[str] = None
+
+
+class UserBulkResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[UserBulkResult]
@@ -1,37 +1,111 @@
 # FastAPI
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
+
+# Config
+from app.core.config import (
+    BREED_HTTP_MAX_AGE,
+    BREED_IMAGE_HTTP_MAX_AGE,
+    BREED_RESPONSE_CACHE_TTL,
+    BREED_RESPONSE_PRECOMPRESS,
+)
 
 # Models
-from app.models.breed import BreedModel
-from app.models.common import PaginationParams, PaginatedResponse
+from app.models.breed import BreedBatchResponse, BreedModel, BreedPage, BreedQueryParams
+from app.models.common import FieldSelection, PaginationParams
 
 # Services
-from app.services.breed import BreedService
+from app.services.breed import BreedService, breed_representations
+from app.services.breed_image import BreedImageService
+
+# Utils
+from app.utils.file_response import file_response
+from app.utils.http_cache import cached_response
 
 
 router = APIRouter()
 
+BREED_CACHE_CONTROL = f"public, max-age={BREED_HTTP_MAX_AGE}"
+BREED_IMAGE_CACHE_CONTROL = f"public, max-age={BREED_IMAGE_HTTP_MAX_AGE}"
+
+
+async def _cached(request: Request, encode, produce):
+    return await cached_response(
+        request,
+        breed_representations,
+        BREED_RESPONSE_CACHE_TTL,
+        encode,
+        produce,
+        BREED_CACHE_CONTROL,
+        precompress_variants=BREED_RESPONSE_PRECOMPRESS,
+    )
+
 
 @router.get(
     "/",
-    response_model=PaginatedResponse[BreedModel],
+    response_model=BreedPage,
     status_code=status.HTTP_200_OK,
     summary="List all breeds",
-    description="Retrieve a list of all available cat breeds using TheCatAPI. Supports pagination."
+    description="Retrieve a list of all available cat breeds using TheCatAPI. Supports pagination, "
+                "trait filters (e.g. filter=energy_level>=4&filter=indoor=1), multi-key sorting "
+                "(e.g. sort=-affection_level,name) and origin/country_code filters. Supports sparse fields "
+                "(fields=id,name,origin), exclude_none, compression and Accept: application/msgpack."
 )
-async def get_all_breeds(pagination: PaginationParams = Depends(), request: Request = None):
-    return await BreedService.get_all_breeds(pagination, request)
+async def get_all_breeds(
+    pagination: PaginationParams = Depends(),
+    breed_query: BreedQueryParams = Depends(),
+    selection: FieldSelection = Depends(),
+    request: Request = None,
+):
+    return await _cached(
+        request,
+        lambda page: BreedService.encode_page(page, selection),
+        lambda: BreedService.get_all_breeds(pagination, request, breed_query, selection),
+    )
 
 
 @router.get(
     "/search",
-    response_model=PaginatedResponse[BreedModel],
+    response_model=BreedPage,
     status_code=status.HTTP_200_OK,
     summary="Search cat breeds by name",
-    description="Search cat breeds by name using a query string. Supports pagination."
+    description="Search cat breeds by name using a query string. Supports pagination, sparse fields "
+                "and exclude_none."
+)
+async def search_breeds(
+    query: str,
+    pagination: PaginationParams = Depends(),
+    selection: FieldSelection = Depends(),
+    request: Request = None,
+):
+    return await _cached(
+        request,
+        lambda page: BreedService.encode_page(page, selection),
+        lambda: BreedService.search_breeds(query=query, pagination=pagination, request=request, selection=selection),
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Export all breeds",
+    description="Stream the full breed catalogue as newline-delimited JSON (application/x-ndjson)."
 )
-async def search_breeds(query: str, pagination: PaginationParams = Depends(), request: Request = None):
-    return await BreedService.search_breeds(query=query, pagination=pagination, request=request)
+async def export_breeds():
+    return StreamingResponse(await BreedService.export_breeds(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/batch",
+    response_model=BreedBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get several breeds by ID",
+    description="Retrieve several cat breeds in a single call from a comma-separated list of IDs. "
+                "Returns the found breeds and a per-ID error for the ones that could not be resolved."
+)
+async def get_breeds_by_ids(ids: str = Query(..., description="Comma-separated breed IDs, e.g. abys,beng,siam")):
+    return await BreedService.get_breeds_by_ids(ids.split(","))
 
 
 @router.get(
@@ -41,5 +115,23 @@ async def search_breeds(query: str, pagination: PaginationParams = Depends(), re
     summary="Get breed by ID",
     description="Retrieve detailed information of a specific cat breed by its unique ID."
 )
-async def get_breed_by_id(breed_id: str):
-    return await BreedService.get_breed_by_id(breed_id)
+async def get_breed_by_id(breed_id: str, request: Request):
+    return await _cached(request, BreedService.encode_breed, lambda: BreedService.get_breed_by_id(breed_id))
+
+
+@router.get(
+    "/{breed_id}/image",
+    response_class=FileResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get breed image",
+    description="Serve the breed's reference image (or a downsized JPEG thumbnail with size=thumbnail) "
+                "from the local disk cache, fetching it from TheCatAPI on first use. Supports byte ranges "
+                "and If-None-Match."
+)
+async def get_breed_image(
+    breed_id: str,
+    request: Request,
+    size: str = Query("full", pattern="^(full|thumbnail)$", description="full or thumbnail"),
+):
+    path, media_type = await BreedImageService.get_image(breed_id, thumbnail=size == "thumbnail")
+    return file_response(request, path, media_type, BREED_IMAGE_CACHE_CONTROL)
@@ -0,0 +1,23 @@
+# FastAPI
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+# MongoDB
+from app.db.mongodb import database_health
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/db",
+    status_code=status.HTTP_200_OK,
+    summary="MongoDB health",
+    description="Ping MongoDB and report the ping latency, connection pool usage per server "
+                "(open, in use, waiting checkouts), read preferences and users index state. "
+                "Returns 503 when the ping fails."
+)
+async def get_database_health():
+    report = await database_health()
+    status_code = status.HTTP_200_OK if report["status"] == "ok" else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(content=report, status_code=status_code, headers={"Cache-Control": "no-store"})
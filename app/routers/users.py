@@ -1,31 +1,140 @@
 # FastAPI
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 # Models
-from app.models.common import PaginationParams, PaginatedResponse
-from app.models.user import UserResponseModel, UserCreateModel, UserLoginModel
+from app.models.common import FieldSelection, PaginationParams, PaginatedResponse, encode_page
+from app.models.user import UserBulkResponse, UserResponseModel, UserCreateModel, UserLoginModel
+
+# Config
+from app.core.config import USER_BULK_MAX_ROWS
 
 # Services
 from app.services.user import UserService
 
+# Utils
+from app.utils.http_cache import fingerprint_etag, make_representation, not_modified, representation_key, respond
+
+# External
+from pydantic import TypeAdapter
+from typing import Any, List, Optional
+import json
+
 
 router = APIRouter()
 
+USER_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[UserResponseModel])
+# User pages change with every signup: clients may keep them but must revalidate
+USER_CACHE_CONTROL = "private, no-cache"
+
+
+async def _read_bulk_rows(request: Request) -> List[Any]:
+    """
+    Read bulk rows from either a JSON array or an NDJSON stream (one object per line).
+    Malformed NDJSON lines are kept as None so they are reported against their row.
+
+    Raises:
+        - HTTPException: 400 for a malformed body, 413 above USER_BULK_MAX_ROWS rows.
+    """
+    rows: List[Any] = []
+    content_type = request.headers.get("content-type", "")
+
+    def add(row: Any):
+        if len(rows) >= USER_BULK_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {USER_BULK_MAX_ROWS} users can be imported at once",
+            )
+        rows.append(row)
+
+    def add_line(line: bytes):
+        if line.strip():
+            try:
+                add(json.loads(line))
+            except ValueError:
+                add(None)
+
+    if "ndjson" in content_type or "jsonlines" in content_type:
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                add_line(line)
+        add_line(buffer)
+        return rows
+
+    try:
+        payload = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be a JSON array or NDJSON")
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be a JSON array of users")
+    for row in payload:
+        add(row)
+    return rows
+
 
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
     response_model=PaginatedResponse[UserResponseModel],
     summary="List all users",
-    description="Retrieve a paginated list of all registered users.",
+    description="Retrieve a paginated list of all registered users. Follow the opaque `cursor` in "
+                "next/previous links for constant-cost deep pagination; `page` is kept for compatibility. "
+                "Supports sparse fields (fields=username,name), exclude_none, compression and "
+                "Accept: application/msgpack.",
 )
-async def list_users(pagination: PaginationParams = Depends()):
+async def list_users(
+    request: Request,
+    pagination: PaginationParams = Depends(),
+    selection: FieldSelection = Depends(),
+    cursor: Optional[str] = Query(None, description="Opaque cursor taken from a previous next/previous link"),
+    include_total: bool = Query(False, description="Also return the total number of users"),
+):
+    try:
+        selection.check(UserResponseModel)
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
     skip = pagination.page * pagination.limit
-    return await UserService.list_users(
+    page = await UserService.list_users(
         limit=pagination.limit,
         skip=skip,
         page=pagination.page,
+        base_url=str(request.url).split("?")[0],
+        cursor=cursor,
+        include_total=include_total,
+        extra_query=selection.as_query(),
+        keep_ids=True,
+    )
+    # Users are never modified once listed (only their password hash, which is not listed),
+    # so the URL, the page's _ids, links and total determine the body: answer revalidations
+    # before validating and encoding the page
+    etag = fingerprint_etag(
+        representation_key(request), [str(user["_id"]) for user in page.results], page.next, page.previous, page.total
     )
+    unchanged = not_modified(request, etag, USER_CACHE_CONTROL)
+    if unchanged is not None:
+        return unchanged
+
+    # Results are plain documents: validate the page once, then encode it
+    validated = USER_PAGE_ADAPTER.validate_python(dict(page))
+    if selection.is_empty:
+        body = USER_PAGE_ADAPTER.dump_json(validated)
+    else:
+        body = encode_page(validated, (selection.encode(user) for user in validated.results))
+    return respond(request, make_representation(body, etag), USER_CACHE_CONTROL)
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Export all users",
+    description="Stream every registered user as newline-delimited JSON (application/x-ndjson).",
+)
+async def export_users():
+    return StreamingResponse(UserService.export_users(), media_type="application/x-ndjson")
 
 @router.post(
     "/",
@@ -38,13 +147,26 @@ async def list_users(pagination: PaginationParams = Depends()):
 async def create_user(user: UserCreateModel):
     return await UserService.create_user(user)
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=UserBulkResponse,
+    summary="Create users in bulk",
+    description="Create many users from a JSON array or an NDJSON stream (Content-Type: application/x-ndjson) "
+                "of {name, lastname, password} objects. Returns the generated username or an error per row.",
+)
+async def create_users_bulk(request: Request):
+    return await UserService.create_users_bulk(await _read_bulk_rows(request))
+
 @router.post(
     "/login",
     status_code=status.HTTP_200_OK,
     response_model=UserResponseModel,
     summary="User login",
     description="Authenticate a user by verifying the provided username and password. "
-                "Returns user data if credentials are valid."
+                "Returns user data if credentials are valid. Repeated failures for a username or "
+                "client IP are answered with 429 and a Retry-After header."
 )
-async def login(login_data: UserLoginModel):
-    return await UserService.login(login_data.username, login_data.password)
+async def login(login_data: UserLoginModel, request: Request):
+    client_ip = request.client.host if request.client else None
+    return await UserService.login(login_data.username, login_data.password, client_ip=client_ip)
@@ -0,0 +1,116 @@
+"""
+Production entry point: python -m app.serve
+
+Runs the API under uvicorn with SERVER_WORKERS processes (default: one per usable CPU),
+uvloop and httptools when they are installed, and a graceful shutdown window in
+which each worker drains in-flight requests before its lifespan closes the
+shared HTTP and MongoDB clients. Every worker warms its own caches on startup.
+"""
+# Config
+from app.core.config import (
+    SERVER_BACKLOG,
+    SERVER_FORWARDED_ALLOW_IPS,
+    SERVER_GRACEFUL_TIMEOUT,
+    SERVER_HOST,
+    SERVER_HTTP,
+    SERVER_KEEPALIVE,
+    SERVER_LIMIT_CONCURRENCY,
+    SERVER_LOOP,
+    SERVER_PORT,
+    SERVER_PROXY_HEADERS,
+    SERVER_WORKERS,
+)
+
+# External
+from typing import List, Optional
+import argparse
+import importlib.util
+import logging
+import math
+import os
+import uvicorn
+
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_loop(loop: str) -> str:
+    """
+    Return the uvicorn loop implementation: uvloop when requested or available, else asyncio.
+    """
+    if loop == "auto":
+        return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    return loop
+
+
+def resolve_http(http: str) -> str:
+    """
+    Return the uvicorn HTTP parser: httptools when requested or available, else h11.
+    """
+    if http == "auto":
+        return "httptools" if importlib.util.find_spec("httptools") else "h11"
+    return http
+
+
+def available_cpus(cpu_max_path: str = "/sys/fs/cgroup/cpu.max") -> int:
+    """
+    Count the CPUs this process may actually use: the scheduler affinity mask, capped by a
+    cgroup v2 CPU quota (e.g. a container limit), which os.cpu_count() ignores.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # sched_getaffinity is Linux-only
+        cpus = os.cpu_count() or 1
+    try:
+        with open(cpu_max_path) as file:
+            quota, period = file.read().split()[:2]
+        if quota != "max":
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(1, cpus)
+
+
+def resolve_workers(workers: int) -> int:
+    """
+    Return the worker count: workers when set, else one per available CPU.
+    """
+    return workers if workers > 0 else available_cpus()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the Cat API with production settings.")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=SERVER_WORKERS, help="Worker processes (default: available CPUs)")
+    parser.add_argument("--loop", default=SERVER_LOOP, choices=("auto", "uvloop", "asyncio"))
+    parser.add_argument("--http", default=SERVER_HTTP, choices=("auto", "httptools", "h11"))
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    loop, http = resolve_loop(args.loop), resolve_http(args.http)
+    workers = resolve_workers(args.workers)
+    logging.basicConfig(level=logging.INFO)
+    logger.info("Starting %d worker(s) on %s:%d (loop=%s, http=%s)", workers, args.host, args.port, loop, http)
+
+    uvicorn.run(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        backlog=SERVER_BACKLOG,
+        timeout_keep_alive=SERVER_KEEPALIVE,
+        timeout_graceful_shutdown=SERVER_GRACEFUL_TIMEOUT,
+        limit_concurrency=SERVER_LIMIT_CONCURRENCY,
+        proxy_headers=SERVER_PROXY_HEADERS,
+        forwarded_allow_ips=SERVER_FORWARDED_ALLOW_IPS,
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
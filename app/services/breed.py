@@ -2,54 +2,549 @@
 from fastapi import HTTPException, Request, status
 
 # Models
-from app.models.breed import BreedModel
-from app.models.common import PaginationParams, PaginatedResponse
+from app.models.breed import BreedBatchError, BreedBatchResponse, BreedModel, BreedPage, BreedQueryParams
+from app.models.common import FieldSelection, PaginationParams, encode_page
 
 # Config
-from app.core.config import CAT_API_KEY, CAT_API_URL
+from app.core.config import (
+    BREED_BATCH_CONCURRENCY,
+    BREED_BATCH_MAX_IDS,
+    BREED_CACHE_ENABLED,
+    BREED_CACHE_KV_URL,
+    BREED_CACHE_MAX_BYTES,
+    BREED_CACHE_MAX_ENTRIES,
+    BREED_CACHE_MONGO_COLLECTION,
+    BREED_CACHE_SQLITE_PATH,
+    BREED_CACHE_STALE_TTL,
+    BREED_CACHE_STORE,
+    BREED_CACHE_STORE_TIMEOUT,
+    BREED_CACHE_SYNC_INTERVAL,
+    BREED_CACHE_TTL_DETAIL,
+    BREED_CACHE_TTL_LIST,
+    BREED_CACHE_TTL_SEARCH,
+    BREED_RESPONSE_CACHE_MAX_BYTES,
+    BREED_RESPONSE_CACHE_MAX_ENTRIES,
+    BREED_SNAPSHOT_ENABLED,
+    BREED_SNAPSHOT_REFRESH_INTERVAL,
+    CAT_API_KEY,
+    CAT_API_URL,
+    EXPORT_BATCH_SIZE,
+    UPSTREAM_BREAKER_FAILURES,
+    UPSTREAM_BREAKER_RESET,
+    UPSTREAM_HEDGE_DELAY,
+    UPSTREAM_RETRIES,
+    UPSTREAM_RETRY_BASE_DELAY,
+    UPSTREAM_RETRY_MAX_DELAY,
+    UPSTREAM_TIMEOUT_DETAIL,
+    UPSTREAM_TIMEOUT_LIST,
+    UPSTREAM_TIMEOUT_SEARCH,
+)
+from app.core.http import get_http_client
+from app.core.metrics import registry, upstream_request_duration
+
+# Services
+from app.services.breed_catalogue import BreedCatalogue, parse_filter, parse_sort
+
+# Utils
+from app.utils.cache import TTLCache
+from app.utils.cache_store import StoreNamespace, create_cache_store
+from app.utils.resilience import RETRYABLE_STATUS_CODES, CircuitBreaker, CircuitOpenError, ResilientCaller
+from app.utils.singleflight import SingleFlight
 
 # External
+from typing import Any, AsyncIterator, Awaitable, List, Optional, Set, Tuple, Union
+from urllib.parse import urlencode
+import asyncio
 import httpx
+import logging
+import math
+import re
+import time
+
 
+logger = logging.getLogger(__name__)
 
 headers = {"x-api-key": CAT_API_KEY}
 
+breed_cache = TTLCache(max_entries=BREED_CACHE_MAX_ENTRIES, max_bytes=BREED_CACHE_MAX_BYTES)
+breed_flights = SingleFlight()
+breed_upstream = ResilientCaller(
+    CircuitBreaker(failure_threshold=UPSTREAM_BREAKER_FAILURES, reset_timeout=UPSTREAM_BREAKER_RESET),
+    retries=UPSTREAM_RETRIES,
+    base_delay=UPSTREAM_RETRY_BASE_DELAY,
+    max_delay=UPSTREAM_RETRY_MAX_DELAY,
+    hedge_delay=UPSTREAM_HEDGE_DELAY,
+)
+# Upstream ETags per cache key, replayed as If-None-Match when an entry is refreshed
+upstream_etags = TTLCache(max_entries=BREED_CACHE_MAX_ENTRIES, max_bytes=BREED_CACHE_MAX_ENTRIES * 256)
+# Serialized /breeds responses and their ETags
+breed_representations = TTLCache(max_entries=BREED_RESPONSE_CACHE_MAX_ENTRIES, max_bytes=BREED_RESPONSE_CACHE_MAX_BYTES)
+breed_store = create_cache_store(
+    BREED_CACHE_STORE,
+    BREED_CACHE_SQLITE_PATH,
+    BREED_CACHE_MONGO_COLLECTION,
+    BREED_CACHE_KV_URL,
+    timeout=BREED_CACHE_STORE_TIMEOUT,
+)
+# Shared tier: versioned "breeds" keys in the store, read through on local misses
+breed_namespace = None if breed_store is None else StoreNamespace(breed_store, "breeds")
+_store_writes: Set[asyncio.Task] = set()
+
+_catalogue: Optional[BreedCatalogue] = None
+# Stand-in used to validate and encode breeds before any catalogue is loaded
+_empty_catalogue = BreedCatalogue([])
+
+# TheCatAPI breed IDs; anything else (e.g. "../votes") must never reach the upstream path
+_BREED_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+BREAKER_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def _cache_samples(field: str):
+    caches = {"breeds": breed_cache, "representations": breed_representations, "upstream_etags": upstream_etags}
+    return [({"cache": name}, cache.stats()[field]) for name, cache in caches.items()]
+
+
+registry.gauge_callback("breed_cache_entries", "Entries held by the breed caches.", lambda: _cache_samples("entries"))
+registry.gauge_callback("breed_cache_bytes", "Approximate bytes held by the breed caches.", lambda: _cache_samples("bytes"))
+for _field in ("hits", "stale_hits", "misses", "evictions"):
+    registry.counter_callback(
+        f"breed_cache_{_field}_total", f"Breed cache {_field.replace('_', ' ')}.", lambda field=_field: _cache_samples(field)
+    )
+registry.gauge_callback(
+    "upstream_circuit_state",
+    "TheCatAPI circuit breaker state (0 closed, 1 half open, 2 open).",
+    lambda: [({}, BREAKER_STATES[breed_upstream.breaker.state])],
+)
+registry.counter_callback(
+    "upstream_events_total",
+    "TheCatAPI resilience events (retries, hedges, breaker openings and rejections).",
+    lambda: [
+        ({"event": event}, value)
+        for event, value in breed_upstream.stats().items()
+        if event in ("calls", "retries", "hedges", "hedge_wins", "breaker_opened", "breaker_rejected")
+    ],
+)
+registry.counter_callback(
+    "upstream_coalesced_total",
+    "Breed requests that joined an in-flight upstream call instead of starting one.",
+    lambda: [({}, breed_flights.shared)],
+)
+
 
 class BreedService:
     @staticmethod
-    async def get_all_breeds(pagination: PaginationParams, request: Request) -> PaginatedResponse[BreedModel]:
+    async def _get_json(
+        path: str,
+        ttl: float,
+        params: Optional[dict] = None,
+        refresh: bool = False,
+        timeout: float = UPSTREAM_TIMEOUT_DETAIL,
+    ) -> Any:
         """
-        Retrieve a paginated list of all cat breeds.
+        Fetch a TheCatAPI resource through the breed cache. A local miss first reads the
+        shared store, so workers reuse each other's responses; concurrent misses for the
+        same URL and params share a single upstream request, and every upstream response
+        is written through to the shared store when one is configured. Refreshes of a
+        cached entry are conditional (If-None-Match) when TheCatAPI sent an ETag.
+
+        Upstream calls go through breed_upstream: each attempt is bounded by timeout,
+        transient failures are retried with jittered backoff, and while the circuit is
+        open cached (even stale) entries are still served but misses fail fast.
 
         Args:
-            - pagination (PaginationParams): Pagination parameters (limit and page).
-            - request (Request): FastAPI request object to build pagination URLs.
+            - path (str): Resource path relative to CAT_API_URL (e.g. "/breeds").
+            - ttl (float): Seconds the response stays fresh in the cache.
+            - params (Optional[dict]): Query parameters sent upstream.
+            - refresh (bool): Skip the cache lookup and store the fresh response.
+            - timeout (float): Seconds allowed for each upstream attempt.
 
         Returns:
-            - PaginatedResponse[Breed]: A paginated response with breed data.
+            - Any: Decoded JSON body.
+
+        Raises:
+            - HTTPException: 404 if the upstream resource does not exist, 503 while the circuit
+              is open, 504 when every attempt timed out.
         """
-        params = {"limit": pagination.limit, "page": pagination.page}
+        key = f"{path}?{urlencode(sorted((params or {}).items()))}"
+        # Label detail lookups by template so breed and image IDs don't create new series
+        if path in ("/breeds", "/breeds/search"):
+            endpoint = path
+        elif path.startswith("/images/"):
+            endpoint = "/images/{image_id}"
+        else:
+            endpoint = "/breeds/{breed_id}"
+
+        async def fetch():
+            request_headers = headers
+            cached = breed_cache.peek(key)
+            validator = upstream_etags.peek(key)
+            if cached is not None and validator is not None:
+                request_headers = {**headers, "If-None-Match": validator.value}
+
+            client = get_http_client()
+
+            async def attempt():
+                outcome = "error"
+                start = time.perf_counter()
+                try:
+                    response = await asyncio.wait_for(
+                        client.get(f"{CAT_API_URL}{path}", headers=request_headers, params=params), timeout
+                    )
+                    outcome = str(response.status_code)
+                except asyncio.TimeoutError:
+                    outcome = "timeout"
+                    raise
+                finally:
+                    upstream_request_duration.observe(time.perf_counter() - start, endpoint, outcome)
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+                return response
+
+            try:
+                response = await breed_upstream.call(attempt)
+            except CircuitOpenError as error:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="TheCatAPI is unavailable",
+                    headers={"Retry-After": str(max(1, math.ceil(error.retry_after)))},
+                )
+            except asyncio.TimeoutError:
+                raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="TheCatAPI timed out")
+
+            if response.status_code == status.HTTP_304_NOT_MODIFIED and cached is not None:
+                return cached.value
+
+            if response.status_code == status.HTTP_404_NOT_FOUND:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Breed not found")
 
-        # Fetch and paginate all cat breeds
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{CAT_API_URL}/breeds", headers=headers, params=params)
             response.raise_for_status()
-            breeds = response.json()
+            etag = response.headers.get("etag")
+            if etag:
+                upstream_etags.set(key, etag, ttl + BREED_CACHE_STALE_TTL, size=len(etag))
+            return response.json()
 
-        # Build pagination
-        base_url = str(request.url).split("?")[0]
-        query = f"limit={pagination.limit}&page={{}}"
+        async def load(read_through: bool = True):
+            if read_through:
+                shared = await BreedService._read_shared(key)
+                if shared is not None:
+                    return shared
+            data = await breed_flights.do(key, fetch)
+            BreedService._persist(key, data, ttl)
+            return data
+
+        if not BREED_CACHE_ENABLED:
+            return await load(read_through=False)
+
+        if refresh:
+            data = await load(read_through=False)
+            breed_cache.set(key, data, ttl, BREED_CACHE_STALE_TTL)
+            return data
+
+        return await breed_cache.get_or_load(key, load, ttl=ttl, stale_ttl=BREED_CACHE_STALE_TTL)
+
+    @staticmethod
+    async def _store_call(operation: Awaitable[Any]) -> Any:
+        """
+        Await a shared-store operation for at most BREED_CACHE_STORE_TIMEOUT seconds, so a
+        store that stops answering cannot hold up requests, startup or the sync loop.
+
+        Raises:
+            - asyncio.TimeoutError: If the store did not answer in time.
+        """
+        return await asyncio.wait_for(operation, BREED_CACHE_STORE_TIMEOUT)
+
+    @staticmethod
+    async def _read_shared(key: str) -> Any:
+        """
+        Return a fresh value another process stored for key, or None. Store errors and
+        timeouts are logged and treated as misses.
+        """
+        if breed_namespace is None:
+            return None
+        try:
+            entry = await BreedService._store_call(breed_namespace.get(key))
+        except Exception:
+            logger.warning("Could not read breed cache entry %s from the shared store", key, exc_info=True)
+            return None
+        if entry is None or entry.fresh_until <= time.time():
+            return None
+        return entry.value
+
+    @staticmethod
+    def _persist(key: str, data: Any, ttl: float) -> None:
+        """
+        Write an upstream response to the shared store in the background.
+        """
+        if breed_namespace is None:
+            return
+
+        async def write():
+            fresh_until = time.time() + ttl
+            try:
+                await BreedService._store_call(
+                    breed_namespace.set(key, data, fresh_until, fresh_until + BREED_CACHE_STALE_TTL)
+                )
+            except Exception:
+                logger.warning("Could not persist breed cache entry %s", key, exc_info=True)
+
+        task = asyncio.create_task(write())
+        _store_writes.add(task)
+        task.add_done_callback(_store_writes.discard)
+
+    @staticmethod
+    async def warm_cache() -> int:
+        """
+        Fill the in-memory breed cache from the shared store, so a restarted process
+        serves cached data (refreshing expired entries in the background) instead of
+        going upstream for everything.
+
+        Returns:
+            - int: Number of entries loaded.
+        """
+        if breed_namespace is None:
+            return 0
+
+        await BreedService._store_call(breed_namespace.sync())
+        entries = await BreedService._store_call(breed_namespace.load(BREED_CACHE_MAX_ENTRIES))
+        now = time.time()
+        # Oldest first so the most recently fresh entries end up most recently used
+        for entry in reversed(entries):
+            ttl = max(0.0, entry.fresh_until - now)
+            stale_ttl = max(0.0, entry.stale_until - max(now, entry.fresh_until))
+            breed_cache.set(entry.key, entry.value, ttl, stale_ttl)
+        return len(entries)
+
+    @staticmethod
+    def _clear_local() -> None:
+        for cache in (breed_cache, breed_representations, upstream_etags):
+            cache.clear()
+
+    @staticmethod
+    async def invalidate_cache() -> None:
+        """
+        Drop cached breed data in this process and, by bumping the shared namespace
+        version, in every process using the same store.
+        """
+        if breed_namespace is not None:
+            await BreedService._store_call(breed_namespace.invalidate())
+        BreedService._clear_local()
+
+    @staticmethod
+    async def sync_shared_cache() -> bool:
+        """
+        Poll the shared namespace version and clear the local caches when another
+        process invalidated it.
+
+        Returns:
+            - bool: True when the local caches were cleared.
+        """
+        if breed_namespace is None or not await BreedService._store_call(breed_namespace.sync()):
+            return False
+        BreedService._clear_local()
+        return True
+
+    @staticmethod
+    async def run_cache_sync(interval: float = BREED_CACHE_SYNC_INTERVAL) -> None:
+        """
+        Poll for shared invalidations every interval seconds until cancelled. In snapshot
+        mode an invalidation also reloads the snapshot.
+
+        Args:
+            - interval (float): Seconds between polls.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if await BreedService.sync_shared_cache():
+                    logger.info("Breed cache invalidated through the shared store")
+                    if BREED_SNAPSHOT_ENABLED:
+                        await BreedService.refresh_snapshot()
+            except Exception:
+                logger.warning("Breed cache sync failed", exc_info=True)
+
+    @staticmethod
+    async def close_store() -> None:
+        """
+        Wait for pending shared-store writes and close the store.
+        """
+        if _store_writes:
+            await asyncio.gather(*_store_writes, return_exceptions=True)
+        if breed_store is not None:
+            await breed_store.close()
+
+    @staticmethod
+    async def get_catalogue() -> BreedCatalogue:
+        """
+        Return the indexed catalogue of every breed.
+
+        In snapshot mode the catalogue loaded at startup (and swapped by the refresher)
+        is returned as is; otherwise it is rebuilt whenever the cached full list changes.
+
+        Returns:
+            - BreedCatalogue: Immutable, indexed breed list.
+        """
+        global _catalogue
+        if BREED_SNAPSHOT_ENABLED and _catalogue is not None:
+            return _catalogue
+
+        breeds = await BreedService._get_json("/breeds", ttl=BREED_CACHE_TTL_LIST, timeout=UPSTREAM_TIMEOUT_LIST)
+        if _catalogue is None or _catalogue.source is not breeds:
+            _catalogue = BreedCatalogue(breeds)
+        return _catalogue
+
+    @staticmethod
+    async def refresh_snapshot() -> BreedCatalogue:
+        """
+        Load the full breed list from TheCatAPI and atomically swap in a new catalogue.
+
+        Returns:
+            - BreedCatalogue: The freshly built catalogue.
+        """
+        global _catalogue
+        breeds = await BreedService._get_json(
+            "/breeds", ttl=BREED_CACHE_TTL_LIST, refresh=True, timeout=UPSTREAM_TIMEOUT_LIST
+        )
+        _catalogue = BreedCatalogue(breeds)
+        return _catalogue
 
+    @staticmethod
+    async def run_snapshot_refresher(interval: float = BREED_SNAPSHOT_REFRESH_INTERVAL) -> None:
+        """
+        Reload the snapshot every interval seconds until cancelled. Failures keep the
+        previous snapshot in place.
+
+        Args:
+            - interval (float): Seconds between reloads.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await BreedService.refresh_snapshot()
+            except Exception:
+                logger.warning("Breed snapshot refresh failed; keeping the previous snapshot", exc_info=True)
+
+    @staticmethod
+    def _paginate(
+        breeds: List[dict],
+        pagination: PaginationParams,
+        request: Request,
+        catalogue: BreedCatalogue,
+        extra_query: Optional[List[Tuple[str, Any]]] = None,
+        selection: Optional[FieldSelection] = None,
+    ) -> BreedPage:
+        """
+        Slice a locally held breed list and build its next/previous links. Results reuse
+        the models validated when the catalogue was built, so no page is revalidated.
+
+        Args:
+            - breeds (List[dict]): Every breed matching the request.
+            - pagination (PaginationParams): Pagination parameters (limit and page).
+            - request (Request): FastAPI request object to build pagination URLs.
+            - catalogue (BreedCatalogue): Catalogue holding the validated models.
+            - extra_query (Optional[List[Tuple[str, Any]]]): Query pairs preserved in the links.
+            - selection (Optional[FieldSelection]): Field selection preserved in the links.
+
+        Returns:
+            - PaginatedResponse[Breed]: The requested page.
+        """
         start = pagination.page * pagination.limit
         end = start + pagination.limit
 
+        base_url = str(request.url).split("?")[0]
+        preserved = [*(extra_query or []), *(selection.as_query() if selection else [])]
+
+        def link(page: int) -> str:
+            query = [*preserved, ("limit", pagination.limit), ("page", page)]
+            return f"{base_url}?{urlencode(query)}"
 
-        return PaginatedResponse[BreedModel](
-            results=breeds,
+        return BreedPage.model_construct(
+            results=catalogue.to_models(breeds[start:end]),
             limit=pagination.limit,
             page=pagination.page,
-            next=f"{base_url}?{query.format(pagination.page + 1)}" if end < len(breeds) else None,
-            previous=f"{base_url}?{query.format(pagination.page - 1)}" if pagination.page > 0 else None,
+            next=link(pagination.page + 1) if end < len(breeds) else None,
+            previous=link(pagination.page - 1) if pagination.page > 0 else None,
+            total=None,
+        )
+
+    @staticmethod
+    def encode_page(page: BreedPage, selection: Optional[FieldSelection] = None) -> bytes:
+        """
+        Encode a breed page to JSON by joining the per-breed bytes cached in the catalogue.
+        The output is identical to serializing the page through its response model. With a
+        field selection only the selected (or non-null) breed fields are encoded.
+
+        Args:
+            - page (PaginatedResponse[Breed]): Page built by _paginate.
+            - selection (Optional[FieldSelection]): Sparse fields / exclude_none projection.
+
+        Returns:
+            - bytes: JSON body.
+
+        Raises:
+            - HTTPException: 400 if a selected field does not exist.
+        """
+        if selection is None or selection.is_empty:
+            catalogue = _catalogue or _empty_catalogue
+            return encode_page(page, (catalogue.to_json(breed) for breed in page.results))
+
+        try:
+            selection.check(BreedModel)
+        except ValueError as error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+        return encode_page(page, (selection.encode(breed) for breed in page.results))
+
+    @staticmethod
+    def encode_breed(breed: Union[dict, BreedModel]) -> bytes:
+        """
+        Encode a single breed to JSON, reusing the catalogue bytes when it holds the breed.
+
+        Args:
+            - breed (Union[dict, BreedModel]): Breed returned by get_breed_by_id.
+
+        Returns:
+            - bytes: JSON body.
+        """
+        return (_catalogue or _empty_catalogue).to_json(breed)
+
+    @staticmethod
+    async def get_all_breeds(
+        pagination: PaginationParams,
+        request: Request,
+        breed_query: Optional[BreedQueryParams] = None,
+        selection: Optional[FieldSelection] = None,
+    ) -> BreedPage:
+        """
+        Retrieve a paginated list of all cat breeds, optionally filtered and sorted by traits.
+
+        Args:
+            - pagination (PaginationParams): Pagination parameters (limit and page).
+            - request (Request): FastAPI request object to build pagination URLs.
+            - breed_query (Optional[BreedQueryParams]): Trait filters, sort keys, origin and country code.
+            - selection (Optional[FieldSelection]): Field selection, preserved in the pagination links.
+
+        Returns:
+            - PaginatedResponse[Breed]: A paginated response with breed data.
+
+        Raises:
+            - HTTPException: 400 if a filter or sort expression is invalid.
+        """
+        # Paginate the full catalogue locally so next/previous reflect the real total
+        catalogue = await BreedService.get_catalogue()
+        if breed_query is None or breed_query.is_empty:
+            return BreedService._paginate(catalogue.breeds, pagination, request, catalogue, selection=selection)
+
+        try:
+            filters = [parse_filter(expression) for expression in breed_query.filters]
+            sort = parse_sort(breed_query.sort) if breed_query.sort else []
+        except ValueError as error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+
+        breeds = catalogue.query(
+            filters=filters, sort=sort, origin=breed_query.origin, country_code=breed_query.country_code
+        )
+        return BreedService._paginate(
+            breeds, pagination, request, catalogue, extra_query=breed_query.as_query(), selection=selection
         )
 
     @staticmethod
@@ -64,21 +559,82 @@ class BreedService:
             - Breed: The breed that matches the given ID.
 
         Raises:
-            - HTTPException: If no breed is found with the provided ID.
+            - HTTPException: 400 if the ID is malformed, 404 if no breed is found with the provided ID.
         """
-        # Retrieve a specific cat breed filtered by ID
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{CAT_API_URL}/breeds/{breed_id}", headers=headers)
+        if not _BREED_ID.match(breed_id):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid breed ID")
 
-            if response.status_code == status.HTTP_404_NOT_FOUND:
+        if BREED_SNAPSHOT_ENABLED:
+            breed = (await BreedService.get_catalogue()).get(breed_id)
+            if breed is None:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Breed not found")
+            return breed
 
-            response.raise_for_status()
-            return response.json()
+        # Retrieve a specific cat breed filtered by ID
+        return await BreedService._get_json(f"/breeds/{breed_id}", ttl=BREED_CACHE_TTL_DETAIL)
+
+    @staticmethod
+    async def get_breeds_by_ids(breed_ids: List[str]) -> BreedBatchResponse:
+        """
+        Retrieve several breeds at once. IDs are deduplicated and, once the catalogue has
+        been loaded, resolved from it; the rest come from the breed cache or are fetched
+        concurrently up to BREED_BATCH_CONCURRENCY. Malformed IDs are reported as per-ID
+        400 errors without calling upstream.
+
+        Args:
+            - breed_ids (List[str]): Requested breed IDs.
+
+        Returns:
+            - BreedBatchResponse: Found breeds in request order and per-ID errors.
+
+        Raises:
+            - HTTPException: 400 if no IDs or more than BREED_BATCH_MAX_IDS are requested.
+        """
+        unique_ids = list(dict.fromkeys(breed_id.strip() for breed_id in breed_ids if breed_id.strip()))
+        if not unique_ids:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No breed IDs provided")
+        if len(unique_ids) > BREED_BATCH_MAX_IDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {BREED_BATCH_MAX_IDS} breed IDs can be requested at once",
+            )
+
+        catalogue = None
+        if _catalogue is not None:
+            try:
+                # Revalidated against the cached full list, refetching it at most once
+                catalogue = await BreedService.get_catalogue()
+            except (HTTPException, httpx.HTTPError):
+                logger.warning("Breed catalogue unavailable; looking up breeds one by one", exc_info=True)
+
+        semaphore = asyncio.Semaphore(BREED_BATCH_CONCURRENCY)
 
+        async def lookup(breed_id: str):
+            breed = catalogue.get(breed_id) if catalogue is not None else None
+            if breed is not None:
+                return breed
+            try:
+                async with semaphore:
+                    return await BreedService.get_breed_by_id(breed_id)
+            except HTTPException as error:
+                return BreedBatchError(id=breed_id, status_code=error.status_code, detail=str(error.detail))
+            except httpx.HTTPStatusError as error:
+                return BreedBatchError(
+                    id=breed_id, status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Upstream error {error.response.status_code}"
+                )
+            except httpx.HTTPError:
+                return BreedBatchError(id=breed_id, status_code=status.HTTP_502_BAD_GATEWAY, detail="Upstream unavailable")
+
+        outcomes = await asyncio.gather(*(lookup(breed_id) for breed_id in unique_ids))
+        return BreedBatchResponse(
+            results=[outcome for outcome in outcomes if not isinstance(outcome, BreedBatchError)],
+            errors=[outcome for outcome in outcomes if isinstance(outcome, BreedBatchError)],
+        )
 
     @staticmethod
-    async def search_breeds(query: str, pagination: PaginationParams, request: Request) -> PaginatedResponse[BreedModel]:
+    async def search_breeds(
+        query: str, pagination: PaginationParams, request: Request, selection: Optional[FieldSelection] = None
+    ) -> BreedPage:
         """
         Search for cat breeds by name and return a paginated result.
 
@@ -86,6 +642,7 @@ class BreedService:
             - query (str): The search term to match breed names.
             - pagination (PaginationParams): Pagination parameters (limit and page).
             - request (Request): FastAPI request object to build pagination URLs.
+            - selection (Optional[FieldSelection]): Field selection, preserved in the pagination links.
 
         Returns:
             - PaginatedResponse[Breed]: A paginated list of matched breeds.
@@ -93,30 +650,50 @@ class BreedService:
         Raises:
             - HTTPException: If no breeds are found for the search query.
         """
-        params = {
-            "q": query,
-            "attach_image": 1
-        }
-        # Search breeds by name and paginate the results
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{CAT_API_URL}/breeds/search", headers=headers, params=params)
-            response.raise_for_status()
-            breeds = response.json()
+        if BREED_SNAPSHOT_ENABLED:
+            catalogue = await BreedService.get_catalogue()
+            breeds = catalogue.search(query)
+        else:
+            catalogue = _catalogue or _empty_catalogue
+            params = {
+                "q": query,
+                "attach_image": 1
+            }
+            # Search breeds by name and paginate the results
+            breeds = await BreedService._get_json(
+                "/breeds/search", ttl=BREED_CACHE_TTL_SEARCH, params=params, timeout=UPSTREAM_TIMEOUT_SEARCH
+            )
 
         if not breeds:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Breed not found")
 
-        # Build pagination
-        start = pagination.page * pagination.limit
-        end = start + pagination.limit
-        paginated = breeds[start:end]
-        base_url = str(request.url).split("?")[0]
-        query_params = f"query={query}&limit={pagination.limit}&page={{}}"
-
-        return PaginatedResponse[BreedModel](
-            results=paginated,
-            limit=pagination.limit,
-            page=pagination.page,
-            next=f"{base_url}?{query_params.format(pagination.page + 1)}" if end < len(breeds) else None,
-            previous=f"{base_url}?{query_params.format(pagination.page - 1)}" if pagination.page > 0 else None,
+        return BreedService._paginate(
+            breeds, pagination, request, catalogue, extra_query=[("query", query)], selection=selection
         )
+
+    @staticmethod
+    async def export_breeds(batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+        """
+        Load the breed catalogue and return an NDJSON stream of it, one breed per line.
+        The catalogue is resolved before streaming starts so upstream errors still
+        produce a proper error response.
+
+        Args:
+            - batch_size (int): Number of lines joined into each emitted chunk.
+
+        Returns:
+            - AsyncIterator[bytes]: Chunks of newline-delimited JSON.
+        """
+        catalogue = await BreedService.get_catalogue()
+
+        async def stream():
+            lines = []
+            for encoded in catalogue.encoded:
+                lines.append(encoded)
+                if len(lines) >= batch_size:
+                    yield b"\n".join(lines) + b"\n"
+                    lines = []
+            if lines:
+                yield b"\n".join(lines) + b"\n"
+
+        return stream()
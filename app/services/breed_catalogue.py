@@ -0,0 +1,280 @@
+# Models
+from app.models.breed import BreedModel
+
+# External
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+import operator
+import re
+import time
+import unicodedata
+
+
+SEARCHABLE_FIELDS = ("name", "alt_names", "origin", "temperament")
+
+# Integer traits of BreedModel; the flags are 0/1 and are also kept as bitmaps
+SCORE_TRAITS = (
+    "adaptability", "affection_level", "child_friendly", "dog_friendly", "energy_level",
+    "grooming", "health_issues", "intelligence", "social_needs", "stranger_friendly", "vocalisation",
+)
+FLAG_TRAITS = (
+    "experimental", "hairless", "hypoallergenic", "indoor", "lap", "natural",
+    "rare", "rex", "short_legs", "suppressed_tail",
+)
+TRAIT_FIELDS = SCORE_TRAITS + FLAG_TRAITS
+SORT_FIELDS = TRAIT_FIELDS + ("name",)
+
+MISSING = -1
+
+OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+
+class TraitFilter(NamedTuple):
+    field: str
+    op: str
+    value: int
+
+
+class SortKey(NamedTuple):
+    field: str
+    descending: bool = False
+
+
+_TOKEN_RE = re.compile(r"\w+")
+_FILTER_RE = re.compile(r"^\s*(\w+)\s*(!=|>=|<=|=|>|<)\s*(-?\d+)\s*$")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split text into lowercase, accent-free word tokens.
+    """
+    if not text:
+        return []
+    normalized = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in normalized if not unicodedata.combining(char))
+    return _TOKEN_RE.findall(stripped.lower())
+
+
+class BreedCatalogue:
+    """
+    Immutable in-memory snapshot of the full breed list.
+        - Every breed is validated into a BreedModel and encoded to JSON once, on ingest.
+        - ID lookups go through a hash index.
+        - Searches use a sorted token index over name, alt_names, origin and temperament,
+          so each query token is resolved with a binary search over token prefixes.
+        - Trait filters and sorts read array-backed columns (one per trait, MISSING for null)
+          and bitmaps for the 0/1 flags, origins and country codes.
+    """
+    def __init__(self, breeds: Sequence[dict]):
+        self.source = breeds
+        self.breeds: Tuple[dict, ...] = tuple(breeds)
+        self.loaded_at = time.time()
+        self._by_id: Dict[str, int] = {breed["id"]: position for position, breed in enumerate(self.breeds)}
+        self.models: Tuple[BreedModel, ...] = tuple(BreedModel.model_validate(breed) for breed in self.breeds)
+        self.encoded: Tuple[bytes, ...] = tuple(model.model_dump_json().encode() for model in self.models)
+
+        postings: Dict[str, set] = {}
+        for position, breed in enumerate(self.breeds):
+            for field in SEARCHABLE_FIELDS:
+                for token in tokenize(breed.get(field)):
+                    postings.setdefault(token, set()).add(position)
+
+        self._tokens: List[str] = sorted(postings)
+        self._postings: List[Tuple[int, ...]] = [tuple(sorted(postings[token])) for token in self._tokens]
+
+        self._all = (1 << len(self.breeds)) - 1
+        self._columns: Dict[str, array] = {
+            field: array("b", (_trait_value(breed.get(field)) for breed in self.breeds)) for field in TRAIT_FIELDS
+        }
+        self._flags: Dict[str, int] = {
+            field: _bitmap(position for position, value in enumerate(self._columns[field]) if value == 1)
+            for field in FLAG_TRAITS
+        }
+        self._known_flags: Dict[str, int] = {
+            field: _bitmap(position for position, value in enumerate(self._columns[field]) if value != MISSING)
+            for field in FLAG_TRAITS
+        }
+        self._origins = _group_bitmaps((breed.get("origin") or "").lower() for breed in self.breeds)
+        self._country_codes = _group_bitmaps((breed.get("country_code") or "").upper() for breed in self.breeds)
+
+    def __len__(self) -> int:
+        return len(self.breeds)
+
+    def get(self, breed_id: str) -> Optional[dict]:
+        """
+        Return the breed with the given ID, or None.
+        """
+        position = self._by_id.get(breed_id)
+        return None if position is None else self.breeds[position]
+
+    def _position(self, breed: Union[dict, BreedModel]) -> Optional[int]:
+        breed_id = breed.id if isinstance(breed, BreedModel) else breed.get("id")
+        position = self._by_id.get(breed_id)
+        if position is None or (self.breeds[position] is not breed and self.models[position] is not breed):
+            return None
+        return position
+
+    def to_models(self, breeds: Iterable[dict]) -> List[BreedModel]:
+        """
+        Return models for breeds, reusing the ones validated on ingest. Breeds that do
+        not come from this catalogue (e.g. upstream search results) are validated here.
+        """
+        models = []
+        for breed in breeds:
+            position = self._position(breed)
+            models.append(BreedModel.model_validate(breed) if position is None else self.models[position])
+        return models
+
+    def to_json(self, breed: Union[dict, BreedModel]) -> bytes:
+        """
+        Return the JSON encoding of a breed, reusing the bytes encoded on ingest.
+        """
+        position = self._position(breed)
+        if position is not None:
+            return self.encoded[position]
+        model = breed if isinstance(breed, BreedModel) else BreedModel.model_validate(breed)
+        return model.model_dump_json().encode()
+
+    def _match_prefix(self, prefix: str) -> set:
+        matches = set()
+        index = bisect_left(self._tokens, prefix)
+        while index < len(self._tokens) and self._tokens[index].startswith(prefix):
+            matches.update(self._postings[index])
+            index += 1
+        return matches
+
+    def search(self, query: str) -> List[dict]:
+        """
+        Find breeds where every query token prefixes some token of a searchable field.
+
+        Args:
+            - query (str): Free-text search (e.g. "sia", "egypt", "playful active").
+
+        Returns:
+            - List[dict]: Matching breeds in catalogue order.
+        """
+        positions: Optional[set] = None
+        for token in tokenize(query):
+            matches = self._match_prefix(token)
+            positions = matches if positions is None else positions & matches
+            if not positions:
+                return []
+        if positions is None:
+            return []
+        return [self.breeds[position] for position in sorted(positions)]
+
+    def _match_filter(self, condition: TraitFilter) -> int:
+        if condition.field in self._flags and condition.op == "=" and condition.value in (0, 1):
+            flagged = self._flags[condition.field]
+            return flagged if condition.value == 1 else self._known_flags[condition.field] & ~flagged
+
+        compare = OPERATORS[condition.op]
+        return _bitmap(
+            position
+            for position, value in enumerate(self._columns[condition.field])
+            if value != MISSING and compare(value, condition.value)
+        )
+
+    def query(
+        self,
+        filters: Iterable[TraitFilter] = (),
+        sort: Iterable[SortKey] = (),
+        origin: Optional[str] = None,
+        country_code: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Filter and sort the catalogue using the columnar indexes.
+
+        Args:
+            - filters (Iterable[TraitFilter]): Trait conditions, all of which must hold.
+            - sort (Iterable[SortKey]): Sort keys by priority; null traits always sort last.
+            - origin (Optional[str]): Case-insensitive exact origin.
+            - country_code (Optional[str]): Case-insensitive country code.
+
+        Returns:
+            - List[dict]: Matching breeds.
+        """
+        selected = self._all
+        if origin is not None:
+            selected &= self._origins.get(origin.lower(), 0)
+        if country_code is not None:
+            selected &= self._country_codes.get(country_code.upper(), 0)
+        for condition in filters:
+            if not selected:
+                break
+            selected &= self._match_filter(condition)
+
+        positions = [position for position in range(len(self.breeds)) if selected >> position & 1]
+
+        # Stable sorts applied from the least to the most significant key
+        for key in reversed(list(sort)):
+            if key.field == "name":
+                positions.sort(key=lambda position: self.breeds[position]["name"].lower(), reverse=key.descending)
+                continue
+            column = self._columns[key.field]
+            known = [position for position in positions if column[position] != MISSING]
+            unknown = [position for position in positions if column[position] == MISSING]
+            known.sort(key=column.__getitem__, reverse=key.descending)
+            positions = known + unknown
+
+        return [self.breeds[position] for position in positions]
+
+
+def parse_filter(expression: str) -> TraitFilter:
+    """
+    Parse a filter expression such as "energy_level>=4" or "indoor=1".
+
+    Raises:
+        - ValueError: If the expression or the trait name is invalid.
+    """
+    match = _FILTER_RE.match(expression)
+    if not match:
+        raise ValueError(f"Invalid filter '{expression}', expected <trait><op><integer>")
+    field, op, value = match.groups()
+    if field not in TRAIT_FIELDS:
+        raise ValueError(f"Unknown trait '{field}'")
+    return TraitFilter(field, op, int(value))
+
+
+def parse_sort(expression: str) -> List[SortKey]:
+    """
+    Parse a comma-separated sort specification such as "-energy_level,name".
+
+    Raises:
+        - ValueError: If a sort field is unknown.
+    """
+    keys = []
+    for part in filter(None, (item.strip() for item in expression.split(","))):
+        descending = part.startswith("-")
+        field = part.lstrip("+-")
+        if field not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field '{field}'")
+        keys.append(SortKey(field, descending))
+    return keys
+
+
+def _trait_value(value) -> int:
+    return value if isinstance(value, int) and -128 < value < 128 else MISSING
+
+
+def _bitmap(positions: Iterable[int]) -> int:
+    bitmap = 0
+    for position in positions:
+        bitmap |= 1 << position
+    return bitmap
+
+
+def _group_bitmaps(values: Iterable[str]) -> Dict[str, int]:
+    groups: Dict[str, int] = {}
+    for position, value in enumerate(values):
+        if value:
+            groups[value] = groups.get(value, 0) | 1 << position
+    return groups
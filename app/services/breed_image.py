@@ -0,0 +1,208 @@
+# FastAPI
+from fastapi import HTTPException, status
+
+# Config
+from app.core.config import (
+    BREED_CACHE_TTL_DETAIL,
+    BREED_IMAGE_CACHE_DIR,
+    BREED_IMAGE_DOWNLOAD_TIMEOUT,
+    BREED_IMAGE_MAX_BYTES,
+    BREED_IMAGE_PREFETCH_CONCURRENCY,
+    BREED_IMAGE_THUMBNAIL_SIZE,
+)
+from app.core.http import get_http_client
+from app.core.metrics import registry
+
+# Services
+from app.services.breed import BreedService
+
+# Utils
+from app.utils.image_cache import MEDIA_TYPES, DiskImageCache, extension_for
+from app.utils.singleflight import SingleFlight
+
+# External
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+import asyncio
+import httpx
+import logging
+import os
+
+
+logger = logging.getLogger(__name__)
+
+image_cache = DiskImageCache(BREED_IMAGE_CACHE_DIR, BREED_IMAGE_THUMBNAIL_SIZE)
+image_flights = SingleFlight()
+
+registry.counter_callback(
+    "breed_image_fetches_total",
+    "Breed images and thumbnails materialized into the disk cache.",
+    lambda: [({}, image_flights.leaders)],
+)
+
+
+class BreedImageService:
+    @staticmethod
+    async def _reference_image_id(breed_id: str) -> str:
+        """
+        Resolve a breed's reference image ID through the (cached) breed lookup.
+
+        Raises:
+            - HTTPException: 404 if the breed does not exist or has no reference image.
+        """
+        breed = await BreedService.get_breed_by_id(breed_id)
+        image_id = breed.get("reference_image_id") if isinstance(breed, dict) else breed.reference_image_id
+        if not image_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Breed has no image")
+        return image_id
+
+    @staticmethod
+    async def _fetch(url: str) -> Tuple[bytes, Optional[str]]:
+        """
+        Stream an image from the CDN, aborting as soon as it grows past BREED_IMAGE_MAX_BYTES.
+
+        Returns:
+            - Tuple[bytes, Optional[str]]: Image bytes and Content-Type.
+
+        Raises:
+            - httpx.HTTPError: If the request fails or the CDN answers with an error status.
+            - HTTPException: 502 if the image is larger than BREED_IMAGE_MAX_BYTES.
+        """
+        client = get_http_client()
+        response = await client.send(client.build_request("GET", url), stream=True)
+        try:
+            response.raise_for_status()
+            too_large = HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Image too large")
+            declared = response.headers.get("content-length", "")
+            if declared.isdigit() and int(declared) > BREED_IMAGE_MAX_BYTES:
+                raise too_large
+            chunks, size = [], 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > BREED_IMAGE_MAX_BYTES:
+                    raise too_large
+                chunks.append(chunk)
+            return b"".join(chunks), response.headers.get("content-type")
+        finally:
+            await response.aclose()
+
+    @staticmethod
+    async def _download(image_id: str) -> str:
+        """
+        Look up an image's URL on TheCatAPI, download it and store it in the disk cache.
+
+        Raises:
+            - HTTPException: 404 if TheCatAPI does not know the image, 502 if the download
+              fails, exceeds BREED_IMAGE_MAX_BYTES or the format is unsupported, 504 when it times out.
+        """
+        try:
+            metadata = await BreedService._get_json(f"/images/{image_id}", ttl=BREED_CACHE_TTL_DETAIL)
+        except HTTPException as error:
+            if error.status_code == status.HTTP_404_NOT_FOUND:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+            raise
+
+        url = metadata.get("url") if isinstance(metadata, dict) else None
+        if not url:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+
+        try:
+            content, content_type = await asyncio.wait_for(BreedImageService._fetch(url), BREED_IMAGE_DOWNLOAD_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="Image download timed out")
+        except httpx.HTTPError:
+            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Could not download image")
+
+        extension = extension_for(urlparse(url).path, content_type)
+        if extension is None:
+            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Unsupported image format")
+        return await image_cache.store(image_id, extension, content)
+
+    @staticmethod
+    async def ensure_image(image_id: str, thumbnail: bool = False) -> str:
+        """
+        Return the disk path of an image, downloading the original and generating the
+        thumbnail on first use. Concurrent requests for the same file share one download.
+        Thumbnails fall back to the original when Pillow is not installed or cannot decode it.
+
+        Args:
+            - image_id (str): TheCatAPI image ID.
+            - thumbnail (bool): Return the downsized JPEG instead of the original.
+
+        Returns:
+            - str: Path of the cached file.
+        """
+        try:
+            path = image_cache.find(image_id, thumbnail)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+        if path is not None:
+            return path
+
+        async def materialize():
+            original = image_cache.find(image_id) or await BreedImageService._download(image_id)
+            if not thumbnail:
+                return original
+            return await image_cache.make_thumbnail(image_id, original) or original
+
+        return await image_flights.do((image_id, thumbnail), materialize)
+
+    @staticmethod
+    async def get_image(breed_id: str, thumbnail: bool = False) -> Tuple[str, str]:
+        """
+        Return the cached image of a breed, fetching it into the disk cache if needed.
+
+        Args:
+            - breed_id (str): The unique identifier of the breed.
+            - thumbnail (bool): Return the downsized JPEG instead of the original.
+
+        Returns:
+            - Tuple[str, str]: File path and media type.
+
+        Raises:
+            - HTTPException: 404 if the breed or its image does not exist.
+        """
+        image_id = await BreedImageService._reference_image_id(breed_id)
+        path = await BreedImageService.ensure_image(image_id, thumbnail)
+        extension = ".jpg" if path.endswith(".thumb.jpg") else os.path.splitext(path)[1]
+        return path, MEDIA_TYPES[extension]
+
+    @staticmethod
+    async def prefetch_catalogue(concurrency: int = BREED_IMAGE_PREFETCH_CONCURRENCY) -> int:
+        """
+        Download the reference image and thumbnail of every catalogued breed that is not
+        cached yet, at most concurrency at a time. Failures are logged and skipped.
+
+        Args:
+            - concurrency (int): Maximum simultaneous downloads.
+
+        Returns:
+            - int: Number of images available in the disk cache afterwards.
+        """
+        catalogue = await BreedService.get_catalogue()
+        image_ids = dict.fromkeys(
+            breed["reference_image_id"] for breed in catalogue.breeds if breed.get("reference_image_id")
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def prefetch(image_id: str) -> bool:
+            async with semaphore:
+                try:
+                    await BreedImageService.ensure_image(image_id, thumbnail=True)
+                    return True
+                except Exception:
+                    logger.warning("Could not prefetch breed image %s", image_id, exc_info=True)
+                    return False
+
+        return sum(await asyncio.gather(*(prefetch(image_id) for image_id in image_ids)))
+
+    @staticmethod
+    async def run_prefetcher() -> None:
+        """
+        Prefetch the catalogue images once in the background, logging instead of raising.
+        """
+        try:
+            cached = await BreedImageService.prefetch_catalogue()
+            logger.info("Breed image cache holds %d prefetched images", cached)
+        except Exception:
+            logger.warning("Breed image prefetch failed; images will be fetched on first request", exc_info=True)
@@ -1,18 +1,186 @@
 # FastAPI
 from fastapi import HTTPException, status
 
+# Config
+from app.core.config import (
+    BREED_CACHE_KV_URL,
+    BREED_CACHE_MONGO_COLLECTION,
+    BREED_CACHE_SQLITE_PATH,
+    BREED_CACHE_STORE_TIMEOUT,
+    EXPORT_BATCH_SIZE,
+    LOGIN_FAILURE_WINDOW,
+    LOGIN_MAX_FAILURES_PER_IP,
+    LOGIN_MAX_FAILURES_PER_USERNAME,
+    LOGIN_RATE_LIMIT_ENABLED,
+    LOGIN_RATE_LIMIT_STORE,
+    MONGO_LIST_READ_PREFERENCE,
+    USER_BULK_ALLOCATION_CONCURRENCY,
+    USER_BULK_CHUNK_SIZE,
+    USER_CACHE_ENABLED,
+    USER_CACHE_MAX_BYTES,
+    USER_CACHE_MAX_ENTRIES,
+    USER_CACHE_TTL,
+    USERNAME_ALLOCATION_RETRIES,
+)
+
+# Metrics
+from app.core.metrics import mongo_operation_duration, registry
+
 # Models
 from app.models.common import PaginatedResponse
-from app.models.user import UserCreateModel, UserResponseModel
+from app.models.user import UserBulkResponse, UserBulkResult, UserCreateModel, UserResponseModel
 
 # MongoDB
-from app.db.mongodb import users_collection
+from app.db.mongodb import read_preference, username_counters_collection, users_collection
 
 # Utils
-from app.utils.security import hash_password
+from app.utils.cache import TTLCache
+from app.utils.pagination import NEXT, PREVIOUS, decode_cursor, encode_cursor
+from app.utils.cache_store import create_cache_store
+from app.utils.rate_limit import InMemoryRateLimitBackend, RateLimitBackend, SlidingWindowLimiter, StoreRateLimitBackend
+from app.utils.security import (
+    hash_password,
+    hash_password_async,
+    hash_passwords_async,
+    needs_rehash,
+    verify_password_async,
+)
+
+# External
+from bson import ObjectId
+from bson.errors import InvalidId
+from pydantic import ValidationError
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+import asyncio
+import math
+import os
+import re
+
+
+DUPLICATE_KEY_ERROR = 11000
+
+# Only fields of the username_login_covering index, so the lookup is answered from the index
+LOGIN_PROJECTION = {"_id": 0, "username": 1, "password": 1, "name": 1, "lastname": 1}
+
+# Listings tolerate replication lag, so they may be served by secondaries
+LIST_READ_PREFERENCE = read_preference(MONGO_LIST_READ_PREFERENCE)
+
+# Verified against when the username is unknown, so a miss costs as much as a wrong password
+_DUMMY_HASH = hash_password(os.urandom(16).hex())
+
+# Shared failure counters; without a store each worker enforces the limits on its own
+login_rate_limit_store = create_cache_store(
+    LOGIN_RATE_LIMIT_STORE,
+    BREED_CACHE_SQLITE_PATH,
+    BREED_CACHE_MONGO_COLLECTION,
+    BREED_CACHE_KV_URL,
+    timeout=BREED_CACHE_STORE_TIMEOUT,
+)
+
+
+def _login_backend(name: str) -> RateLimitBackend:
+    if login_rate_limit_store is None:
+        return InMemoryRateLimitBackend()
+    return StoreRateLimitBackend(login_rate_limit_store, f"login:{name}", timeout=BREED_CACHE_STORE_TIMEOUT)
+
+
+username_login_limiter = SlidingWindowLimiter(
+    LOGIN_MAX_FAILURES_PER_USERNAME, LOGIN_FAILURE_WINDOW, backend=_login_backend("username")
+)
+ip_login_limiter = SlidingWindowLimiter(LOGIN_MAX_FAILURES_PER_IP, LOGIN_FAILURE_WINDOW, backend=_login_backend("ip"))
+
+# Per-username entries: ("profile", username) holds the projected document without the
+# password and ("verifier", username) the hash. Unknown usernames are not cached: the cache
+# is per process, so a miss cached on one worker would reject a user just created on another.
+user_cache = TTLCache(max_entries=USER_CACHE_MAX_ENTRIES, max_bytes=USER_CACHE_MAX_BYTES)
+PROFILE_FIELDS = ("username", "name", "lastname")
+
+
+def _user_cache_samples(field: str):
+    return [({}, user_cache.stats()[field])]
+
+
+registry.gauge_callback("user_cache_entries", "Entries held by the user cache.", lambda: _user_cache_samples("entries"))
+registry.gauge_callback("user_cache_bytes", "Approximate bytes held by the user cache.", lambda: _user_cache_samples("bytes"))
+for _field in ("hits", "misses", "evictions"):
+    registry.counter_callback(
+        f"user_cache_{_field}_total", f"User cache {_field}.", lambda field=_field: _user_cache_samples(field)
+    )
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}" for item in error.errors()
+    )
 
 
 class UserService:
+    @staticmethod
+    def _username_base(name: str, lastname: str) -> str:
+        return (name + lastname).lower().replace(" ", "")
+
+    @staticmethod
+    async def _count_existing_allocations(base: str) -> int:
+        """
+        Count how many usernames of the sequence base, base1, base2, ... are already
+        taken by looking up the highest suffix in a single aggregate over the username index.
+
+        Args:
+            - base (str): Username base.
+
+        Returns:
+            - int: Highest existing suffix + 1 (base alone counts as suffix 0), or 0 if none exist.
+        """
+        suffix = {"$substrCP": ["$username", len(base), {"$strLenCP": "$username"}]}
+        pipeline = [
+            {"$match": {"username": {"$regex": f"^{re.escape(base)}[0-9]*$"}}},
+            {"$project": {"suffix": {"$cond": [{"$eq": [suffix, ""]}, 0, {"$toLong": suffix}]}}},
+            {"$group": {"_id": None, "max_suffix": {"$max": "$suffix"}}},
+        ]
+        with mongo_operation_duration.time("users", "aggregate"):
+            result = await users_collection.aggregate(pipeline).to_list(length=1)
+        return int(result[0]["max_suffix"]) + 1 if result else 0
+
+    @staticmethod
+    async def _allocate_usernames(base: str, count: int = 1) -> List[str]:
+        """
+        Reserve count consecutive usernames for a base with an atomic per-base counter,
+        so allocation takes a bounded number of round trips regardless of collisions.
+
+        The n-th allocation of a base is "base" for n == 1 and "base{n-1}" afterwards,
+        matching the historical base, base1, base2, ... sequence.
+
+        Args:
+            - base (str): Username base.
+            - count (int): Number of usernames to reserve.
+
+        Returns:
+            - List[str]: Reserved usernames.
+        """
+        with mongo_operation_duration.time("username_counters", "find_one_and_update"):
+            counter = await username_counters_collection.find_one_and_update(
+                {"_id": base}, {"$inc": {"seq": count}}, return_document=ReturnDocument.AFTER
+            )
+        if counter is None:
+            # New counter: skip past usernames created before counters existed. Seeding and
+            # reserving are one upsert, so concurrent first allocations still get distinct
+            # numbers: whichever lands second adds its count on top of the first one's.
+            existing = await UserService._count_existing_allocations(base)
+            seeded = {"$max": [{"$ifNull": ["$seq", 0]}, existing]}
+            with mongo_operation_duration.time("username_counters", "find_one_and_update"):
+                counter = await username_counters_collection.find_one_and_update(
+                    {"_id": base},
+                    [{"$set": {"seq": {"$add": [seeded, count]}}}],
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+
+        last = counter["seq"]
+        return [base if number == 1 else f"{base}{number - 1}" for number in range(last - count + 1, last + 1)]
+
     @staticmethod
     async def _generate_username(name: str, lastname: str):
         """
@@ -25,38 +193,132 @@ class UserService:
         Returns:
             - str: Unique username.
         """
-        base = (name + lastname).lower().replace(" ", "")
-        suffix = 1
-        username = base
-
-        while await users_collection.find_one({"username": username}):
-            username = f"{base}{suffix}"
-            suffix += 1
-        return username
+        usernames = await UserService._allocate_usernames(UserService._username_base(name, lastname))
+        return usernames[0]
 
     @staticmethod
-    async def list_users(limit: int, skip: int, page: int):
+    async def list_users(
+        limit: int,
+        skip: int,
+        page: int,
+        base_url: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        extra_query: Optional[List[Tuple[str, str]]] = None,
+        keep_ids: bool = False,
+    ):
         """
-            Retrieve a paginated list of users.
+            Retrieve a paginated list of users ordered by _id.
+
+            Without a cursor and with page > 0 the legacy skip/limit mode is used. Otherwise
+            the page is located by seeking on the _id index from an opaque cursor, so deep
+            pages cost the same as the first one, and next/previous carry cursors.
+            Reads use MONGO_LIST_READ_PREFERENCE (secondaryPreferred by default), so a
+            just-created user may appear after a short replication delay.
 
             Args:
                 - limit (int): Number of users per page.
-                - skip (int): Number of users to skip.
+                - skip (int): Number of users to skip (offset mode only).
                 - page (int): Current page number.
+                - base_url (Optional[str]): URL of the endpoint, used to build next/previous links.
+                - cursor (Optional[str]): Opaque cursor from a previous response.
+                - include_total (bool): Also count every user (an extra query).
+                - extra_query (Optional[List[Tuple[str, str]]]): Query pairs preserved in the links.
+                - keep_ids (bool): Leave _id in the results, e.g. to fingerprint the page.
 
             Returns:
                 - PaginatedResponse: Paginated list of user data.
+
+            Raises:
+                - HTTPException: 400 if the cursor is invalid.
             """
-        cursor = users_collection.find({}, {"_id": 0}).skip(skip).limit(limit)
-        users = [user async for user in cursor]
+        projection = {"password": 0}
+        base_url = base_url or ""
+        collection = users_collection.with_options(read_preference=LIST_READ_PREFERENCE)
+        query_suffix = "&include_total=true" if include_total else ""
+        if extra_query:
+            query_suffix += f"&{urlencode(extra_query)}"
+
+        if cursor is None and page > 0:
+            # Offset mode: fetch one extra document to know whether a next page exists
+            documents = collection.find({}, projection).sort("_id", ASCENDING).skip(skip).limit(limit + 1)
+            with mongo_operation_duration.time("users", "find"):
+                users = [user async for user in documents]
+            has_more = len(users) > limit
+            users = users[:limit]
+            next_link = f"{base_url}?limit={limit}&page={page + 1}{query_suffix}" if has_more else None
+            previous_link = f"{base_url}?limit={limit}&page={page - 1}{query_suffix}"
+        else:
+            direction, boundary = NEXT, None
+            if cursor is not None:
+                try:
+                    direction, key = decode_cursor(cursor)
+                    boundary = ObjectId(key)
+                except (ValueError, InvalidId):
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+            if direction == NEXT:
+                query = {"_id": {"$gt": boundary}} if boundary is not None else {}
+                documents = collection.find(query, projection).sort("_id", ASCENDING).limit(limit + 1)
+            else:
+                query = {"_id": {"$lt": boundary}}
+                documents = collection.find(query, projection).sort("_id", DESCENDING).limit(limit + 1)
+
+            with mongo_operation_duration.time("users", "find"):
+                users = [user async for user in documents]
+            has_more = len(users) > limit
+            users = users[:limit]
+            if direction == PREVIOUS:
+                users.reverse()
+
+            def link(link_direction: str, user: dict) -> str:
+                token = encode_cursor(link_direction, str(user["_id"]))
+                return f"{base_url}?limit={limit}&cursor={token}{query_suffix}"
+
+            has_next = has_more if direction == NEXT else boundary is not None
+            has_previous = boundary is not None if direction == NEXT else has_more
+            next_link = link(NEXT, users[-1]) if users and has_next else None
+            previous_link = link(PREVIOUS, users[0]) if users and has_previous else None
+
+        if not keep_ids:
+            for user in users:
+                user.pop("_id", None)
+
+        total = None
+        if include_total:
+            with mongo_operation_duration.time("users", "count_documents"):
+                total = await collection.count_documents({})
         return PaginatedResponse(
             results=users,
             limit=limit,
             page=page,
-            next=None,
-            previous=None
+            next=next_link,
+            previous=previous_link,
+            total=total,
         )
 
+    @staticmethod
+    async def export_users(batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+        """
+        Stream every user as NDJSON, consuming the Motor cursor one batch at a time
+        so memory stays constant regardless of the collection size.
+
+        Args:
+            - batch_size (int): Cursor batch size and number of lines per emitted chunk.
+
+        Yields:
+            - bytes: Chunks of newline-delimited JSON.
+        """
+        cursor = users_collection.find({}, {"_id": 0, "password": 0}).batch_size(batch_size)
+        lines = []
+        async for user in cursor:
+            lines.append(UserResponseModel(**user).model_dump_json())
+            if len(lines) >= batch_size:
+                yield ("\n".join(lines) + "\n").encode()
+                lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode()
+
     @staticmethod
     async def create_user(user: UserCreateModel) -> UserResponseModel:
         """
@@ -67,18 +329,31 @@ class UserService:
 
         Returns:
             - UserResponseModel: Created user data (without password).
+
+        Raises:
+            - HTTPException: 409 if no free username was found after USERNAME_ALLOCATION_RETRIES attempts.
         """
-        username = await UserService._generate_username(user.name, user.lastname)
-        hashed_password = hash_password(user.password)
+        hashed_password = await hash_password_async(user.password)
 
-        user_data = {
-            "name": user.name,
-            "lastname": user.lastname,
-            "username": username,
-            "password": hashed_password
-        }
-        await users_collection.insert_one(user_data)
+        # The unique index settles races with users created before the counter existed
+        for _ in range(USERNAME_ALLOCATION_RETRIES):
+            username = await UserService._generate_username(user.name, user.lastname)
+            user_data = {
+                "name": user.name,
+                "lastname": user.lastname,
+                "username": username,
+                "password": hashed_password
+            }
+            try:
+                with mongo_operation_duration.time("users", "insert_one"):
+                    await users_collection.insert_one(user_data)
+                break
+            except DuplicateKeyError:
+                continue
+        else:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Could not allocate a unique username")
 
+        UserService._cache_user(user_data)
         return UserResponseModel(
             name=user.name,
             lastname=user.lastname,
@@ -86,26 +361,240 @@ class UserService:
         )
 
     @staticmethod
-    async def login(username: str, password: str) -> UserResponseModel:
+    async def create_users_bulk(rows: List[Any], chunk_size: int = USER_BULK_CHUNK_SIZE) -> UserBulkResponse:
         """
-        Authenticate a user by verifying the username and hashed password.
+        Create many users at once.
+
+        Rows are validated individually, usernames are reserved per base with one counter
+        update each, passwords are hashed in the hashing pool and documents are written with
+        unordered insert_many in chunks. Rows whose username turns out to be taken are
+        re-allocated up to USERNAME_ALLOCATION_RETRIES times.
+
+        Hashing dominates: every row pays the interactive password cost (about 60 ms per
+        scrypt hash per hashing worker), submitted one batch per worker at a time so logins
+        are not starved while a large import runs.
+
+        Args:
+            - rows (List[Any]): Raw user objects (name, lastname, password).
+            - chunk_size (int): Documents per insert_many call.
+
+        Returns:
+            - UserBulkResponse: Per-row username or error, plus created/failed counts.
+        """
+        results: Dict[int, UserBulkResult] = {}
+        pending: Dict[int, UserCreateModel] = {}
+        for index, row in enumerate(rows):
+            try:
+                pending[index] = row if isinstance(row, UserCreateModel) else UserCreateModel.model_validate(row)
+            except ValidationError as error:
+                results[index] = UserBulkResult(index=index, error=_validation_message(error))
+
+        indexes = list(pending)
+        hashed = await hash_passwords_async([pending[index].password for index in indexes])
+        hashed_passwords = dict(zip(indexes, hashed))
+
+        semaphore = asyncio.Semaphore(USER_BULK_ALLOCATION_CONCURRENCY)
+
+        async def allocate(base: str, count: int) -> List[str]:
+            async with semaphore:
+                return await UserService._allocate_usernames(base, count)
+
+        for _ in range(USERNAME_ALLOCATION_RETRIES):
+            if not pending:
+                break
+
+            groups: Dict[str, List[int]] = {}
+            for index, user in pending.items():
+                groups.setdefault(UserService._username_base(user.name, user.lastname), []).append(index)
+            allocations = await asyncio.gather(*(allocate(base, len(members)) for base, members in groups.items()))
+
+            documents = []
+            for members, usernames in zip(groups.values(), allocations):
+                for index, username in zip(members, usernames):
+                    user = pending[index]
+                    documents.append((index, {
+                        "name": user.name,
+                        "lastname": user.lastname,
+                        "username": username,
+                        "password": hashed_passwords[index],
+                    }))
+
+            retry: Dict[int, UserCreateModel] = {}
+            for start in range(0, len(documents), chunk_size):
+                chunk = documents[start:start + chunk_size]
+                failed = {}
+                try:
+                    # insert_many adds _id to the dicts, so pass copies
+                    with mongo_operation_duration.time("users", "insert_many"):
+                        await users_collection.insert_many([dict(document) for _, document in chunk], ordered=False)
+                except BulkWriteError as error:
+                    failed = {write_error["index"]: write_error for write_error in error.details.get("writeErrors", [])}
+
+                for position, (index, document) in enumerate(chunk):
+                    write_error = failed.get(position)
+                    if write_error is None:
+                        # Imported users are cached when they first log in
+                        results[index] = UserBulkResult(index=index, username=document["username"])
+                    elif write_error.get("code") == DUPLICATE_KEY_ERROR:
+                        retry[index] = pending[index]
+                    else:
+                        results[index] = UserBulkResult(index=index, error=write_error.get("errmsg", "Write failed"))
+            pending = retry
+
+        for index in pending:
+            results[index] = UserBulkResult(index=index, error="Could not allocate a unique username")
+
+        ordered = [results[index] for index in sorted(results)]
+        created = sum(1 for result in ordered if result.error is None)
+        return UserBulkResponse(created=created, failed=len(ordered) - created, results=ordered)
+
+    @staticmethod
+    def _cache_user(user: dict) -> None:
+        if not USER_CACHE_ENABLED:
+            return
+        username = user["username"]
+        user_cache.set(("profile", username), {field: user.get(field) for field in PROFILE_FIELDS}, USER_CACHE_TTL)
+        user_cache.set(("verifier", username), user["password"], USER_CACHE_TTL)
+
+    @staticmethod
+    def invalidate_user(username: str) -> None:
+        """
+        Drop the cached profile and verifier of a user. Every path that changes or removes
+        a user document must call this after the write.
+
+        Args:
+            - username (str): Username whose entries are dropped.
+        """
+        user_cache.delete(("profile", username))
+        user_cache.delete(("verifier", username))
+
+    @staticmethod
+    async def _get_login_record(username: str) -> Optional[dict]:
+        """
+        Fetch the login projection of a user, from the user cache when possible. Misses are
+        always confirmed in MongoDB, so a rejection (which counts toward the login limits) never
+        comes from another worker's stale view; enumeration is bounded by the per-IP limit.
+
+        Args:
+            - username (str): Username to look up.
+
+        Returns:
+            - Optional[dict]: Username, name, lastname and password hash, or None if the user does not exist.
+        """
+        profile_key = ("profile", username)
+        if USER_CACHE_ENABLED:
+            profile = user_cache.get(profile_key)
+            if profile is not None:
+                verifier = user_cache.get(("verifier", username))
+                if verifier is not None:
+                    return {**profile.value, "password": verifier.value}
+
+        with mongo_operation_duration.time("users", "find_one"):
+            user = await users_collection.find_one({"username": username}, LOGIN_PROJECTION)
+
+        if user is not None:
+            UserService._cache_user(user)
+        return user
+
+    @staticmethod
+    async def close_store() -> None:
+        """
+        Close the shared rate-limit store, if one is configured. Called from the application lifespan.
+        """
+        if login_rate_limit_store is not None:
+            await login_rate_limit_store.close()
+
+    @staticmethod
+    async def _reserve_login_attempt(username: str, client_ip: Optional[str]) -> List[tuple]:
+        """
+        Count a login attempt against the username and client IP limits before touching
+        the database. Every attempt is recorded as a failure up front, so a concurrent burst
+        cannot pass the check before any of its failures is counted; the reservations are
+        given back when the attempt succeeds.
+
+        Returns:
+            - List[tuple]: (limiter, key, reserved_at) for each limit, for _release_login_attempt.
+
+        Raises:
+            - HTTPException: 429 with a Retry-After header.
+        """
+        checks = [(username_login_limiter, username)]
+        if client_ip:
+            checks.append((ip_login_limiter, client_ip))
+
+        reservations = []
+        for limiter, key in checks:
+            reserved_at = await limiter.acquire(key)
+            if reserved_at is None:
+                retry_after = await limiter.retry_after(key)
+                await UserService._release_login_attempt(reservations)
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many failed login attempts",
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+                )
+            reservations.append((limiter, key, reserved_at))
+        return reservations
+
+    @staticmethod
+    async def _release_login_attempt(reservations: List[tuple]) -> None:
+        for limiter, key, reserved_at in reservations:
+            await limiter.release(key, reserved_at)
+
+    @staticmethod
+    async def login(username: str, password: str, client_ip: Optional[str] = None) -> UserResponseModel:
+        """
+        Authenticate a user by fetching the record by username (from the user cache, or a
+        lookup covered by the username_login_covering index) and verifying the password hash in the hashing pool.
+        Unknown usernames are verified against a dummy hash, so response times do not reveal them.
+        Hashes in a legacy format or with outdated cost parameters are transparently
+        upgraded on a successful login.
+
+        Attempts are counted per username and per client IP in a sliding window as they
+        start, and only kept when they fail; once a limit is reached further attempts are
+        rejected without a database query.
 
         Args:
             - username (str): Provided username.
             - password (str): Provided plain password.
+            - client_ip (Optional[str]): Address of the caller, for the per-IP limit.
 
         Returns:
             - UserResponseModel: Authenticated user data (without password).
 
         Raises:
-            - HTTPException: 401 if credentials are invalid.
+            - HTTPException: 401 if credentials are invalid, 429 if too many attempts failed.
         """
-        hashed_password = hash_password(password)
-        user = await users_collection.find_one(
-            {"username": username, "password": hashed_password},
-            {"_id": 0, "password": 0}
-        )
+        reservations = []
+        if LOGIN_RATE_LIMIT_ENABLED:
+            reservations = await UserService._reserve_login_attempt(username, client_ip)
 
-        if not user:
+        try:
+            user = await UserService._get_login_record(username)
+            stored = user.get("password") if user else None
+            verified = await verify_password_async(password, stored or _DUMMY_HASH) and bool(stored)
+        except BaseException:
+            # Not a credential failure (e.g. MongoDB unavailable): don't count it
+            await UserService._release_login_attempt(reservations)
+            raise
+
+        if not verified:
+            # The reservations stay as the recorded failure
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
+        await UserService._release_login_attempt(reservations)
+        if LOGIN_RATE_LIMIT_ENABLED:
+            await username_login_limiter.reset(username)
+
+        if needs_rehash(user["password"]):
+            hashed_password = await hash_password_async(password)
+            with mongo_operation_duration.time("users", "update_one"):
+                result = await users_collection.update_one(
+                    {"username": username, "password": user["password"]}, {"$set": {"password": hashed_password}}
+                )
+            if result.modified_count:
+                UserService._cache_user({**user, "password": hashed_password})
+            else:
+                # The stored hash changed underneath us; reload it on the next login
+                UserService.invalidate_user(username)
         return UserResponseModel(**user)
@@ -0,0 +1,87 @@
+import pytest
+
+# Services
+from app.services.breed_catalogue import BreedCatalogue, parse_filter, parse_sort, tokenize
+
+
+BREEDS = [
+    {"id": "abys", "name": "Abyssinian", "origin": "Egypt", "temperament": "Active, Energetic, Gentle"},
+    {"id": "sava", "name": "Savannah", "origin": "United States", "temperament": "Curious, Social, Playful"},
+    {"id": "siam", "name": "Siamese", "origin": "Thailand", "alt_names": "Siam, Thai Cat", "temperament": "Active, Social"},
+    {"id": "sphy", "name": "Sphynx", "origin": "Canada", "temperament": "Loyal, Inquisitive"},
+]
+
+
+class TestBreedCatalogue:
+
+    @pytest.fixture
+    def catalogue(self):
+        return BreedCatalogue(BREEDS)
+
+    def test_tokenize_normalizes_case_and_accents(self):
+        assert tokenize("Chartreux, Ragdoll Férel") == ["chartreux", "ragdoll", "ferel"]
+
+    def test_get_by_id(self, catalogue):
+        assert catalogue.get("siam")["name"] == "Siamese"
+        assert catalogue.get("nope") is None
+
+    def test_search_matches_name_prefix(self, catalogue):
+        assert [breed["id"] for breed in catalogue.search("si")] == ["siam"]
+
+    def test_search_matches_alt_names_origin_and_temperament(self, catalogue):
+        assert [breed["id"] for breed in catalogue.search("thai")] == ["siam"]
+        assert [breed["id"] for breed in catalogue.search("egypt")] == ["abys"]
+        assert [breed["id"] for breed in catalogue.search("social")] == ["sava", "siam"]
+
+    def test_search_requires_every_token(self, catalogue):
+        assert [breed["id"] for breed in catalogue.search("active social")] == ["siam"]
+        assert catalogue.search("active canada") == []
+
+    def test_search_empty_query(self, catalogue):
+        assert catalogue.search("  ") == []
+
+
+TRAIT_BREEDS = [
+    {"id": "a", "name": "Alpha", "origin": "Egypt", "country_code": "EG", "energy_level": 5, "indoor": 0, "affection_level": 3},
+    {"id": "b", "name": "Bravo", "origin": "Canada", "country_code": "CA", "energy_level": 3, "indoor": 1, "affection_level": 5},
+    {"id": "c", "name": "Charlie", "origin": "egypt", "country_code": "EG", "energy_level": 4, "indoor": 1, "affection_level": 5},
+    {"id": "d", "name": "Delta", "origin": "Canada", "country_code": "CA"},
+]
+
+
+class TestBreedCatalogueQuery:
+
+    @pytest.fixture
+    def catalogue(self):
+        return BreedCatalogue(TRAIT_BREEDS)
+
+    @staticmethod
+    def ids(breeds):
+        return [breed["id"] for breed in breeds]
+
+    def test_range_filter(self, catalogue):
+        assert self.ids(catalogue.query([parse_filter("energy_level>=4")])) == ["a", "c"]
+        assert self.ids(catalogue.query([parse_filter("energy_level<4")])) == ["b"]
+
+    def test_flag_filter_uses_known_values_only(self, catalogue):
+        assert self.ids(catalogue.query([parse_filter("indoor=1")])) == ["b", "c"]
+        assert self.ids(catalogue.query([parse_filter("indoor=0")])) == ["a"]
+
+    def test_origin_and_country_code_filters(self, catalogue):
+        assert self.ids(catalogue.query(origin="EGYPT")) == ["a", "c"]
+        assert self.ids(catalogue.query(country_code="ca", filters=[parse_filter("indoor=1")])) == ["b"]
+
+    def test_multi_key_sort_puts_missing_last(self, catalogue):
+        breeds = catalogue.query(sort=parse_sort("-affection_level,-energy_level"))
+        assert self.ids(breeds) == ["c", "b", "a", "d"]
+
+    def test_sort_by_name_descending(self, catalogue):
+        assert self.ids(catalogue.query(sort=parse_sort("-name"))) == ["d", "c", "b", "a"]
+
+    def test_invalid_expressions(self):
+        with pytest.raises(ValueError):
+            parse_filter("energy_level~3")
+        with pytest.raises(ValueError):
+            parse_filter("colour=3")
+        with pytest.raises(ValueError):
+            parse_sort("colour")
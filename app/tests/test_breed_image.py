@@ -0,0 +1,149 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import HTTPException, status
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Services
+from app.services import breed_image
+from app.services.breed_image import BreedImageService
+
+# Utils
+from app.utils.image_cache import DiskImageCache
+
+
+IMAGE_URL = "https://cdn2.thecatapi.com/images/O3btzLlsO.png"
+
+
+def upstream(breed=None, metadata=None):
+    """
+    Route mocked AsyncClient.get calls: breed detail, then image metadata.
+    """
+    async def get(url, **kwargs):
+        response = MagicMock(status_code=200, headers={})
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value=metadata if "/images/" in url else breed)
+        return response
+
+    return get
+
+
+def cdn(image=b"png-bytes", image_status=200, headers=None):
+    """
+    Answer mocked streamed AsyncClient.send calls for the CDN download, a few bytes per chunk.
+    """
+    async def send(request, **kwargs):
+        response = MagicMock(status_code=image_status, headers={"content-type": "image/png", **(headers or {})})
+        response.raise_for_status = MagicMock(
+            side_effect=httpx.HTTPStatusError("error", request=request, response=response)
+            if image_status >= 400 else None
+        )
+
+        async def aiter_bytes():
+            for start in range(0, len(image), 4):
+                yield image[start:start + 4]
+
+        response.aiter_bytes = aiter_bytes
+        response.aclose = AsyncMock()
+        return response
+
+    return send
+
+
+@pytest.fixture(autouse=True)
+def image_download(mock_breed_httpx_send):
+    mock_breed_httpx_send.side_effect = cdn()
+    yield mock_breed_httpx_send
+
+
+@pytest.fixture(autouse=True)
+def disk_cache(tmp_path):
+    cache = DiskImageCache(str(tmp_path / "images"), thumbnail_size=64)
+    with patch.object(breed_image, "image_cache", cache):
+        yield cache
+
+
+@pytest.mark.asyncio
+class TestBreedImageService:
+
+    async def test_get_image_downloads_once_and_serves_from_disk(self, mock_breed_httpx_get, image_download, disk_cache):
+        mock_breed_httpx_get.side_effect = upstream(
+            breed={"id": "beng", "name": "Bengal", "reference_image_id": "O3btzLlsO"},
+            metadata={"id": "O3btzLlsO", "url": IMAGE_URL},
+        )
+
+        path, media_type = await BreedImageService.get_image("beng")
+        again, _ = await BreedImageService.get_image("beng")
+
+        assert media_type == "image/png"
+        assert path == again == disk_cache.find("O3btzLlsO")
+        assert image_download.await_count == 1
+        assert str(image_download.await_args.args[0].url) == IMAGE_URL
+
+    async def test_concurrent_requests_share_one_download(self, mock_breed_httpx_get, image_download):
+        mock_breed_httpx_get.side_effect = upstream(metadata={"id": "O3btzLlsO", "url": IMAGE_URL})
+
+        paths = await asyncio.gather(*(BreedImageService.ensure_image("O3btzLlsO") for _ in range(5)))
+
+        assert len(set(paths)) == 1
+        assert image_download.await_count == 1
+
+    async def test_thumbnail_falls_back_to_original_without_pillow(self, mock_breed_httpx_get, disk_cache):
+        mock_breed_httpx_get.side_effect = upstream(metadata={"id": "O3btzLlsO", "url": IMAGE_URL})
+
+        with patch("app.utils.image_cache.Image", None):
+            path = await BreedImageService.ensure_image("O3btzLlsO", thumbnail=True)
+
+        assert path == disk_cache.find("O3btzLlsO")
+
+    async def test_breed_without_image_is_not_found(self, mock_breed_httpx_get):
+        mock_breed_httpx_get.side_effect = upstream(breed={"id": "beng", "name": "Bengal"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await BreedImageService.get_image("beng")
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_failed_download_is_bad_gateway(self, mock_breed_httpx_get, image_download):
+        mock_breed_httpx_get.side_effect = upstream(metadata={"id": "O3btzLlsO", "url": IMAGE_URL})
+        image_download.side_effect = cdn(image_status=500)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await BreedImageService.ensure_image("O3btzLlsO")
+
+        assert exc_info.value.status_code == status.HTTP_502_BAD_GATEWAY
+
+    async def test_oversized_download_is_aborted(self, mock_breed_httpx_get, image_download, disk_cache):
+        mock_breed_httpx_get.side_effect = upstream(metadata={"id": "O3btzLlsO", "url": IMAGE_URL})
+
+        for response in (cdn(image=b"x" * 20), cdn(image=b"x", headers={"content-length": "20"})):
+            image_download.side_effect = response
+            with patch.object(breed_image, "BREED_IMAGE_MAX_BYTES", 10), pytest.raises(HTTPException) as exc_info:
+                await BreedImageService.ensure_image("O3btzLlsO")
+
+            assert exc_info.value.status_code == status.HTTP_502_BAD_GATEWAY
+            assert exc_info.value.detail == "Image too large"
+        assert disk_cache.find("O3btzLlsO") is None
+
+    async def test_undecodable_image_falls_back_to_original(self, mock_breed_httpx_get, disk_cache):
+        mock_breed_httpx_get.side_effect = upstream(metadata={"id": "O3btzLlsO", "url": IMAGE_URL})
+
+        path = await BreedImageService.ensure_image("O3btzLlsO", thumbnail=True)
+
+        assert path == disk_cache.find("O3btzLlsO")
+        assert disk_cache.find("O3btzLlsO", thumbnail=True) is None
+
+    async def test_prefetch_catalogue_skips_failures(self):
+        catalogue = MagicMock(breeds=(
+            {"id": "beng", "reference_image_id": "one"},
+            {"id": "siam", "reference_image_id": "two"},
+            {"id": "abys"},
+        ))
+        ensure = AsyncMock(side_effect=["/tmp/one.thumb.jpg", HTTPException(status_code=502)])
+
+        with patch("app.services.breed.BreedService.get_catalogue", AsyncMock(return_value=catalogue)), \
+                patch.object(BreedImageService, "ensure_image", ensure):
+            cached = await BreedImageService.prefetch_catalogue(concurrency=2)
+
+        assert cached == 1
+        assert [call.args[0] for call in ensure.await_args_list] == ["one", "two"]
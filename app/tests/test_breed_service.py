@@ -1,16 +1,24 @@
 # FastAPI
+import asyncio
 import httpx
+import json
 from fastapi import HTTPException, status
 
 import pytest
+from pydantic import TypeAdapter
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 # Models
-from app.models.common import PaginationParams
+from app.models.breed import BreedPage, BreedQueryParams
+from app.models.common import FieldSelection, PaginationParams
 
 # Services
-from app.services.breed import BreedService
+from app.services import breed as breed_service
+from app.services.breed import BreedService, breed_cache
+
+# Utils
+from app.utils.cache_store import MemoryCacheStore, SQLiteCacheStore, StoreNamespace
 
 
 
@@ -140,3 +148,289 @@ class TestBreedService:
         response = await BreedService.search_breeds("query", page_number_1, DummyRequest())
         assert response.previous is not None
         assert response.next is None
+
+    async def test_get_breed_by_id_served_from_cache(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=1)
+        mock_breed_httpx_get.return_value.json = MagicMock(return_value=mock_data[0])
+        mock_breed_httpx_get.return_value.status_code = status.HTTP_200_OK
+        mock_breed_httpx_get.return_value.raise_for_status = MagicMock()
+
+        await BreedService.get_breed_by_id("beng")
+        data = await BreedService.get_breed_by_id("beng")
+
+        assert data["id"] == mock_data[0]["id"]
+        mock_breed_httpx_get.assert_awaited_once()
+
+    async def test_concurrent_identical_searches_share_upstream_call(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=1)
+        self.setup_mock_response(mock_breed_httpx_get, mock_data)
+        pagination = PaginationParams(limit=10, page=0)
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_breed_httpx_get.return_value
+        mock_breed_httpx_get.side_effect = slow_get
+
+        await asyncio.gather(
+            *(BreedService.search_breeds("sia", pagination, DummyRequest()) for _ in range(5))
+        )
+
+        mock_breed_httpx_get.assert_awaited_once()
+
+    async def test_get_all_breeds_paginates_full_list_locally(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=3)
+        self.setup_mock_response(mock_breed_httpx_get, mock_data)
+
+        pagination = PaginationParams(limit=2, page=1)
+        data = await BreedService.get_all_breeds(pagination, DummyRequest())
+
+        assert [breed.id for breed in data.results] == [mock_data[2]["id"]]
+        assert data.next is None
+        assert data.previous.endswith("page=0")
+        assert mock_breed_httpx_get.await_args.kwargs["params"] is None
+
+    async def test_snapshot_mode_serves_lookup_and_search_locally(self, mock_breed_httpx_get):
+        mock_data = [
+            {"id": "siam", "name": "Siamese", "origin": "Thailand"},
+            {"id": "sphy", "name": "Sphynx", "origin": "Canada"},
+        ]
+        self.setup_mock_response(mock_breed_httpx_get, mock_data)
+
+        with patch("app.services.breed.BREED_SNAPSHOT_ENABLED", True):
+            await BreedService.refresh_snapshot()
+            breed = await BreedService.get_breed_by_id("sphy")
+            found = await BreedService.search_breeds("thai", PaginationParams(limit=5, page=0), DummyRequest())
+
+            with pytest.raises(HTTPException) as exc:
+                await BreedService.get_breed_by_id("nope")
+
+        assert breed["name"] == "Sphynx"
+        assert [result.id for result in found.results] == ["siam"]
+        assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+        mock_breed_httpx_get.assert_awaited_once()
+
+    async def test_get_all_breeds_filtered_and_sorted(self, mock_breed_httpx_get):
+        mock_data = [
+            {"id": "a", "name": "Alpha", "energy_level": 2},
+            {"id": "b", "name": "Bravo", "energy_level": 5},
+            {"id": "c", "name": "Charlie", "energy_level": 4},
+        ]
+        self.setup_mock_response(mock_breed_httpx_get, mock_data)
+        breed_query = BreedQueryParams(filters=["energy_level>=3"], sort="-energy_level", origin=None, country_code=None)
+
+        data = await BreedService.get_all_breeds(PaginationParams(limit=1, page=0), DummyRequest(), breed_query)
+
+        assert [breed.id for breed in data.results] == ["b"]
+        assert "filter=energy_level%3E%3D3" in data.next
+        assert "sort=-energy_level" in data.next
+
+    async def test_get_all_breeds_invalid_filter(self, mock_breed_httpx_get, fake):
+        self.setup_mock_response(mock_breed_httpx_get, self.generate_mock_breeds(fake, count=1))
+        breed_query = BreedQueryParams(filters=["colour=3"], sort=None, origin=None, country_code=None)
+
+        with pytest.raises(HTTPException) as exc:
+            await BreedService.get_all_breeds(PaginationParams(limit=1, page=0), DummyRequest(), breed_query)
+        assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_get_breeds_by_ids_dedupes_and_reports_errors(self, mock_breed_httpx_get):
+        found = MagicMock(status_code=status.HTTP_200_OK, raise_for_status=MagicMock())
+        found.json = MagicMock(return_value={"id": "beng", "name": "Bengal"})
+        missing = MagicMock(status_code=status.HTTP_404_NOT_FOUND)
+
+        async def get(url, **kwargs):
+            return found if url.endswith("/beng") else missing
+        mock_breed_httpx_get.side_effect = get
+
+        data = await BreedService.get_breeds_by_ids(["beng", "nope", "beng", " "])
+
+        assert [breed.id for breed in data.results] == ["beng"]
+        assert [(error.id, error.status_code) for error in data.errors] == [("nope", status.HTTP_404_NOT_FOUND)]
+        assert mock_breed_httpx_get.await_count == 2
+
+    async def test_get_breeds_by_ids_never_sends_malformed_ids_upstream(self, mock_breed_httpx_get):
+        found = MagicMock(status_code=status.HTTP_200_OK, raise_for_status=MagicMock())
+        found.json = MagicMock(return_value={"id": "beng", "name": "Bengal"})
+        mock_breed_httpx_get.return_value = found
+
+        data = await BreedService.get_breeds_by_ids(["beng", "../votes", "..%2Fvotes", "beng/../../votes"])
+
+        assert [breed.id for breed in data.results] == ["beng"]
+        assert [(error.id, error.status_code) for error in data.errors] == [
+            ("../votes", status.HTTP_400_BAD_REQUEST),
+            ("..%2Fvotes", status.HTTP_400_BAD_REQUEST),
+            ("beng/../../votes", status.HTTP_400_BAD_REQUEST),
+        ]
+        assert [call.args[0].rsplit("/", 1)[-1] for call in mock_breed_httpx_get.await_args_list] == ["beng"]
+
+    async def test_get_breeds_by_ids_resolves_from_loaded_catalogue(self, mock_breed_httpx_get):
+        catalogue = [{"id": "beng", "name": "Bengal"}, {"id": "siam", "name": "Siamese"}]
+        detail = {"id": "abys", "name": "Abyssinian"}
+
+        async def get(url, **kwargs):
+            response = MagicMock(status_code=status.HTTP_200_OK, raise_for_status=MagicMock(), headers={})
+            response.json = MagicMock(return_value=catalogue if url.endswith("/breeds") else detail)
+            return response
+        mock_breed_httpx_get.side_effect = get
+        await BreedService.get_catalogue()
+
+        data = await BreedService.get_breeds_by_ids(["siam", "abys", "beng"])
+
+        assert [breed.id for breed in data.results] == ["siam", "abys", "beng"]
+        assert [call.args[0].rsplit("/", 1)[-1] for call in mock_breed_httpx_get.await_args_list] == ["breeds", "abys"]
+
+    async def test_get_breeds_by_ids_rejects_too_many_ids(self):
+        with patch("app.services.breed.BREED_BATCH_MAX_IDS", 2):
+            with pytest.raises(HTTPException) as exc:
+                await BreedService.get_breeds_by_ids(["a", "b", "c"])
+        assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_export_breeds_streams_ndjson_in_batches(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=3)
+        self.setup_mock_response(mock_breed_httpx_get, mock_data)
+
+        chunks = [chunk async for chunk in await BreedService.export_breeds(batch_size=2)]
+        lines = b"".join(chunks).decode().splitlines()
+
+        assert len(chunks) == 2
+        assert [json.loads(line)["id"] for line in lines] == [breed["id"] for breed in mock_data]
+
+    async def test_persistent_store_warms_cache_after_restart(self, mock_breed_httpx_get, fake, tmp_path):
+        mock_data = self.generate_mock_breeds(fake, count=1)
+        mock_breed_httpx_get.return_value.json = MagicMock(return_value=mock_data[0])
+        mock_breed_httpx_get.return_value.status_code = status.HTTP_200_OK
+        mock_breed_httpx_get.return_value.raise_for_status = MagicMock()
+        store = SQLiteCacheStore(str(tmp_path / "breeds.sqlite3"))
+
+        with patch("app.services.breed.breed_namespace", StoreNamespace(store, "breeds")):
+            await BreedService.get_breed_by_id("beng")
+            await asyncio.gather(*breed_service._store_writes)
+
+            # Simulate a restart: empty in-memory cache, warmed from disk
+            breed_cache.clear()
+            assert await BreedService.warm_cache() == 1
+            data = await BreedService.get_breed_by_id("beng")
+
+        await store.close()
+        assert data["id"] == mock_data[0]["id"]
+        mock_breed_httpx_get.assert_awaited_once()
+
+    async def test_shared_store_is_read_through_by_other_workers(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=1)
+        mock_breed_httpx_get.return_value.json = MagicMock(return_value=mock_data[0])
+        mock_breed_httpx_get.return_value.status_code = status.HTTP_200_OK
+        mock_breed_httpx_get.return_value.raise_for_status = MagicMock()
+
+        with patch("app.services.breed.breed_namespace", StoreNamespace(MemoryCacheStore(), "breeds")):
+            await BreedService.get_breed_by_id("beng")
+            await asyncio.gather(*breed_service._store_writes)
+
+            # Another worker: nothing local, but the shared tier already holds the breed
+            breed_cache.clear()
+            data = await BreedService.get_breed_by_id("beng")
+
+        assert data["id"] == mock_data[0]["id"]
+        mock_breed_httpx_get.assert_awaited_once()
+
+    async def test_unresponsive_shared_store_is_a_miss(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=1)
+        mock_breed_httpx_get.return_value.json = MagicMock(return_value=mock_data[0])
+        mock_breed_httpx_get.return_value.status_code = status.HTTP_200_OK
+        mock_breed_httpx_get.return_value.raise_for_status = MagicMock()
+        store = MemoryCacheStore()
+
+        async def hang(*args):
+            await asyncio.Event().wait()
+        store.get = hang
+        store.get_version = hang
+
+        with patch("app.services.breed.breed_namespace", StoreNamespace(store, "breeds")), \
+                patch("app.services.breed.BREED_CACHE_STORE_TIMEOUT", 0.05):
+            data = await asyncio.wait_for(BreedService.get_breed_by_id("beng"), 1)
+            with pytest.raises(asyncio.TimeoutError):
+                await BreedService.warm_cache()
+
+        assert data["id"] == mock_data[0]["id"]
+
+    async def test_invalidation_reaches_other_workers(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=1)
+        mock_breed_httpx_get.return_value.json = MagicMock(return_value=mock_data[0])
+        mock_breed_httpx_get.return_value.status_code = status.HTTP_200_OK
+        mock_breed_httpx_get.return_value.raise_for_status = MagicMock()
+        store = MemoryCacheStore()
+        other_worker = StoreNamespace(store, "breeds")
+
+        with patch("app.services.breed.breed_namespace", StoreNamespace(store, "breeds")):
+            await BreedService.get_breed_by_id("beng")
+            await asyncio.gather(*breed_service._store_writes)
+            assert not await BreedService.sync_shared_cache()
+
+            await other_worker.invalidate()
+            assert await BreedService.sync_shared_cache()
+            assert len(breed_cache) == 0
+            await BreedService.get_breed_by_id("beng")
+
+        assert mock_breed_httpx_get.await_count == 2
+
+    async def test_refresh_revalidates_with_upstream_etag(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=2)
+        self.setup_mock_response(mock_breed_httpx_get, mock_data)
+        mock_breed_httpx_get.return_value.status_code = status.HTTP_200_OK
+        mock_breed_httpx_get.return_value.headers = {"etag": '"v1"'}
+
+        first = await BreedService._get_json("/breeds", ttl=60)
+        mock_breed_httpx_get.return_value.status_code = status.HTTP_304_NOT_MODIFIED
+        mock_breed_httpx_get.return_value.json = MagicMock(side_effect=AssertionError("304 has no body"))
+        second = await BreedService._get_json("/breeds", ttl=60, refresh=True)
+
+        assert second is first
+        assert mock_breed_httpx_get.await_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    async def test_page_encoding_reuses_ingest_models_and_matches_response_model(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=3)
+        self.setup_mock_response(mock_breed_httpx_get, mock_data)
+
+        pagination = PaginationParams(limit=2, page=0)
+        page = await BreedService.get_all_breeds(pagination, DummyRequest())
+        catalogue = await BreedService.get_catalogue()
+
+        assert page.results[0] is catalogue.models[0]
+        assert BreedService.encode_page(page) == TypeAdapter(BreedPage).dump_json(page)
+        assert BreedService.encode_breed(catalogue.breeds[1]) == catalogue.encoded[1]
+
+    async def test_sparse_fields_project_page_and_survive_links(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=3)
+        self.setup_mock_response(mock_breed_httpx_get, mock_data)
+        selection = FieldSelection(fields="name,id,origin", exclude_none=True)
+
+        page = await BreedService.get_all_breeds(PaginationParams(limit=2, page=0), DummyRequest(), selection=selection)
+        body = json.loads(BreedService.encode_page(page, selection))
+
+        assert body["results"] == [{"id": breed["id"], "name": breed["name"]} for breed in mock_data[:2]]
+        assert "fields=id%2Cname%2Corigin&exclude_none=true" in body["next"]
+        assert body["previous"] is None
+
+    async def test_unknown_sparse_field_rejected(self, mock_breed_httpx_get, fake):
+        self.setup_mock_response(mock_breed_httpx_get, self.generate_mock_breeds(fake, count=1))
+        page = await BreedService.get_all_breeds(PaginationParams(limit=1, page=0), DummyRequest())
+
+        with pytest.raises(HTTPException) as exc:
+            BreedService.encode_page(page, FieldSelection(fields="id,password", exclude_none=False))
+
+        assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_open_circuit_serves_cached_data_and_fails_fast_on_misses(self, mock_breed_httpx_get, fake):
+        mock_data = self.generate_mock_breeds(fake, count=1)
+        self.setup_mock_response(mock_breed_httpx_get, mock_data[0])
+        mock_breed_httpx_get.return_value.status_code = status.HTTP_200_OK
+        cached = await BreedService.get_breed_by_id("beng")
+
+        breaker = breed_service.breed_upstream.breaker
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+        assert await BreedService.get_breed_by_id("beng") == cached
+        with pytest.raises(HTTPException) as exc:
+            await BreedService.get_breed_by_id("siam")
+        assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert int(exc.value.headers["Retry-After"]) >= 1
+        mock_breed_httpx_get.assert_awaited_once()
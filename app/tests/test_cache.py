@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+# Utils
+from app.utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+class TestTTLCache:
+
+    async def test_get_or_load_caches_value(self):
+        cache = TTLCache(max_entries=10, max_bytes=1024)
+        loader = AsyncMock(return_value={"id": "beng"})
+
+        first = await cache.get_or_load("key", loader, ttl=60)
+        second = await cache.get_or_load("key", loader, ttl=60)
+
+        assert first == second == {"id": "beng"}
+        loader.assert_awaited_once()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_expired_entry_is_reloaded(self):
+        clock = FakeClock()
+        cache = TTLCache(max_entries=10, max_bytes=1024, clock=clock)
+        cache.set("key", "old", ttl=10)
+
+        clock.now = 11
+        assert cache.get("key") is None
+
+    async def test_stale_entry_served_and_refreshed_in_background(self):
+        clock = FakeClock()
+        cache = TTLCache(max_entries=10, max_bytes=1024, clock=clock)
+        cache.set("key", "old", ttl=10, stale_ttl=100)
+        loader = AsyncMock(return_value="new")
+
+        clock.now = 20
+        value = await cache.get_or_load("key", loader, ttl=10, stale_ttl=100)
+        await asyncio.sleep(0)
+
+        assert value == "old"
+        assert cache.stats()["stale_hits"] == 1
+        assert cache.get("key").value == "new"
+
+    async def test_lru_eviction_by_entry_count(self):
+        cache = TTLCache(max_entries=2, max_bytes=1024)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats()["evictions"] == 1
+
+    async def test_lru_eviction_by_bytes(self):
+        cache = TTLCache(max_entries=10, max_bytes=10)
+        cache.set("a", "x", ttl=60, size=6)
+        cache.set("b", "y", ttl=60, size=6)
+
+        assert "a" not in cache
+        assert cache.size_bytes == 6
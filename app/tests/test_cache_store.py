@@ -0,0 +1,200 @@
+import asyncio
+import time
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+# Stand-ins
+from benchmarks.memory_kv import MemoryKVServer
+
+# Utils
+from app.utils.cache_store import (
+    KVCacheStore,
+    KVError,
+    MemoryCacheStore,
+    MongoCacheStore,
+    SQLiteCacheStore,
+    StoreNamespace,
+)
+
+
+@pytest.mark.asyncio
+class TestSQLiteCacheStore:
+
+    @pytest.fixture
+    async def store(self, tmp_path):
+        store = SQLiteCacheStore(str(tmp_path / "cache" / "breeds.sqlite3"))
+        yield store
+        await store.close()
+
+    async def test_set_and_get(self, store):
+        now = time.time()
+        await store.set("/breeds?", [{"id": "beng"}], now + 60, now + 120)
+
+        entry = await store.get("/breeds?")
+
+        assert entry.value == [{"id": "beng"}]
+        assert entry.fresh_until == now + 60
+
+    async def test_expired_entries_are_not_returned(self, store):
+        now = time.time()
+        await store.set("old", {"id": "old"}, now - 20, now - 10)
+        await store.set("stale", {"id": "stale"}, now - 10, now + 60)
+
+        assert await store.get("old") is None
+        assert [entry.key for entry in await store.load(limit=10)] == ["stale"]
+
+    async def test_survives_reopen(self, tmp_path):
+        path = str(tmp_path / "breeds.sqlite3")
+        now = time.time()
+        first = SQLiteCacheStore(path)
+        await first.set("key", {"id": "beng"}, now + 60, now + 120)
+        await first.close()
+
+        second = SQLiteCacheStore(path)
+        assert (await second.get("key")).value == {"id": "beng"}
+        await second.close()
+
+    async def test_versions_and_prefix_load(self, store):
+        now = time.time()
+        await store.set("breeds:v0:a", 1, now + 60, now + 120)
+        await store.set("users:v0:a", 2, now + 60, now + 120)
+
+        assert await store.get_version("breeds") == 0
+        assert await store.bump_version("breeds") == 1
+        assert await store.bump_version("breeds") == 2
+        assert [entry.key for entry in await store.load(limit=10, prefix="breeds:")] == ["breeds:v0:a"]
+
+
+@pytest.mark.asyncio
+class TestMongoCacheStore:
+
+    async def test_set_uses_date_for_ttl_index(self):
+        collection = MagicMock(create_index=AsyncMock(), replace_one=AsyncMock())
+        store = MongoCacheStore(collection)
+        now = time.time()
+
+        await store.set("key", {"id": "beng"}, now + 60, now + 120)
+
+        collection.create_index.assert_awaited_once_with("stale_until", expireAfterSeconds=0, name="stale_until_ttl")
+        document = collection.replace_one.await_args.args[1]
+        assert isinstance(document["stale_until"], datetime)
+        assert document["value"] == {"id": "beng"}
+
+    async def test_get_converts_document(self):
+        stale_until = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+        document = {"_id": "key", "value": [1], "fresh_until": 10.0, "stale_until": stale_until}
+        collection = MagicMock(find_one=AsyncMock(return_value=document))
+
+        entry = await MongoCacheStore(collection).get("key")
+
+        assert entry.value == [1]
+        assert entry.stale_until == stale_until.replace(tzinfo=timezone.utc).timestamp()
+
+    async def test_bump_version_increments_a_version_document(self):
+        collection = MagicMock(find_one_and_update=AsyncMock(return_value={"_id": "version:breeds", "version": 3}))
+
+        assert await MongoCacheStore(collection).bump_version("breeds") == 3
+        assert collection.find_one_and_update.await_args.args[:2] == ({"_id": "version:breeds"}, {"$inc": {"version": 1}})
+
+    async def test_incr_upserts_an_expiring_counter(self):
+        collection = MagicMock(
+            create_index=AsyncMock(),
+            find_one_and_update=AsyncMock(return_value={"_id": "counter:login:jdoe:1", "count": 2}),
+        )
+
+        assert await MongoCacheStore(collection).incr("login:jdoe:1", 1, time.time() + 60) == 2
+        query, update = collection.find_one_and_update.await_args.args
+        assert query == {"_id": "counter:login:jdoe:1"}
+        assert update["$inc"] == {"count": 1}
+        assert isinstance(update["$setOnInsert"]["stale_until"], datetime)
+
+
+@pytest.mark.asyncio
+class TestStoreNamespace:
+
+    async def test_invalidation_hides_previous_version_from_every_process(self):
+        store = MemoryCacheStore()
+        worker, other_worker = StoreNamespace(store, "breeds"), StoreNamespace(store, "breeds")
+        now = time.time()
+        await worker.set("/breeds?", [{"id": "beng"}], now + 60, now + 120)
+
+        assert (await other_worker.get("/breeds?")).value == [{"id": "beng"}]
+        assert [entry.key for entry in await other_worker.load(limit=10)] == ["/breeds?"]
+
+        await other_worker.invalidate()
+
+        assert await worker.sync() is True
+        assert await worker.sync() is False
+        assert await worker.get("/breeds?") is None
+        assert await worker.load(limit=10) == []
+
+
+@pytest.mark.asyncio
+class TestKVCacheStore:
+
+    @pytest.fixture
+    async def server(self):
+        server = MemoryKVServer()
+        port = await server.start()
+        yield server, port
+        await server.stop()
+
+    async def test_round_trip_through_stand_in(self, server):
+        kv_server, port = server
+        store = KVCacheStore(f"kv://127.0.0.1:{port}/1")
+        now = time.time()
+
+        await store.set("key", {"id": "beng"}, now + 60, now + 120)
+        await store.set("expired", {"id": "old"}, now - 20, now - 10)
+
+        assert (await store.get("key")).value == {"id": "beng"}
+        assert await store.get("expired") is None
+        assert await store.bump_version("breeds") == 1
+        assert await store.get_version("breeds") == 1
+        await store.delete("key")
+        assert await store.get("key") is None
+        assert list(kv_server.databases[1]) == [b"version:breeds"]
+        await store.close()
+
+    async def test_counters_expire_on_the_server(self, server):
+        _, port = server
+        store = KVCacheStore(f"kv://127.0.0.1:{port}")
+
+        assert await store.incr("login:jdoe:1", 1, time.time() + 60) == 1
+        assert await store.incr("login:jdoe:1", 2, time.time() + 60) == 3
+        assert await store.incr("login:gone:1", 1, time.time() - 1) == 1
+        assert await store.incr("login:gone:1", 0, time.time() + 60) == 0
+        await store.close()
+
+    async def test_concurrent_commands_reuse_pooled_connections(self, server):
+        _, port = server
+        store = KVCacheStore(f"kv://127.0.0.1:{port}", max_connections=3)
+
+        await asyncio.gather(*(store.get(f"key-{index}") for index in range(20)))
+
+        assert len(store._idle) <= 3
+        await store.close()
+
+    async def test_unresponsive_server_times_out(self):
+        async def never_reply(reader, writer):
+            await reader.read()
+
+        server = await asyncio.start_server(never_reply, "127.0.0.1", 0)
+        store = KVCacheStore(f"kv://127.0.0.1:{server.sockets[0].getsockname()[1]}", timeout=0.05)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await store.get("key")
+        assert store._idle == []
+        await store.close()
+        server.close()
+        await server.wait_closed()
+
+    async def test_error_reply_is_raised(self, server):
+        _, port = server
+        store = KVCacheStore(f"kv://127.0.0.1:{port}")
+
+        with pytest.raises(KVError):
+            await store.execute("NOPE")
+        assert await store.get("key") is None
+        await store.close()
@@ -0,0 +1,179 @@
+import pytest
+from fastapi import Request, status
+from pydantic import TypeAdapter
+from unittest.mock import AsyncMock, patch
+import gzip
+
+# Models
+from app.models.breed import BreedModel
+from app.models.common import FieldSelection, PaginatedResponse, PaginationParams
+
+# Routers
+from app.routers import users as users_router
+
+# Utils
+from app.utils.cache import TTLCache
+from app.utils.http_cache import (
+    cached_response,
+    etag_matches,
+    fingerprint_etag,
+    make_etag,
+    make_representation,
+    not_modified,
+    representation_key,
+    respond,
+)
+
+
+def make_request(query: bytes = b"", if_none_match: str = None, **extra_headers: str) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    headers += [(name.replace("_", "-").encode(), value.encode()) for name, value in extra_headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/breeds/beng", "query_string": query, "headers": headers})
+
+
+@pytest.mark.asyncio
+class TestHttpCache:
+
+    async def test_etag_matching_handles_lists_wildcards_and_weak_tags(self):
+        etag = make_etag(b"body")
+
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches(f"W/{etag}", etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+    async def test_cached_response_serializes_once_and_answers_304(self):
+        cache = TTLCache(max_entries=10, max_bytes=1024 * 1024)
+        encode = TypeAdapter(BreedModel).dump_json
+        produce = AsyncMock(return_value=BreedModel(id="beng", name="Bengal"))
+
+        first = await cached_response(make_request(), cache, 60, encode, produce, "public, max-age=60")
+        etag = first.headers["etag"]
+        second = await cached_response(make_request(if_none_match=etag), cache, 60, encode, produce, "public")
+
+        produce.assert_awaited_once()
+        assert first.status_code == status.HTTP_200_OK
+        assert first.headers["cache-control"] == "public, max-age=60"
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second.body == b""
+        assert second.headers["etag"] == etag
+
+    async def test_equivalent_query_strings_share_a_representation(self):
+        cache = TTLCache(max_entries=10, max_bytes=1024 * 1024)
+        encode = TypeAdapter(BreedModel).dump_json
+        produce = AsyncMock(return_value=BreedModel(id="beng", name="Bengal"))
+
+        await cached_response(make_request(b"a=1&b=2"), cache, 60, encode, produce, "public")
+        await cached_response(make_request(b"b=2&a=1"), cache, 60, encode, produce, "public")
+
+        produce.assert_awaited_once()
+
+    async def test_representation_etag_follows_content(self):
+        bengal = make_representation(b'{"id":"beng"}')
+        siamese = make_representation(b'{"id":"siam"}')
+
+        assert bengal.etag != siamese.etag
+        assert bengal.etag == make_representation(b'{"id":"beng"}').etag
+
+    async def test_large_bodies_are_compressed_with_their_own_etag(self):
+        representation = make_representation(b'{"results":[' + b",".join([b'{"id":"beng"}'] * 200) + b"]}")
+
+        plain = respond(make_request(), representation, "public")
+        compressed = respond(make_request(accept_encoding="gzip;q=0.5, identity"), representation, "public")
+        revalidated = respond(
+            make_request(if_none_match=compressed.headers["etag"], accept_encoding="gzip"), representation, "public"
+        )
+
+        assert "content-encoding" not in plain.headers
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(compressed.body) == representation.body
+        assert compressed.headers["etag"] != plain.headers["etag"]
+        assert compressed.headers["vary"] == "Accept, Accept-Encoding"
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+    async def test_small_bodies_are_not_compressed(self):
+        response = respond(make_request(accept_encoding="gzip"), make_representation(b'{"id":"beng"}'), "public")
+
+        assert "content-encoding" not in response.headers
+        assert response.body == b'{"id":"beng"}'
+
+    async def test_precompressed_variants_are_cached_and_accounted(self):
+        cache = TTLCache(max_entries=10, max_bytes=1024 * 1024)
+        encode = lambda breeds: TypeAdapter(list).dump_json(breeds)
+        produce = AsyncMock(return_value=[{"id": "beng", "name": "Bengal"}] * 100)
+
+        await cached_response(make_request(), cache, 60, encode, produce, "public", precompress_variants=True)
+        representation = cache.peek(representation_key(make_request())).value
+
+        assert ("application/json", "gzip") in representation.variants
+        assert cache.size_bytes > len(representation.body)
+
+    async def test_msgpack_is_opt_in(self):
+        msgpack = pytest.importorskip("msgpack")
+        representation = make_representation(b'{"id":"beng","origin":null}')
+
+        packed = respond(make_request(accept="application/msgpack"), representation, "public")
+        default = respond(make_request(accept="*/*"), representation, "public")
+
+        assert packed.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(packed.body) == {"id": "beng", "origin": None}
+        assert packed.headers["etag"] != default.headers["etag"]
+        assert default.headers["content-type"] == "application/json"
+
+    async def test_host_header_cannot_poison_cached_links(self):
+        cache = TTLCache(max_entries=10, max_bytes=1024 * 1024)
+
+        async def cached_link(request: Request) -> bytes:
+            async def produce():
+                return {"next": f"{request.url.scheme}://{request.url.netloc}{request.url.path}?page=1"}
+
+            return (await cached_response(request, cache, 60, TypeAdapter(dict).dump_json, produce, "public")).body
+
+        poisoned = await cached_link(make_request(b"limit=2", host="evil.example"))
+        legitimate = await cached_link(make_request(b"limit=2", host="api.example"))
+
+        assert b"evil.example" in poisoned
+        assert b"evil.example" not in legitimate
+        assert b"api.example" in legitimate
+
+    async def test_not_modified_matches_any_variant_of_a_fingerprint(self):
+        etag = fingerprint_etag("/users", ["a", "b"], None)
+        gzip_etag = f'{etag[:-1]}-gzip"'
+
+        assert not_modified(make_request(if_none_match=etag), etag, "private").status_code == status.HTTP_304_NOT_MODIFIED
+        held = not_modified(make_request(if_none_match=f'"other", W/{gzip_etag}'), etag, "private")
+        assert held.headers["etag"] == gzip_etag
+        assert not_modified(make_request(if_none_match=fingerprint_etag("/users", ["a"], None)), etag, "private") is None
+        assert not_modified(make_request(), etag, "private") is None
+
+
+@pytest.mark.asyncio
+class TestUserListRevalidation:
+
+    @staticmethod
+    async def list_users(if_none_match: str = None):
+        page = PaginatedResponse(
+            results=[{"_id": "65f000000000000000000001", "username": "jdoe", "name": "John", "lastname": "Doe"}],
+            limit=1, page=0, next=None, previous=None,
+        )
+        request = make_request(b"limit=1", if_none_match)
+        with patch.object(users_router.UserService, "list_users", AsyncMock(return_value=page)):
+            return await users_router.list_users(
+                request,
+                PaginationParams(limit=1, page=0),
+                FieldSelection(fields=None, exclude_none=False),
+                cursor=None,
+                include_total=False,
+            )
+
+    async def test_revalidation_skips_encoding_the_page(self):
+        first = await self.list_users()
+
+        with patch.object(users_router, "USER_PAGE_ADAPTER") as adapter:
+            second = await self.list_users(if_none_match=first.headers["etag"])
+
+        assert first.status_code == status.HTTP_200_OK
+        assert b'"_id"' not in first.body
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        adapter.validate_python.assert_not_called()
@@ -0,0 +1,37 @@
+import pytest
+from unittest.mock import patch
+
+# Core
+from app.core import http
+from app.core.config import HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS
+
+
+@pytest.mark.asyncio
+class TestHttpClient:
+
+    async def test_client_is_shared_between_calls(self):
+        client = await http.start_http_client()
+
+        assert http.get_http_client() is client
+        await http.close_http_client()
+
+    async def test_close_releases_client(self):
+        client = await http.start_http_client()
+        await http.close_http_client()
+
+        assert client.is_closed
+        assert http.get_http_client() is not client
+        await http.close_http_client()
+
+    async def test_client_uses_configured_pool_limits(self):
+        client = http.create_http_client()
+        pool = client._transport._pool
+
+        assert pool._max_connections == HTTP_MAX_CONNECTIONS
+        assert pool._max_keepalive_connections == HTTP_MAX_KEEPALIVE_CONNECTIONS
+        await client.aclose()
+
+    async def test_http2_without_h2_fails_clearly(self):
+        with patch.object(http, "HTTP2_ENABLED", True), patch.object(http, "h2", None):
+            with pytest.raises(RuntimeError, match="h2"):
+                http.create_http_client()
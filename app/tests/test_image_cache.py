@@ -0,0 +1,107 @@
+import os
+import pytest
+from fastapi import Request, status
+from fastapi.responses import FileResponse
+
+# Utils
+from app.utils import image_cache as image_cache_module
+from app.utils.file_response import RangeNotSatisfiable, file_response, parse_range
+from app.utils.image_cache import DiskImageCache, extension_for
+
+
+def make_request(**headers) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/breeds/beng/image", "query_string": b"", "headers": raw})
+
+
+async def read_body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+@pytest.mark.asyncio
+class TestDiskImageCache:
+
+    async def test_store_and_find(self, tmp_path):
+        cache = DiskImageCache(str(tmp_path / "images"), thumbnail_size=64)
+
+        assert cache.find("O3btzLlsO") is None
+        path = await cache.store("O3btzLlsO", ".png", b"png-bytes")
+
+        assert cache.find("O3btzLlsO") == path
+        assert path.endswith("O3btzLlsO.png")
+        assert [name for name in os.listdir(tmp_path / "images")] == ["O3btzLlsO.png"]
+
+    async def test_rejects_unsafe_ids_and_types(self, tmp_path):
+        cache = DiskImageCache(str(tmp_path), thumbnail_size=64)
+
+        with pytest.raises(ValueError):
+            cache.find("../etc/passwd")
+        with pytest.raises(ValueError):
+            await cache.store("abc", ".svg", b"<svg/>")
+
+    async def test_thumbnail_falls_back_without_pillow(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(image_cache_module, "Image", None)
+        cache = DiskImageCache(str(tmp_path), thumbnail_size=64)
+        source = await cache.store("abc", ".jpg", b"jpeg")
+
+        assert await cache.make_thumbnail("abc", source) is None
+        assert cache.find("abc", thumbnail=True) is None
+
+    async def test_undecodable_original_has_no_thumbnail(self, tmp_path):
+        cache = DiskImageCache(str(tmp_path), thumbnail_size=64)
+        source = await cache.store("abc", ".jpg", b"not a jpeg")
+
+        assert await cache.make_thumbnail("abc", source) is None
+        assert cache.find("abc", thumbnail=True) is None
+
+    async def test_extension_prefers_url_then_content_type(self):
+        assert extension_for("/images/abc.JPEG", "image/png") == ".jpg"
+        assert extension_for("/images/abc", "image/png; charset=binary") == ".png"
+        assert extension_for("/images/abc", "text/html") is None
+
+
+@pytest.mark.asyncio
+class TestFileResponse:
+
+    @pytest.fixture
+    def image(self, tmp_path):
+        path = tmp_path / "abc.jpg"
+        path.write_bytes(bytes(range(100)))
+        return str(path)
+
+    async def test_parse_range(self):
+        assert parse_range("bytes=0-9", 100) == (0, 9)
+        assert parse_range("bytes=90-", 100) == (90, 99)
+        assert parse_range("bytes=-10", 100) == (90, 99)
+        assert parse_range("bytes=50-500", 100) == (50, 99)
+        assert parse_range("bytes=0-1,5-6", 100) is None
+        assert parse_range("items=0-1", 100) is None
+        assert parse_range("bytes=9-1", 100) is None
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range("bytes=100-", 100)
+
+    async def test_full_response_uses_file_response(self, image):
+        response = file_response(make_request(), image, "image/jpeg", "public, max-age=60")
+
+        assert isinstance(response, FileResponse)
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["cache-control"] == "public, max-age=60"
+
+    async def test_range_returns_partial_content(self, image):
+        response = file_response(make_request(range="bytes=10-19"), image, "image/jpeg", "public")
+
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert response.headers["content-range"] == "bytes 10-19/100"
+        assert await read_body(response) == bytes(range(10, 20))
+
+    async def test_unsatisfiable_range_and_conditional_requests(self, image):
+        etag = file_response(make_request(), image, "image/jpeg", "public").headers["etag"]
+
+        unsatisfiable = file_response(make_request(range="bytes=200-"), image, "image/jpeg", "public")
+        not_modified = file_response(make_request(if_none_match=etag), image, "image/jpeg", "public")
+        stale_if_range = file_response(make_request(range="bytes=0-1", if_range='"old"'), image, "image/jpeg", "public")
+
+        assert unsatisfiable.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert unsatisfiable.headers["content-range"] == "bytes */100"
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert isinstance(stale_if_range, FileResponse)
@@ -0,0 +1,51 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Metrics
+from app.core.metrics import MetricsMiddleware, MetricsRegistry, http_request_duration
+
+
+@pytest.mark.asyncio
+class TestMetrics:
+
+    async def test_histogram_renders_cumulative_buckets(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+        latency.observe(0.05, "/a")
+        latency.observe(0.5, "/a")
+        latency.observe(5, "/a")
+        lines = registry.render().splitlines()
+
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in lines
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+        assert 'latency_seconds_count{route="/a"} 3' in lines
+        assert 'latency_seconds_sum{route="/a"} 5.55' in lines
+
+    async def test_callback_metrics_are_read_at_scrape_time(self):
+        registry = MetricsRegistry()
+        entries = {"breeds": 1}
+        registry.gauge_callback("cache_entries", "Entries.", lambda: [({"cache": "breeds"}, entries["breeds"])])
+
+        entries["breeds"] = 7
+
+        assert 'cache_entries{cache="breeds"} 7' in registry.render().splitlines()
+        with pytest.raises(ValueError):
+            registry.gauge_callback("cache_entries", "Entries.", lambda: [])
+
+    async def test_middleware_labels_requests_with_the_route_template(self):
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"id": item_id}
+
+        client = TestClient(app)
+        client.get("/items/a")
+        client.get("/items/b")
+
+        lines = http_request_duration.render()
+        assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2' in lines
@@ -0,0 +1,131 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from pymongo.errors import DuplicateKeyError, ServerSelectionTimeoutError
+
+# MongoDB
+from app.db.mongodb import LazyCollection, PoolMonitor, database_health, ensure_indexes, read_preference
+
+
+@pytest.mark.asyncio
+class TestEnsureIndexes:
+
+    async def test_indexes_ready(self):
+        with patch("app.db.mongodb.users_collection") as mock_users:
+            mock_users.create_indexes = AsyncMock()
+            mock_users.index_information = AsyncMock(
+                return_value={"_id_": {}, "username_unique": {}, "username_login_covering": {}}
+            )
+
+            state = await ensure_indexes(strict=True)
+
+            assert state["status"] == "ready"
+            assert state["missing"] == []
+            mock_users.create_indexes.assert_awaited_once()
+
+    async def test_missing_index_is_reported(self):
+        with patch("app.db.mongodb.users_collection") as mock_users:
+            mock_users.create_indexes = AsyncMock(side_effect=DuplicateKeyError("duplicate username"))
+            mock_users.index_information = AsyncMock(return_value={"_id_": {}, "username_login_covering": {}})
+
+            state = await ensure_indexes(strict=False)
+
+            assert state["status"] == "degraded"
+            assert state["missing"] == ["username_unique"]
+            assert "duplicate username" in state["error"]
+
+    async def test_strict_mode_fails_fast(self):
+        with patch("app.db.mongodb.users_collection") as mock_users:
+            mock_users.create_indexes = AsyncMock()
+            mock_users.index_information = AsyncMock(return_value={"_id_": {}})
+
+            with pytest.raises(RuntimeError):
+                await ensure_indexes(strict=True)
+
+
+class TestClientSetup:
+
+    def test_collections_do_not_create_the_client_until_used(self):
+        with patch("app.db.mongodb._client", None), patch("app.db.mongodb.create_mongo_client") as create:
+            collection = LazyCollection("users")
+            create.assert_not_called()
+
+            collection.find({})
+            collection.find({})
+
+            create.assert_called_once()
+            create.return_value.__getitem__.return_value.__getitem__.assert_called_once_with("users")
+
+    def test_unknown_read_preference_is_rejected(self):
+        with pytest.raises(ValueError):
+            read_preference("fastest")
+
+
+class TestPoolMonitor:
+
+    def test_tracks_usage_per_server(self):
+        monitor = PoolMonitor()
+        event = SimpleNamespace(address=("mongo", 27017))
+
+        monitor.pool_created(event)
+        for _ in range(3):
+            monitor.connection_created(event)
+            monitor.connection_check_out_started(event)
+            monitor.connection_checked_out(event)
+        monitor.connection_checked_in(event)
+        monitor.connection_check_out_started(event)
+
+        assert monitor.snapshot() == [
+            {"address": "mongo:27017", "open": 3, "in_use": 2, "waiting": 1, "checkout_failures": 0}
+        ]
+        monitor.pool_closed(event)
+        assert monitor.snapshot() == []
+
+
+@pytest.mark.asyncio
+class TestDatabaseHealth:
+
+    async def test_reports_ping_latency_and_pool(self):
+        client = MagicMock()
+        client.__getitem__.return_value.command = AsyncMock(return_value={"ok": 1})
+        monitor = PoolMonitor()
+        event = SimpleNamespace(address=("mongo", 27017))
+        monitor.connection_created(event)
+        monitor.connection_check_out_started(event)
+        monitor.connection_checked_out(event)
+
+        with patch("app.db.mongodb.get_mongo_client", return_value=client), \
+                patch("app.db.mongodb.pool_monitor", monitor), \
+                patch("app.db.mongodb.MONGO_MAX_POOL_SIZE", 10):
+            report = await database_health()
+
+        assert report["status"] == "ok"
+        assert report["ping_ms"] is not None
+        assert report["pool"]["in_use"] == 1
+        assert report["pool"]["utilization"] == 0.1
+        client.__getitem__.return_value.command.assert_awaited_once_with("ping")
+
+    async def test_unreachable_database_is_unavailable(self):
+        client = MagicMock()
+        client.__getitem__.return_value.command = AsyncMock(side_effect=ServerSelectionTimeoutError("no servers"))
+
+        with patch("app.db.mongodb.get_mongo_client", return_value=client):
+            report = await database_health()
+
+        assert report["status"] == "unavailable"
+        assert report["ping_ms"] is None
+        assert "no servers" in report["error"]
+
+    async def test_slow_ping_times_out(self):
+        async def hang(*args):
+            await asyncio.sleep(1)
+
+        client = MagicMock()
+        client.__getitem__.return_value.command = hang
+
+        with patch("app.db.mongodb.get_mongo_client", return_value=client):
+            report = await database_health(timeout=0.01)
+
+        assert report["status"] == "unavailable"
+        assert "timed out" in report["error"]
@@ -0,0 +1,52 @@
+import gzip
+import pytest
+from unittest.mock import patch
+
+# Utils
+from app.utils.negotiation import (
+    COMPRESSORS,
+    JSON,
+    MSGPACK,
+    compress,
+    negotiate_encoding,
+    negotiate_media_type,
+    parse_quality_list,
+)
+
+
+class TestNegotiation:
+
+    def test_quality_list_parsing(self):
+        assert parse_quality_list("gzip;q=0.8, BR , zstd;q=oops, ;q=1") == {"gzip": 0.8, "br": 1.0, "zstd": 0.0}
+        assert parse_quality_list(None) == {}
+
+    def test_encoding_follows_client_weights_and_threshold(self):
+        assert negotiate_encoding("gzip", 4096) == "gzip"
+        assert negotiate_encoding("gzip;q=0, identity", 4096) is None
+        assert negotiate_encoding("*", 4096) == next(iter(COMPRESSORS))
+        assert negotiate_encoding("deflate", 4096) is None
+        assert negotiate_encoding("gzip", 10) is None
+        assert negotiate_encoding("", 4096) is None
+
+    def test_encoding_prefers_server_order_on_ties(self):
+        offered = ", ".join(reversed(list(COMPRESSORS)))
+
+        assert negotiate_encoding(offered, 4096) == next(iter(COMPRESSORS))
+
+    def test_compression_can_be_disabled(self):
+        with patch("app.utils.negotiation.COMPRESSION_ENABLED", False):
+            assert negotiate_encoding("gzip", 4096) is None
+
+    def test_gzip_round_trip(self):
+        body = b'{"id":"beng"}' * 100
+
+        assert gzip.decompress(compress(body, "gzip")) == body
+
+    def test_media_type_defaults_to_json(self):
+        pytest.importorskip("msgpack")
+
+        assert negotiate_media_type(None) == JSON
+        assert negotiate_media_type("*/*") == JSON
+        assert negotiate_media_type("application/json, application/msgpack;q=0.5") == JSON
+        assert negotiate_media_type("application/x-msgpack") == MSGPACK
+        assert negotiate_media_type("application/msgpack, application/json") == MSGPACK
@@ -0,0 +1,87 @@
+import pytest
+import time
+
+# Utils
+from app.utils.cache_store import MemoryCacheStore, SQLiteCacheStore
+from app.utils.rate_limit import InMemoryRateLimitBackend, SlidingWindowLimiter, StoreRateLimitBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+class TestSlidingWindowLimiter:
+
+    async def test_blocks_after_limit_until_window_slides(self):
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(limit=2, window=60, clock=clock)
+
+        await limiter.hit("jdoe")
+        clock.now += 10
+        await limiter.hit("jdoe")
+
+        assert await limiter.retry_after("jdoe") == 50
+        clock.now += 50
+        assert await limiter.retry_after("jdoe") == 0
+
+    async def test_reset_clears_key(self):
+        limiter = SlidingWindowLimiter(limit=1, window=60)
+        await limiter.hit("jdoe")
+        await limiter.reset("jdoe")
+
+        assert await limiter.retry_after("jdoe") == 0
+
+    async def test_acquire_reserves_until_released(self):
+        limiter = SlidingWindowLimiter(limit=2, window=60, clock=FakeClock())
+
+        first = await limiter.acquire("jdoe")
+        second = await limiter.acquire("jdoe")
+
+        assert first is not None and second is not None
+        assert await limiter.acquire("jdoe") is None
+        await limiter.release("jdoe", second)
+        assert await limiter.acquire("jdoe") is not None
+
+    async def test_in_memory_backend_bounds_tracked_keys(self):
+        backend = InMemoryRateLimitBackend(max_keys=2)
+        for key in ("a", "b", "c"):
+            await backend.add(key, now=0, window=60)
+
+        assert await backend.count("a", now=1, window=60) == 0
+        assert await backend.count("c", now=1, window=60) == 1
+
+    async def test_store_backend_shares_limit_between_workers(self, tmp_path):
+        store = SQLiteCacheStore(str(tmp_path / "limits.sqlite3"))
+        clock = FakeClock()
+        # Store counters expire in wall-clock time, 40s into the current minute
+        clock.now = time.time() // 60 * 60 + 40
+        first_worker = SlidingWindowLimiter(2, 60, backend=StoreRateLimitBackend(store, "login"), clock=clock)
+        second_worker = SlidingWindowLimiter(2, 60, backend=StoreRateLimitBackend(store, "login"), clock=clock)
+
+        assert await first_worker.acquire("jdoe") is not None
+        reserved_at = await second_worker.acquire("jdoe")
+        assert await first_worker.acquire("jdoe") is None
+        assert await second_worker.retry_after("jdoe") == 20
+
+        await second_worker.release("jdoe", reserved_at)
+        assert await first_worker.acquire("jdoe") is not None
+        await first_worker.reset("jdoe")
+        assert await second_worker.retry_after("jdoe") == 0
+        await store.close()
+
+    async def test_store_backend_fails_open(self):
+        store = MemoryCacheStore()
+
+        async def unavailable(*args):
+            raise ConnectionError("store down")
+        store.incr = unavailable
+        limiter = SlidingWindowLimiter(1, 60, backend=StoreRateLimitBackend(store, "login"))
+
+        assert await limiter.acquire("jdoe") is not None
+        assert await limiter.acquire("jdoe") is not None
+        assert await limiter.retry_after("jdoe") == 0
@@ -0,0 +1,83 @@
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+# Utils
+from app.utils.resilience import CircuitBreaker, CircuitOpenError, ResilientCaller
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def server_error(status_code: int = 503) -> httpx.HTTPStatusError:
+    return httpx.HTTPStatusError("error", request=MagicMock(), response=MagicMock(status_code=status_code))
+
+
+def make_caller(clock=None, **kwargs) -> ResilientCaller:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock or FakeClock())
+    return ResilientCaller(breaker, sleep=AsyncMock(), **kwargs)
+
+
+@pytest.mark.asyncio
+class TestResilientCaller:
+
+    async def test_transient_errors_are_retried_with_bounded_backoff(self):
+        caller = make_caller(retries=2, base_delay=0.1, max_delay=0.15)
+        attempt = AsyncMock(side_effect=[httpx.ConnectError("down"), server_error(), "ok"])
+
+        assert await caller.call(attempt) == "ok"
+        assert attempt.await_count == 3
+        assert caller.stats()["retries"] == 2
+        assert all(0 <= call.args[0] <= 0.15 for call in caller._sleep.await_args_list)
+
+    async def test_client_errors_are_not_retried(self):
+        caller = make_caller(retries=2)
+        attempt = AsyncMock(side_effect=server_error(404))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await caller.call(attempt)
+
+        attempt.assert_awaited_once()
+        assert caller.breaker.state == CircuitBreaker.CLOSED
+
+    async def test_breaker_opens_fails_fast_and_recovers_through_a_probe(self):
+        clock = FakeClock()
+        caller = make_caller(clock=clock, retries=0)
+        failing = AsyncMock(side_effect=asyncio.TimeoutError())
+
+        for _ in range(3):
+            with pytest.raises(asyncio.TimeoutError):
+                await caller.call(failing)
+        assert caller.breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError) as error:
+            await caller.call(AsyncMock(return_value="ok"))
+        assert error.value.retry_after == 30
+
+        clock.now = 30
+        assert caller.breaker.state == CircuitBreaker.HALF_OPEN
+        assert await caller.call(AsyncMock(return_value="ok")) == "ok"
+        assert caller.breaker.state == CircuitBreaker.CLOSED
+        assert caller.stats()["breaker_opened"] == 1
+        assert caller.stats()["breaker_rejected"] == 1
+
+    async def test_hedged_request_wins_when_first_attempt_stalls(self):
+        caller = make_caller(hedge_delay=0.01)
+        started = []
+
+        async def attempt():
+            started.append(len(started))
+            if len(started) == 1:
+                await asyncio.sleep(10)
+                return "slow"
+            return "fast"
+
+        assert await asyncio.wait_for(caller.call(attempt), timeout=1) == "fast"
+        assert caller.stats()["hedges"] == 1
+        assert caller.stats()["hedge_wins"] == 1
@@ -0,0 +1,109 @@
+import asyncio
+import hashlib
+import pytest
+import threading
+from unittest.mock import patch
+
+# Utils
+from app.utils.security import (
+    PBKDF2_SHA256,
+    SCRYPT,
+    hash_password,
+    get_hash_executor,
+    hash_passwords_async,
+    needs_rehash,
+    shutdown_hash_executor,
+    verify_password,
+    verify_password_async,
+)
+
+
+class TestPasswordHashing:
+
+    def test_scrypt_hash_is_salted_and_verifiable(self):
+        first = hash_password("secret", scheme=SCRYPT)
+        second = hash_password("secret", scheme=SCRYPT)
+
+        assert first.startswith("scrypt$")
+        assert first != second
+        assert verify_password("secret", first)
+        assert not verify_password("wrong", first)
+
+    def test_pbkdf2_hash_is_verifiable(self):
+        with patch("app.utils.security.PASSWORD_PBKDF2_ITERATIONS", 1000):
+            stored = hash_password("secret", scheme=PBKDF2_SHA256)
+
+        assert stored.startswith("pbkdf2_sha256$1000$")
+        assert verify_password("secret", stored)
+        assert not verify_password("wrong", stored)
+
+    def test_legacy_sha256_is_verifiable_and_needs_rehash(self):
+        legacy = hashlib.sha256(b"secret").hexdigest()
+
+        assert verify_password("secret", legacy)
+        assert not verify_password("wrong", legacy)
+        assert needs_rehash(legacy)
+
+    def test_needs_rehash_on_changed_cost(self):
+        stored = hash_password("secret", scheme=SCRYPT)
+
+        assert not needs_rehash(stored, scheme=SCRYPT)
+        with patch("app.utils.security.PASSWORD_SCRYPT_N", 2 ** 15):
+            assert needs_rehash(stored, scheme=SCRYPT)
+        assert needs_rehash(stored, scheme=PBKDF2_SHA256)
+
+    def test_malformed_hash_does_not_verify(self):
+        assert not verify_password("secret", "scrypt$broken")
+        assert not verify_password("secret", "md5$abc")
+        assert not verify_password("secret", "")
+
+
+async def wait_until(condition) -> None:
+    while not condition():
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+class TestPasswordHashingPool:
+
+    async def test_async_helpers_run_in_pool(self):
+        hashes = await hash_passwords_async(["a", "b"])
+
+        assert await verify_password_async("a", hashes[0])
+        assert not await verify_password_async("a", hashes[1])
+
+    async def test_bulk_hashing_queues_one_batch_at_a_time(self):
+        in_flight, peak = 0, 0
+
+        async def fake_hash(executor, func, password):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return f"hashed:{password}"
+
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "run_in_executor", side_effect=fake_hash):
+            hashes = await hash_passwords_async([str(index) for index in range(10)], batch_size=3)
+
+        assert hashes == [f"hashed:{index}" for index in range(10)]
+        assert peak == 3
+
+    async def test_shutdown_cancels_queued_hashes(self):
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        executor = get_hash_executor()
+        running = [executor.submit(block) for _ in range(executor._max_workers)]
+        queued = executor.submit(hash_password, "secret")
+        started.wait()
+        shutdown = asyncio.create_task(asyncio.to_thread(shutdown_hash_executor))
+        await asyncio.wait_for(wait_until(queued.cancelled), 5)
+        release.set()
+        await shutdown
+
+        assert all(future.done() for future in running)
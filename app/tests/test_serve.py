@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import patch
+
+# Server
+from app import serve
+
+
+@pytest.mark.asyncio
+class TestServe:
+
+    async def test_auto_prefers_uvloop_and_httptools_when_installed(self):
+        with patch("app.serve.importlib.util.find_spec", return_value=object()):
+            assert serve.resolve_loop("auto") == "uvloop"
+            assert serve.resolve_http("auto") == "httptools"
+
+    async def test_auto_falls_back_to_the_standard_library(self):
+        with patch("app.serve.importlib.util.find_spec", return_value=None):
+            assert serve.resolve_loop("auto") == "asyncio"
+            assert serve.resolve_http("auto") == "h11"
+        assert serve.resolve_loop("asyncio") == "asyncio"
+
+    async def test_main_runs_workers_with_graceful_shutdown(self):
+        with patch("app.serve.uvicorn.run") as run:
+            serve.main(["--workers", "3", "--port", "9000", "--loop", "asyncio"])
+
+        args, kwargs = run.call_args
+        assert args == ("app.main:app",)
+        assert kwargs["workers"] == 3
+        assert kwargs["port"] == 9000
+        assert kwargs["loop"] == "asyncio"
+        assert kwargs["timeout_graceful_shutdown"] > 0
+
+    async def test_default_workers_follow_the_cgroup_cpu_quota(self, tmp_path):
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+        with patch("app.serve.os.sched_getaffinity", return_value={0, 1, 2, 3, 4, 5, 6, 7}, create=True):
+            assert serve.available_cpus(str(cpu_max)) == 2
+            cpu_max.write_text("max 100000\n")
+            assert serve.available_cpus(str(cpu_max)) == 8
+            assert serve.available_cpus(str(tmp_path / "missing")) == 8
+
+        with patch("app.serve.available_cpus", return_value=2):
+            assert serve.resolve_workers(0) == 2
+        assert serve.resolve_workers(3) == 3
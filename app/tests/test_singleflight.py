@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+
+# Utils
+from app.utils.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+
+    async def test_concurrent_calls_share_one_execution(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "breed"
+
+        results = await asyncio.gather(*(flights.do("key", fetch) for _ in range(10)))
+
+        assert results == ["breed"] * 10
+        assert calls == 1
+        assert flights.shared == 9
+        assert len(flights) == 0
+
+    async def test_different_keys_run_separately(self):
+        flights = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0)
+            return object()
+
+        first, second = await asyncio.gather(flights.do("a", fetch), flights.do("b", fetch))
+
+        assert first is not second
+
+    async def test_exception_is_propagated_to_all_callers(self):
+        flights = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        results = await asyncio.gather(
+            flights.do("key", fetch), flights.do("key", fetch), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        flights = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "breed"
+
+        leader = asyncio.ensure_future(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flights.do("key", fetch))
+        leader.cancel()
+
+        assert await follower == "breed"
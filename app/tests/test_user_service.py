@@ -5,12 +5,65 @@ from fastapi import HTTPException, status
 from app.models.user import UserCreateModel
 
 # Services
-from app.services.user import UserService
+from app.db.mongodb import USER_INDEXES
+from app.services import user as user_service
+from app.services.user import UserService, user_cache
+from bson import ObjectId
+from pymongo import ReadPreference
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 # Utils
 from app.utils.security import hash_password
+from benchmarks.memory_mongo import MemoryDatabase
+import asyncio
+import hashlib
+import json
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def batch_size(self, size):
+        self.size = size
+        return self
+
+    def sort(self, key, direction):
+        self.documents = sorted(self.documents, key=lambda doc: doc[key], reverse=direction < 0)
+        return self
+
+    def skip(self, count):
+        self.documents = self.documents[count:]
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    def __aiter__(self):
+        self._iterator = iter(self.documents)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def fake_find(documents):
+    def find(query, projection=None):
+        selected = documents
+        bounds = query.get("_id", {})
+        if "$gt" in bounds:
+            selected = [doc for doc in selected if doc["_id"] > bounds["$gt"]]
+        if "$lt" in bounds:
+            selected = [doc for doc in selected if doc["_id"] < bounds["$lt"]]
+        return FakeCursor([dict(doc) for doc in selected])
+    return find
+
 
 @pytest.mark.asyncio
 class TestUserService:
@@ -20,9 +73,18 @@ class TestUserService:
         mock_collection.find_one = AsyncMock(return_value=user_data)
         mock_collection.insert_one = AsyncMock()
 
+    @staticmethod
+    def setup_mock_counter(mock_counters, mock_users, seq_values, max_suffix=None):
+        mock_counters.find_one_and_update = AsyncMock(
+            side_effect=[None if seq is None else {"_id": "base", "seq": seq} for seq in seq_values]
+        )
+        aggregate_result = [] if max_suffix is None else [{"_id": None, "max_suffix": max_suffix}]
+        mock_users.aggregate = MagicMock(return_value=MagicMock(to_list=AsyncMock(return_value=aggregate_result)))
+
     async def test_create_user_success(self, fake):
-        with patch("app.services.user.users_collection") as mock_users:
-            mock_users.find_one = AsyncMock(return_value=None)
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.username_counters_collection") as mock_counters:
+            self.setup_mock_counter(mock_counters, mock_users, [1])
             mock_users.insert_one = AsyncMock()
 
             user_data = UserCreateModel(
@@ -33,9 +95,43 @@ class TestUserService:
 
             result = await UserService.create_user(user_data)
 
-            assert result.username.startswith(user_data.name.lower())
+            assert result.username == (user_data.name + user_data.lastname).lower().replace(" ", "")
             mock_users.insert_one.assert_awaited_once()
 
+    async def test_generate_username_uses_counter(self):
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.username_counters_collection") as mock_counters:
+            self.setup_mock_counter(mock_counters, mock_users, [42])
+
+            username = await UserService._generate_username("John", "Smith")
+
+            assert username == "johnsmith41"
+            mock_users.aggregate.assert_not_called()
+
+    async def test_new_counter_skips_existing_usernames(self):
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.username_counters_collection") as mock_counters:
+            # "johnsmith" .. "johnsmith7" already exist: 8 allocations before the counter
+            self.setup_mock_counter(mock_counters, mock_users, [None, 9], max_suffix=7)
+
+            username = await UserService._generate_username("John", "Smith")
+
+            assert username == "johnsmith8"
+            query, update = mock_counters.find_one_and_update.await_args.args
+            assert update == [{"$set": {"seq": {"$add": [{"$max": [{"$ifNull": ["$seq", 0]}, 8]}, 1]}}}]
+            assert mock_counters.find_one_and_update.await_args.kwargs["upsert"] is True
+
+    async def test_create_user_retries_on_duplicate_username(self, fake):
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.username_counters_collection") as mock_counters:
+            self.setup_mock_counter(mock_counters, mock_users, [2, 3])
+            mock_users.insert_one = AsyncMock(side_effect=[DuplicateKeyError("taken"), None])
+
+            result = await UserService.create_user(UserCreateModel(name="John", lastname="Smith", password="secret"))
+
+            assert result.username == "johnsmith2"
+            assert mock_users.insert_one.await_count == 2
+
     async def test_login_success(self, fake):
         with patch("app.services.user.users_collection") as mock_users:
             password = fake.password()
@@ -62,3 +158,329 @@ class TestUserService:
                 await UserService.login(fake.first_name(), fake.password())
 
             assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_unknown_username_still_verifies_a_hash(self):
+        verify = AsyncMock(return_value=True)
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.verify_password_async", verify):
+            self.setup_mock_user(mock_users, None)
+
+            for _ in range(2):
+                with pytest.raises(HTTPException) as exc:
+                    await UserService.login("nobody", "secret")
+                assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+            assert verify.await_count == 2
+            assert verify.await_args.args == ("secret", user_service._DUMMY_HASH)
+
+    async def test_export_users_streams_ndjson(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            documents = [
+                {"name": fake.first_name(), "lastname": fake.last_name(), "username": fake.user_name()}
+                for _ in range(3)
+            ]
+            cursor = FakeCursor(documents)
+            mock_users.find = MagicMock(return_value=cursor)
+
+            chunks = [chunk async for chunk in UserService.export_users(batch_size=2)]
+            lines = b"".join(chunks).decode().splitlines()
+
+            assert cursor.size == 2
+            assert len(chunks) == 2
+            assert [json.loads(line)["username"] for line in lines] == [doc["username"] for doc in documents]
+
+    @staticmethod
+    def generate_users(fake, count):
+        return [
+            {"_id": ObjectId(), "name": fake.first_name(), "lastname": fake.last_name(), "username": f"user{index}"}
+            for index in range(count)
+        ]
+
+    @staticmethod
+    def cursor_from(link):
+        return link.split("cursor=")[1].split("&")[0]
+
+    async def test_list_users_keyset_walks_forward_and_back(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            documents = self.generate_users(fake, 5)
+            mock_users.find = MagicMock(side_effect=fake_find(documents))
+            mock_users.with_options.return_value = mock_users
+
+            first = await UserService.list_users(limit=2, skip=0, page=0, base_url="/users")
+            assert [user["username"] for user in first.results] == ["user0", "user1"]
+            assert first.previous is None
+
+            second = await UserService.list_users(limit=2, skip=0, page=0, base_url="/users", cursor=self.cursor_from(first.next))
+            assert [user["username"] for user in second.results] == ["user2", "user3"]
+
+            last = await UserService.list_users(limit=2, skip=0, page=0, base_url="/users", cursor=self.cursor_from(second.next))
+            assert [user["username"] for user in last.results] == ["user4"]
+            assert last.next is None
+
+            back = await UserService.list_users(limit=2, skip=0, page=0, base_url="/users", cursor=self.cursor_from(last.previous))
+            assert [user["username"] for user in back.results] == ["user2", "user3"]
+            assert back.next is not None and back.previous is not None
+            assert "_id" not in back.results[0]
+
+    async def test_list_users_offset_mode_links_and_total(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            documents = self.generate_users(fake, 5)
+            mock_users.find = MagicMock(side_effect=fake_find(documents))
+            mock_users.with_options.return_value = mock_users
+            mock_users.count_documents = AsyncMock(return_value=5)
+
+            data = await UserService.list_users(limit=2, skip=2, page=1, base_url="/users", include_total=True)
+
+            assert [user["username"] for user in data.results] == ["user2", "user3"]
+            assert data.next == "/users?limit=2&page=2&include_total=true"
+            assert data.previous == "/users?limit=2&page=0&include_total=true"
+            assert data.total == 5
+            mock_users.with_options.assert_called_once_with(read_preference=ReadPreference.SECONDARY_PREFERRED)
+
+    async def test_list_users_links_keep_field_selection(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            mock_users.find = MagicMock(side_effect=fake_find(self.generate_users(fake, 5)))
+            mock_users.with_options.return_value = mock_users
+
+            data = await UserService.list_users(
+                limit=2, skip=2, page=1, base_url="/users", extra_query=[("fields", "name,username")]
+            )
+
+            assert data.next == "/users?limit=2&page=2&fields=name%2Cusername"
+            assert data.previous == "/users?limit=2&page=0&fields=name%2Cusername"
+
+    async def test_list_users_invalid_cursor(self):
+        with patch("app.services.user.users_collection"):
+            with pytest.raises(HTTPException) as exc:
+                await UserService.list_users(limit=2, skip=0, page=0, cursor="not-a-cursor")
+            assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_create_users_bulk_reports_per_row_results(self):
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.username_counters_collection") as mock_counters:
+            # One counter update per base: "johnsmith" x2, "janedoe" x1
+            mock_counters.find_one_and_update = AsyncMock(side_effect=[{"seq": 5}, {"seq": 1}])
+            mock_users.aggregate = MagicMock(return_value=MagicMock(to_list=AsyncMock(return_value=[])))
+            mock_users.insert_many = AsyncMock()
+            rows = [
+                {"name": "John", "lastname": "Smith", "password": "a"},
+                {"name": "Jane", "lastname": "Doe", "password": "b"},
+                {"name": "Missing"},
+                {"name": "John", "lastname": "Smith", "password": "c"},
+            ]
+
+            data = await UserService.create_users_bulk(rows, chunk_size=2)
+
+            assert data.created == 3
+            assert data.failed == 1
+            assert [result.username for result in data.results] == ["johnsmith3", "janedoe", None, "johnsmith4"]
+            assert "lastname" in data.results[2].error
+            assert mock_users.insert_many.await_count == 2
+            inserted = mock_users.insert_many.await_args_list[0].args[0]
+            assert inserted[0]["password"] != "a"
+
+    async def test_create_users_bulk_retries_duplicate_rows(self):
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.username_counters_collection") as mock_counters:
+            mock_counters.find_one_and_update = AsyncMock(side_effect=[{"seq": 3}, {"seq": 4}])
+            mock_users.aggregate = MagicMock(return_value=MagicMock(to_list=AsyncMock(return_value=[])))
+            duplicate = BulkWriteError({"writeErrors": [{"index": 0, "code": 11000, "errmsg": "duplicate"}]})
+            mock_users.insert_many = AsyncMock(side_effect=[duplicate, None])
+
+            data = await UserService.create_users_bulk([{"name": "John", "lastname": "Smith", "password": "a"}])
+
+            assert data.created == 1
+            assert data.results[0].username == "johnsmith3"
+
+    async def test_login_upgrades_legacy_hash(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            password = fake.password()
+            data_mock = {
+                "name": fake.first_name(),
+                "lastname": fake.last_name(),
+                "username": fake.user_name(),
+                "password": hashlib.sha256(password.encode()).hexdigest(),
+            }
+            self.setup_mock_user(mock_users, data_mock)
+            mock_users.update_one = AsyncMock()
+
+            result = await UserService.login(data_mock["username"], password)
+
+            assert result.username == data_mock["username"]
+            new_hash = mock_users.update_one.await_args.args[1]["$set"]["password"]
+            assert new_hash.startswith("scrypt$")
+
+    async def test_login_wrong_password(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            data_mock = {
+                "name": fake.first_name(),
+                "lastname": fake.last_name(),
+                "username": fake.user_name(),
+                "password": hash_password("right"),
+            }
+            self.setup_mock_user(mock_users, data_mock)
+
+            with pytest.raises(HTTPException) as exc:
+                await UserService.login(data_mock["username"], "wrong")
+
+            assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_login_rejected_after_repeated_failures(self, fake):
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.username_login_limiter.limit", 2):
+            self.setup_mock_user(mock_users, None)
+            username = fake.user_name()
+
+            for _ in range(2):
+                with pytest.raises(HTTPException):
+                    await UserService.login(username, "wrong", client_ip="10.0.0.1")
+
+            with pytest.raises(HTTPException) as exc:
+                await UserService.login(username, "wrong", client_ip="10.0.0.1")
+
+            assert exc.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+            assert int(exc.value.headers["Retry-After"]) > 0
+            # Rejected by the limiter without a database query
+            assert mock_users.find_one.await_count == 2
+
+    async def test_concurrent_failures_cannot_exceed_limit(self, fake):
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.username_login_limiter.limit", 3):
+            async def slow_lookup(*args):
+                await asyncio.sleep(0.01)
+                return None
+            mock_users.find_one = AsyncMock(side_effect=slow_lookup)
+            username = fake.user_name()
+
+            outcomes = await asyncio.gather(
+                *(UserService.login(username, "wrong", client_ip="10.0.0.2") for _ in range(10)), return_exceptions=True
+            )
+
+            codes = [outcome.status_code for outcome in outcomes]
+            assert codes.count(status.HTTP_401_UNAUTHORIZED) == 3
+            assert codes.count(status.HTTP_429_TOO_MANY_REQUESTS) == 7
+            assert mock_users.find_one.await_count == 3
+
+    async def test_successful_logins_give_back_ip_reservation(self, fake):
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch("app.services.user.ip_login_limiter.limit", 1):
+            data_mock = {
+                "name": fake.first_name(),
+                "lastname": fake.last_name(),
+                "username": fake.user_name(),
+                "password": hash_password("right"),
+            }
+            self.setup_mock_user(mock_users, data_mock)
+
+            for _ in range(3):
+                result = await UserService.login(data_mock["username"], "right", client_ip="10.0.0.3")
+
+            assert result.username == data_mock["username"]
+
+    async def test_login_uses_covered_projection(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            self.setup_mock_user(mock_users, None)
+
+            with pytest.raises(HTTPException):
+                await UserService.login(fake.user_name(), fake.password())
+
+            projection = mock_users.find_one.await_args.args[1]
+            assert projection == {"_id": 0, "username": 1, "password": 1, "name": 1, "lastname": 1}
+
+    async def test_login_served_from_user_cache(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            password = fake.password()
+            data_mock = {
+                "name": fake.first_name(),
+                "lastname": fake.last_name(),
+                "username": fake.user_name(),
+                "password": hash_password(password),
+            }
+            self.setup_mock_user(mock_users, data_mock)
+
+            first = await UserService.login(data_mock["username"], password)
+            second = await UserService.login(data_mock["username"], password)
+
+            assert first == second
+            mock_users.find_one.assert_awaited_once()
+            cached = user_cache.peek(("profile", data_mock["username"])).value
+            assert "password" not in cached
+
+    async def test_unknown_username_is_checked_in_mongo_every_time(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            self.setup_mock_user(mock_users, None)
+
+            with pytest.raises(HTTPException):
+                await UserService.login("johnsmith", "secret")
+
+            # Created meanwhile by another worker, whose user cache this one cannot see
+            mock_users.find_one = AsyncMock(return_value={
+                "username": "johnsmith", "name": "John", "lastname": "Smith", "password": hash_password("secret"),
+            })
+            result = await UserService.login("johnsmith", "secret")
+
+            assert result.username == "johnsmith"
+            mock_users.find_one.assert_awaited_once()
+
+    async def test_invalidate_user_forces_reload(self, fake):
+        with patch("app.services.user.users_collection") as mock_users:
+            data_mock = {
+                "name": fake.first_name(),
+                "lastname": fake.last_name(),
+                "username": fake.user_name(),
+                "password": hash_password("right"),
+            }
+            self.setup_mock_user(mock_users, data_mock)
+
+            await UserService.login(data_mock["username"], "right")
+            UserService.invalidate_user(data_mock["username"])
+            await UserService.login(data_mock["username"], "right")
+
+            assert mock_users.find_one.await_count == 2
+
+    async def test_user_cache_bounded_by_lru(self):
+        with patch("app.services.user.users_collection") as mock_users, \
+                patch.object(user_cache, "max_entries", 4):
+            hashed = hash_password("secret")
+            mock_users.find_one = AsyncMock(side_effect=lambda query, projection: {
+                "username": query["username"], "name": "Cat", "lastname": "Owner", "password": hashed,
+            })
+
+            for index in range(5):
+                await UserService.login(f"user{index}", "secret")
+
+            assert len(user_cache) == 4
+            assert ("profile", "user4") in user_cache
+            assert ("profile", "user0") not in user_cache
+
+
+@pytest.mark.asyncio
+class TestUserServiceOnMemoryMongo:
+    """
+    Smoke tests through the benchmark's in-memory Mongo stand-in, which has to keep up
+    with every query and update shape UserService sends.
+    """
+
+    @pytest.fixture
+    async def database(self):
+        database = MemoryDatabase()
+        await database["users"].create_indexes(USER_INDEXES)
+        with patch("app.services.user.users_collection", database["users"]), \
+                patch("app.services.user.username_counters_collection", database["username_counters"]):
+            yield database
+
+    async def test_create_user_and_bulk_continue_legacy_usernames(self, database):
+        # Created before username counters existed
+        await database["users"].insert_many([{"username": "johnsmith"}, {"username": "johnsmith1"}])
+
+        created = await UserService.create_user(UserCreateModel(name="John", lastname="Smith", password="secret"))
+        bulk = await UserService.create_users_bulk([
+            {"name": "John", "lastname": "Smith", "password": "a"},
+            {"name": "Jane", "lastname": "Doe", "password": "b"},
+            {"name": "John", "lastname": "Smith", "password": "c"},
+        ])
+
+        assert created.username == "johnsmith2"
+        assert [result.username for result in bulk.results] == ["johnsmith3", "janedoe", "johnsmith4"]
+        assert (await database["username_counters"].find_one({"_id": "johnsmith"}))["seq"] == 5
+        assert await database["users"].count_documents({}) == 6
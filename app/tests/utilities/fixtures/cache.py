@@ -0,0 +1,29 @@
+import pytest
+from unittest.mock import patch
+
+# Services
+from app.services import breed as breed_service
+from app.services.breed import breed_cache, breed_representations, upstream_etags
+from app.services.user import user_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_breed_cache():
+    for cache in (breed_cache, breed_representations, upstream_etags):
+        cache.clear()
+        cache.reset_stats()
+    breed_service._catalogue = None
+    # Tests that need a shared tier patch their own in, whatever BREED_CACHE_STORE says
+    with patch.object(breed_service, "breed_namespace", None):
+        yield
+    for cache in (breed_cache, breed_representations, upstream_etags):
+        cache.clear()
+    breed_service._catalogue = None
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    user_cache.clear()
+    user_cache.reset_stats()
+    yield
+    user_cache.clear()
@@ -2,16 +2,24 @@ import pytest
 from unittest.mock import AsyncMock, patch
 
 
-PATCH_BREED_GET = "app.services.breed.httpx.AsyncClient.get"
+PATCH_BREED_GET = "app.core.http.httpx.AsyncClient.get"
+PATCH_BREED_SEND = "app.core.http.httpx.AsyncClient.send"
 PATCH_USER_GET  = "app.services.user.httpx.AsyncClient.get"
 
 
 @pytest.fixture
 def mock_breed_httpx_get():
     with patch(PATCH_BREED_GET, new_callable=AsyncMock) as mock_httpx_get:
+        mock_httpx_get.return_value.headers = {}
         yield mock_httpx_get
 
 
+@pytest.fixture
+def mock_breed_httpx_send():
+    with patch(PATCH_BREED_SEND, new_callable=AsyncMock) as mock_httpx_send:
+        yield mock_httpx_send
+
+
 @pytest.fixture
 def mock_user_httpx_get():
     with patch(PATCH_USER_GET, new_callable=AsyncMock) as mock_httpx_get:
@@ -0,0 +1,17 @@
+import pytest
+from unittest.mock import patch
+
+# Services
+from app.services.user import ip_login_limiter, username_login_limiter
+
+# Utils
+from app.utils.rate_limit import InMemoryRateLimitBackend
+
+
+@pytest.fixture(autouse=True)
+def reset_login_limiters():
+    # Fresh in-memory counters per test, even when LOGIN_RATE_LIMIT_STORE or
+    # BREED_CACHE_STORE point the limiters at a shared store
+    with patch.object(username_login_limiter, "backend", InMemoryRateLimitBackend()), \
+            patch.object(ip_login_limiter, "backend", InMemoryRateLimitBackend()):
+        yield
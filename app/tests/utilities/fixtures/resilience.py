@@ -0,0 +1,11 @@
+import pytest
+
+# Services
+from app.services.breed import breed_upstream
+
+
+@pytest.fixture(autouse=True)
+def reset_breed_upstream():
+    breed_upstream.reset_stats()
+    yield
+    breed_upstream.reset_stats()
@@ -0,0 +1,202 @@
+# External
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+import json
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached value with its accounted size and expiry timestamps.
+        - expires_at: Until this moment the entry is fresh.
+        - stale_until: Until this moment the entry may still be served while it is refreshed.
+    """
+    value: Any
+    size: int
+    expires_at: float
+    stale_until: float
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def is_usable(self, now: float) -> bool:
+        return now < self.stale_until
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the memory weight of a JSON-like value by its encoded length.
+    """
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class TTLCache:
+    """
+    In-process cache with per-entry TTLs, LRU eviction bounded by entry count and
+    total bytes, and stale-while-revalidate support.
+    """
+    def __init__(self, max_entries: int, max_bytes: int, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.is_usable(self._clock())
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Look up an entry, counting hits, stale hits and misses.
+
+        Args:
+            - key (Hashable): Cache key.
+
+        Returns:
+            - Optional[CacheEntry]: The entry if it is fresh or still within its stale window.
+        """
+        entry = self._entries.get(key)
+        now = self._clock()
+        if entry is None or not entry.is_usable(now):
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if entry.is_fresh(now):
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Return a usable entry without touching LRU order or counters.
+        """
+        entry = self._entries.get(key)
+        return entry if entry is not None and entry.is_usable(self._clock()) else None
+
+    def set(self, key: Hashable, value: Any, ttl: float, stale_ttl: float = 0, size: Optional[int] = None) -> None:
+        """
+        Store a value, evicting least recently used entries to respect the bounds.
+
+        Args:
+            - key (Hashable): Cache key.
+            - value (Any): Value to store.
+            - ttl (float): Seconds the entry stays fresh.
+            - stale_ttl (float): Extra seconds the entry may be served stale while refreshing.
+            - size (Optional[int]): Accounted size in bytes; estimated when omitted.
+        """
+        if size is None:
+            size = estimate_size(value)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        now = self._clock()
+        self._entries[key] = CacheEntry(value, size, now + ttl, now + ttl + stale_ttl)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+        self._entries.clear()
+        self._bytes = 0
+
+    def reset_stats(self) -> None:
+        self.hits = self.stale_hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float = 0,
+    ) -> Any:
+        """
+        Return the cached value for key, loading it on a miss. A stale entry is
+        returned immediately and refreshed in the background.
+
+        Args:
+            - key (Hashable): Cache key.
+            - loader (Callable): Coroutine factory producing the fresh value.
+            - ttl (float): Seconds a loaded value stays fresh.
+            - stale_ttl (float): Extra seconds a value may be served while refreshing.
+
+        Returns:
+            - Any: The cached or freshly loaded value.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            if not entry.is_fresh(self._clock()):
+                self._schedule_refresh(key, loader, ttl, stale_ttl)
+            return entry.value
+
+        value = await loader()
+        self.set(key, value, ttl, stale_ttl)
+        return value
+
+    def _schedule_refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl: float, stale_ttl: float) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                self.set(key, await loader(), ttl, stale_ttl)
+            except Exception:
+                # Keep serving the stale entry; the next stale hit retries.
+                logger.warning("Background refresh failed for cache key %r", key, exc_info=True)
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
@@ -0,0 +1,531 @@
+# MongoDB
+from pymongo import ReturnDocument
+
+# External
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+
+class StoredEntry(NamedTuple):
+    """
+    A persisted cache value with wall-clock expiry timestamps (seconds since the epoch).
+    """
+    key: str
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+class CacheStore(ABC):
+    """
+    Shared second-level cache. Values must be JSON-serializable. Besides entries, a store
+    keeps an integer version per namespace that any process can bump to invalidate it, and
+    expiring integer counters (used to share rate limits between workers).
+    """
+    @abstractmethod
+    async def get(self, key: str) -> Optional[StoredEntry]:
+        """Return the entry for key unless it is past its stale window."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, fresh_until: float, stale_until: float) -> None:
+        """Insert or replace an entry."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove an entry if it exists."""
+
+    @abstractmethod
+    async def load(self, limit: int, prefix: str = "") -> List[StoredEntry]:
+        """Return up to limit usable entries under prefix, most recently fresh first, to warm a process."""
+
+    @abstractmethod
+    async def get_version(self, namespace: str) -> int:
+        """Return the current version of a namespace (0 until it is first bumped)."""
+
+    @abstractmethod
+    async def bump_version(self, namespace: str) -> int:
+        """Atomically increment the version of a namespace and return the new value."""
+
+    @abstractmethod
+    async def incr(self, key: str, amount: int, expires_at: float) -> int:
+        """Atomically add amount to a counter (starting at 0, expiring at expires_at) and return the new value."""
+
+    async def close(self) -> None:
+        """Release resources held by the store."""
+
+
+class MemoryCacheStore(CacheStore):
+    """
+    Store held in the current process. Shares nothing between workers; useful for a
+    single worker and in tests.
+    """
+    def __init__(self):
+        self._entries: Dict[str, StoredEntry] = {}
+        self._versions: Dict[str, int] = {}
+        self._counters: Dict[str, Tuple[int, float]] = {}
+
+    async def get(self, key: str) -> Optional[StoredEntry]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.stale_until <= time.time():
+            del self._entries[key]
+            return None
+        return entry
+
+    async def set(self, key: str, value: Any, fresh_until: float, stale_until: float) -> None:
+        # Round-trip through JSON like the other stores, so callers never share mutable values
+        self._entries[key] = StoredEntry(key, json.loads(json.dumps(value)), fresh_until, stale_until)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def load(self, limit: int, prefix: str = "") -> List[StoredEntry]:
+        now = time.time()
+        entries = [
+            entry for entry in self._entries.values() if entry.key.startswith(prefix) and entry.stale_until > now
+        ]
+        return sorted(entries, key=lambda entry: entry.fresh_until, reverse=True)[:limit]
+
+    async def get_version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    async def bump_version(self, namespace: str) -> int:
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+        return self._versions[namespace]
+
+    async def incr(self, key: str, amount: int, expires_at: float) -> int:
+        now = time.time()
+        for expired in [name for name, (_, until) in self._counters.items() if until <= now]:
+            del self._counters[expired]
+        value, until = self._counters.get(key, (0, expires_at))
+        self._counters[key] = (value + amount, until)
+        return value + amount
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    Store backed by a local SQLite file; operations run in a worker thread. Every
+    worker on the same host can open the same file.
+    """
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, fresh_until REAL NOT NULL, stale_until REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS versions (namespace TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS counters (key TEXT PRIMARY KEY, value INTEGER NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection.commit()
+
+    def _get(self, key: str) -> Optional[StoredEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT key, value, fresh_until, stale_until FROM cache WHERE key = ? AND stale_until > ?",
+                (key, time.time()),
+            ).fetchone()
+        return None if row is None else StoredEntry(row[0], json.loads(row[1]), row[2], row[3])
+
+    def _set(self, key: str, value: Any, fresh_until: float, stale_until: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, fresh_until, stale_until) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), fresh_until, stale_until),
+            )
+            self._connection.commit()
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._connection.commit()
+
+    def _load(self, limit: int, prefix: str) -> List[StoredEntry]:
+        now = time.time()
+        with self._lock:
+            self._connection.execute("DELETE FROM cache WHERE stale_until <= ?", (now,))
+            self._connection.commit()
+            rows = self._connection.execute(
+                "SELECT key, value, fresh_until, stale_until FROM cache WHERE substr(key, 1, ?) = ? "
+                "ORDER BY fresh_until DESC LIMIT ?",
+                (len(prefix), prefix, limit),
+            ).fetchall()
+        return [StoredEntry(row[0], json.loads(row[1]), row[2], row[3]) for row in rows]
+
+    def _get_version(self, namespace: str) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT version FROM versions WHERE namespace = ?", (namespace,)).fetchone()
+        return 0 if row is None else row[0]
+
+    def _bump_version(self, namespace: str) -> int:
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO versions (namespace, version) VALUES (?, 1) "
+                "ON CONFLICT(namespace) DO UPDATE SET version = version + 1",
+                (namespace,),
+            )
+            self._connection.commit()
+            return self._connection.execute(
+                "SELECT version FROM versions WHERE namespace = ?", (namespace,)
+            ).fetchone()[0]
+
+    def _incr(self, key: str, amount: int, expires_at: float) -> int:
+        now = time.time()
+        with self._lock:
+            # Upsert and read back in one transaction, so other processes' increments wait for it
+            self._connection.execute("DELETE FROM counters WHERE expires_at <= ?", (now,))
+            self._connection.execute(
+                "INSERT INTO counters (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+                (key, amount, expires_at),
+            )
+            value = self._connection.execute("SELECT value FROM counters WHERE key = ?", (key,)).fetchone()[0]
+            self._connection.commit()
+        return value
+
+    async def get(self, key: str) -> Optional[StoredEntry]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, fresh_until: float, stale_until: float) -> None:
+        await asyncio.to_thread(self._set, key, value, fresh_until, stale_until)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._delete, key)
+
+    async def load(self, limit: int, prefix: str = "") -> List[StoredEntry]:
+        return await asyncio.to_thread(self._load, limit, prefix)
+
+    async def get_version(self, namespace: str) -> int:
+        return await asyncio.to_thread(self._get_version, namespace)
+
+    async def bump_version(self, namespace: str) -> int:
+        return await asyncio.to_thread(self._bump_version, namespace)
+
+    async def incr(self, key: str, amount: int, expires_at: float) -> int:
+        return await asyncio.to_thread(self._incr, key, amount, expires_at)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class MongoCacheStore(CacheStore):
+    """
+    Store backed by a MongoDB collection through the existing Motor client. A TTL
+    index on stale_until lets MongoDB purge expired entries. Namespace versions live
+    in the same collection as documents without stale_until, which the TTL index and
+    entry lookups ignore. Counters are "counter:<key>" documents with a stale_until, so
+    the TTL index purges them too.
+    """
+    def __init__(self, collection):
+        self.collection = collection
+        self._indexed = False
+
+    async def _ensure_index(self) -> None:
+        if not self._indexed:
+            await self.collection.create_index("stale_until", expireAfterSeconds=0, name="stale_until_ttl")
+            self._indexed = True
+
+    @staticmethod
+    def _to_entry(document: dict) -> StoredEntry:
+        return StoredEntry(
+            document["_id"],
+            document["value"],
+            document["fresh_until"],
+            document["stale_until"].replace(tzinfo=timezone.utc).timestamp(),
+        )
+
+    async def get(self, key: str) -> Optional[StoredEntry]:
+        document = await self.collection.find_one({"_id": key, "stale_until": {"$gt": datetime.now(timezone.utc)}})
+        return None if document is None else self._to_entry(document)
+
+    async def set(self, key: str, value: Any, fresh_until: float, stale_until: float) -> None:
+        await self._ensure_index()
+        await self.collection.replace_one(
+            {"_id": key},
+            {
+                "value": value,
+                "fresh_until": fresh_until,
+                # TTL indexes only act on BSON dates
+                "stale_until": datetime.fromtimestamp(stale_until, timezone.utc),
+            },
+            upsert=True,
+        )
+
+    async def delete(self, key: str) -> None:
+        await self.collection.delete_one({"_id": key})
+
+    async def load(self, limit: int, prefix: str = "") -> List[StoredEntry]:
+        await self._ensure_index()
+        # Counter documents carry stale_until too, but no value
+        query = {"stale_until": {"$gt": datetime.now(timezone.utc)}, "value": {"$exists": True}}
+        if prefix:
+            query["_id"] = {"$regex": f"^{re.escape(prefix)}"}
+        cursor = self.collection.find(query)
+        documents = await cursor.sort("fresh_until", -1).limit(limit).to_list(length=limit)
+        return [self._to_entry(document) for document in documents]
+
+    async def get_version(self, namespace: str) -> int:
+        document = await self.collection.find_one({"_id": f"version:{namespace}"}, {"version": 1})
+        return 0 if document is None else document["version"]
+
+    async def bump_version(self, namespace: str) -> int:
+        document = await self.collection.find_one_and_update(
+            {"_id": f"version:{namespace}"}, {"$inc": {"version": 1}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        return document["version"]
+
+    async def incr(self, key: str, amount: int, expires_at: float) -> int:
+        await self._ensure_index()
+        document = await self.collection.find_one_and_update(
+            {"_id": f"counter:{key}"},
+            {"$inc": {"count": amount}, "$setOnInsert": {"stale_until": datetime.fromtimestamp(expires_at, timezone.utc)}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return document["count"]
+
+
+class KVError(Exception):
+    """
+    Error reply from a key-value server.
+    """
+
+
+def encode_command(*args: Any) -> bytes:
+    """
+    Encode a command as a RESP array of bulk strings.
+    """
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """
+    Read one RESP2 reply. Error replies are returned as KVError instances rather than
+    raised, so the connection stays usable.
+    """
+    line = await reader.readuntil(b"\r\n")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        return KVError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        count = int(payload)
+        return None if count < 0 else [await read_reply(reader) for _ in range(count)]
+    raise KVError(f"Unexpected reply {line!r}")
+
+
+class KVCacheStore(CacheStore):
+    """
+    Store on a network key-value server speaking the Redis protocol (RESP2), such as
+    Redis, Valkey or the stand-in in benchmarks/memory_kv.py. Entries expire on the
+    server at stale_until. Only GET, SET PX, DEL, INCR, INCRBY, PEXPIREAT and SELECT are used.
+
+    Key-value servers have no cheap ordered scan, so load() returns nothing: the shared
+    tier is read through on every local miss instead of being copied at startup.
+
+    With a timeout, a command (connecting, waiting for a pooled connection, sending and
+    reading the reply) that takes longer raises asyncio.TimeoutError and its connection is
+    dropped, so a server that stops answering cannot hang callers.
+    """
+    def __init__(self, url: str, max_connections: int = 10, timeout: Optional[float] = None):
+        self.timeout = timeout
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.database = int(parsed.path.lstrip("/") or 0)
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        if self.database:
+            writer.write(encode_command("SELECT", self.database))
+            await writer.drain()
+            reply = await read_reply(reader)
+            if isinstance(reply, KVError):
+                writer.close()
+                raise reply
+        return reader, writer
+
+    async def execute(self, *args: Any) -> Any:
+        """
+        Send one command on a pooled connection and return its reply.
+
+        Raises:
+            - KVError: If the server answers with an error.
+            - asyncio.TimeoutError: If the command takes longer than the store timeout.
+        """
+        if self.timeout is None:
+            return await self._execute(*args)
+        return await asyncio.wait_for(self._execute(*args), self.timeout)
+
+    async def _execute(self, *args: Any) -> Any:
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._connect()
+            reader, writer = connection
+            try:
+                writer.write(encode_command(*args))
+                await writer.drain()
+                reply = await read_reply(reader)
+            except BaseException:
+                # The reply stream may be out of sync; never reuse this connection
+                writer.close()
+                raise
+            self._idle.append(connection)
+        if isinstance(reply, KVError):
+            raise reply
+        return reply
+
+    async def get(self, key: str) -> Optional[StoredEntry]:
+        data = await self.execute("GET", key)
+        if data is None:
+            return None
+        document = json.loads(data)
+        if document["stale_until"] <= time.time():
+            return None
+        return StoredEntry(key, document["value"], document["fresh_until"], document["stale_until"])
+
+    async def set(self, key: str, value: Any, fresh_until: float, stale_until: float) -> None:
+        expires_in_ms = int((stale_until - time.time()) * 1000)
+        if expires_in_ms <= 0:
+            return
+        document = json.dumps({"value": value, "fresh_until": fresh_until, "stale_until": stale_until})
+        await self.execute("SET", key, document, "PX", expires_in_ms)
+
+    async def delete(self, key: str) -> None:
+        await self.execute("DEL", key)
+
+    async def load(self, limit: int, prefix: str = "") -> List[StoredEntry]:
+        return []
+
+    async def get_version(self, namespace: str) -> int:
+        value = await self.execute("GET", f"version:{namespace}")
+        return 0 if value is None else int(value)
+
+    async def bump_version(self, namespace: str) -> int:
+        return await self.execute("INCR", f"version:{namespace}")
+
+    async def incr(self, key: str, amount: int, expires_at: float) -> int:
+        value = await self.execute("INCRBY", key, amount)
+        # Counter keys are per time bucket, so re-arming the expiry on every increment is harmless
+        await self.execute("PEXPIREAT", key, int(expires_at * 1000))
+        return value
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+class StoreNamespace:
+    """
+    A versioned key space inside a CacheStore. Keys are written as
+    "<namespace>:v<version>:<key>", so bumping the version makes every entry of the
+    previous version unreachable for all processes at once. Each process learns about
+    a bump the next time it calls sync().
+    """
+    def __init__(self, store: CacheStore, name: str):
+        self.store = store
+        self.name = name
+        self.version = 0
+
+    @property
+    def prefix(self) -> str:
+        return f"{self.name}:v{self.version}:"
+
+    async def get(self, key: str) -> Optional[StoredEntry]:
+        entry = await self.store.get(self.prefix + key)
+        return None if entry is None else entry._replace(key=key)
+
+    async def set(self, key: str, value: Any, fresh_until: float, stale_until: float) -> None:
+        await self.store.set(self.prefix + key, value, fresh_until, stale_until)
+
+    async def delete(self, key: str) -> None:
+        await self.store.delete(self.prefix + key)
+
+    async def load(self, limit: int) -> List[StoredEntry]:
+        prefix = self.prefix
+        return [entry._replace(key=entry.key[len(prefix):]) for entry in await self.store.load(limit, prefix)]
+
+    async def sync(self) -> bool:
+        """
+        Pick up the shared version of the namespace.
+
+        Returns:
+            - bool: True when another process bumped it since the last sync.
+        """
+        version = await self.store.get_version(self.name)
+        changed = version != self.version
+        self.version = version
+        return changed
+
+    async def invalidate(self) -> int:
+        """
+        Bump the shared version, dropping every entry of the namespace for all processes.
+
+        Returns:
+            - int: The new version.
+        """
+        self.version = await self.store.bump_version(self.name)
+        return self.version
+
+
+def create_cache_store(
+    kind: str, sqlite_path: str, mongo_collection: str, kv_url: str = "", timeout: Optional[float] = None
+) -> Optional[CacheStore]:
+    """
+    Build the configured shared store.
+
+    Args:
+        - kind (str): "memory", "sqlite", "mongo", "kv", or empty for no shared tier.
+        - sqlite_path (str): Database file for the SQLite store.
+        - mongo_collection (str): Collection name for the MongoDB store.
+        - kv_url (str): Server address for the key-value store, e.g. kv://localhost:6379/0.
+        - timeout (Optional[float]): Seconds per key-value command.
+
+    Returns:
+        - Optional[CacheStore]: The store, or None when disabled.
+    """
+    if not kind:
+        return None
+    if kind == "memory":
+        return MemoryCacheStore()
+    if kind == "sqlite":
+        return SQLiteCacheStore(sqlite_path)
+    if kind == "mongo":
+        from app.db.mongodb import LazyCollection
+        return MongoCacheStore(LazyCollection(mongo_collection))
+    if kind == "kv":
+        return KVCacheStore(kv_url, timeout=timeout)
+    raise ValueError(f"Unknown cache store '{kind}'")
@@ -0,0 +1,116 @@
+# FastAPI
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
+
+# Utils
+from app.utils.http_cache import etag_matches
+
+# External
+from typing import AsyncIterator, Optional, Tuple
+import asyncio
+import os
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(ValueError):
+    """
+    The requested byte range lies entirely outside the file.
+    """
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a Range header holding a single byte range (RFC 9110).
+
+    Args:
+        - header (str): Range header value, e.g. "bytes=0-1023", "bytes=1024-" or "bytes=-512".
+        - size (int): Size of the file in bytes.
+
+    Returns:
+        - Optional[Tuple[int, int]]: Inclusive (start, end) offsets, or None when the header
+          is malformed or asks for several ranges and the whole file should be sent.
+
+    Raises:
+        - RangeNotSatisfiable: If the range does not overlap the file.
+    """
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    first, separator, last = (part.strip() for part in ranges.partition("-"))
+    if not separator or not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    return start, end
+
+
+async def _read_range(path: str, start: int, end: int) -> AsyncIterator[bytes]:
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await asyncio.to_thread(file.read, min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_response(request: Request, path: str, media_type: str, cache_control: str) -> Response:
+    """
+    Serve a file from disk with a stat-based ETag, 304 for matching If-None-Match and
+    206 Partial Content for single byte ranges. Full responses go through FileResponse,
+    which uses the server's zero-copy send when it offers one.
+
+    Args:
+        - request (Request): Incoming request.
+        - path (str): File to send.
+        - media_type (str): Content-Type of the file.
+        - cache_control (str): Cache-Control header value.
+
+    Returns:
+        - Response: 200, 206, 304 or 416.
+    """
+    stat = os.stat(path)
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Accept-Ranges": "bytes"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # A stale If-Range means the client's partial copy is outdated: send the whole file
+    if range_header and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = parse_range(range_header, stat.st_size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{stat.st_size}"},
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _read_range(path, start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers=headers,
+            )
+
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat)
@@ -0,0 +1,203 @@
+# FastAPI
+from fastapi import Request, Response, status
+
+# Config
+from app.core.config import COMPRESSION_ENABLED, COMPRESSION_MIN_SIZE
+
+# Utils
+from app.utils.cache import TTLCache
+from app.utils.negotiation import (
+    COMPRESSORS,
+    JSON,
+    compress,
+    json_to_msgpack,
+    negotiate_encoding,
+    negotiate_media_type,
+)
+
+# External
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+import hashlib
+
+
+VARY = "Accept, Accept-Encoding"
+
+
+@dataclass(frozen=True)
+class Representation:
+    """
+    A serialized response body with its strong ETag, computed once when it is built.
+        - variants: Other encodings of the body (MessagePack and/or compressed), keyed by
+          (media type, content coding) and kept alongside it once produced.
+    """
+    body: bytes
+    etag: str
+    media_type: str = JSON
+    variants: Dict[Tuple[str, Optional[str]], bytes] = field(default_factory=dict, compare=False, repr=False)
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Return a strong, quoted ETag for a response body.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against an ETag (weak comparison, as RFC 9110 requires).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def fingerprint_etag(*parts: Any) -> str:
+    """
+    Return a strong, quoted ETag for a body that parts fully determine, so it can be
+    compared with If-None-Match before the body is built.
+    """
+    return f'"{hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()}"'
+
+
+def make_representation(body: bytes, etag: Optional[str] = None) -> Representation:
+    """
+    Wrap an already encoded JSON body and hash it once, unless its ETag is already known.
+    """
+    return Representation(body=body, etag=etag or make_etag(body))
+
+
+def variant(representation: Representation, media_type: str, coding: Optional[str] = None) -> Tuple[bytes, str]:
+    """
+    Return a representation's body in another media type and/or content coding, with its
+    own strong ETag. Variants are encoded on first use and kept in the representation.
+
+    Args:
+        - representation (Representation): JSON representation.
+        - media_type (str): JSON or MSGPACK.
+        - coding (Optional[str]): Content coding, or None for the uncompressed body.
+
+    Returns:
+        - Tuple[bytes, str]: The body and its ETag.
+    """
+    if media_type == representation.media_type and coding is None:
+        return representation.body, representation.etag
+
+    key = (media_type, coding)
+    body = representation.variants.get(key)
+    if body is None:
+        if coding is None:
+            body = json_to_msgpack(representation.body)
+        else:
+            body = compress(variant(representation, media_type)[0], coding)
+        representation.variants[key] = body
+
+    parts = [] if media_type == representation.media_type else [media_type.rsplit("/", 1)[-1]]
+    if coding is not None:
+        parts.append(coding)
+    return body, f'{representation.etag[:-1]}-{"+".join(parts)}"'
+
+
+def precompress(representation: Representation) -> int:
+    """
+    Encode the JSON body with every available coding up front, so cached representations
+    are served compressed without compressing per request.
+
+    Returns:
+        - int: Bytes held by the representation, body and variants included.
+    """
+    if COMPRESSION_ENABLED and len(representation.body) >= COMPRESSION_MIN_SIZE:
+        for coding in COMPRESSORS:
+            variant(representation, representation.media_type, coding)
+    return len(representation.body) + sum(len(body) for body in representation.variants.values())
+
+
+def respond(request: Request, representation: Representation, cache_control: str) -> Response:
+    """
+    Send a representation, or 304 without a body when the client already holds it.
+    JSON representations are sent as MessagePack when the client opts in through Accept,
+    and compressed when Accept-Encoding allows it and the body is large enough.
+    """
+    media_type = representation.media_type
+    if media_type == JSON:
+        media_type = negotiate_media_type(request.headers.get("accept"))
+    plain, _ = variant(representation, media_type)
+    coding = negotiate_encoding(request.headers.get("accept-encoding"), len(plain))
+    body, etag = variant(representation, media_type, coding)
+
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": VARY}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def not_modified(request: Request, etag: str, cache_control: str) -> Optional[Response]:
+    """
+    Answer 304 when the client holds the representation behind etag in any media type or
+    content coding, without building the body. Returns None when it must be sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag):
+        held = etag
+    else:
+        prefix = f"{etag[:-1]}-"
+        candidates = (candidate.strip().removeprefix("W/") for candidate in (if_none_match or "").split(","))
+        held = next((candidate for candidate in candidates if candidate.startswith(prefix)), None)
+        if held is None:
+            return None
+    headers = {"ETag": held, "Cache-Control": cache_control, "Vary": VARY}
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def representation_key(request: Request) -> str:
+    """
+    Normalize the request URL so equivalent query strings share one cached representation.
+    Scheme and host are part of the key because bodies embed absolute pagination links
+    built from them: a request with a forged Host header must not seed links for others.
+    """
+    url = request.url
+    return f"{url.scheme}://{url.netloc}{url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+
+
+async def cached_response(
+    request: Request,
+    cache: TTLCache,
+    ttl: float,
+    encode: Callable[[Any], bytes],
+    produce: Callable[[], Awaitable[Any]],
+    cache_control: str,
+    precompress_variants: bool = False,
+) -> Response:
+    """
+    Serve a GET from a cache of serialized representations. On a miss the value is
+    produced, encoded and hashed once; later requests (and conditional requests
+    answered with 304) reuse the stored bytes and ETag, and the variants encoded for them.
+
+    Args:
+        - request (Request): Incoming request.
+        - cache (TTLCache): Representation cache.
+        - ttl (float): Seconds a representation is reused.
+        - encode (Callable): Encodes the response value to JSON bytes.
+        - produce (Callable): Coroutine factory returning the response value.
+        - cache_control (str): Cache-Control header value.
+        - precompress_variants (bool): Compress new representations with every coding when they are stored.
+
+    Returns:
+        - Response: 200 with the body, or 304 Not Modified.
+    """
+    key = representation_key(request)
+    entry = cache.get(key)
+    if entry is not None:
+        representation = entry.value
+    else:
+        representation = make_representation(encode(await produce()))
+        size = precompress(representation) if precompress_variants else len(representation.body)
+        cache.set(key, representation, ttl, size=size)
+    return respond(request, representation, cache_control)
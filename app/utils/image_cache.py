@@ -0,0 +1,127 @@
+# External
+from contextlib import suppress
+from typing import Optional
+import asyncio
+import io
+import logging
+import os
+import re
+import tempfile
+
+try:
+    from PIL import Image
+except ImportError:  # Thumbnails need the optional Pillow package
+    Image = None
+
+
+MEDIA_TYPES = {".jpg": "image/jpeg", ".png": "image/png", ".gif": "image/gif", ".webp": "image/webp"}
+EXTENSIONS = {**{media_type: extension for extension, media_type in MEDIA_TYPES.items()}, "image/jpg": ".jpg"}
+
+_IMAGE_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+logger = logging.getLogger(__name__)
+
+
+def extension_for(url_path: str, content_type: Optional[str]) -> Optional[str]:
+    """
+    Pick the file extension for a downloaded image from its URL, falling back to its Content-Type.
+
+    Returns:
+        - Optional[str]: One of MEDIA_TYPES, or None for unsupported formats.
+    """
+    extension = os.path.splitext(url_path)[1].lower().replace(".jpeg", ".jpg")
+    if extension in MEDIA_TYPES:
+        return extension
+    return EXTENSIONS.get((content_type or "").split(";")[0].strip().lower())
+
+
+class DiskImageCache:
+    """
+    Breed images stored as files named after their TheCatAPI image ID, with an
+    optional JPEG thumbnail next to each original. Files are written to a temporary
+    name and renamed into place, so concurrent workers never serve a partial image.
+    Files are never evicted; callers bound the directory by what they store.
+    """
+    def __init__(self, directory: str, thumbnail_size: int):
+        self.directory = directory
+        self.thumbnail_size = thumbnail_size
+
+    @staticmethod
+    def _check_id(image_id: str) -> None:
+        if not _IMAGE_ID.match(image_id):
+            raise ValueError(f"Invalid image ID '{image_id}'")
+
+    def find(self, image_id: str, thumbnail: bool = False) -> Optional[str]:
+        """
+        Return the path of a cached original or thumbnail, or None when it is not on disk.
+        """
+        self._check_id(image_id)
+        if thumbnail:
+            path = os.path.join(self.directory, f"{image_id}.thumb.jpg")
+            return path if os.path.isfile(path) else None
+        for extension in MEDIA_TYPES:
+            path = os.path.join(self.directory, f"{image_id}{extension}")
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def _write(self, name: str, content: bytes) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, name)
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".part")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(content)
+            os.replace(temporary, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(temporary)
+            raise
+        return path
+
+    async def store(self, image_id: str, extension: str, content: bytes) -> str:
+        """
+        Write an original image to disk in a worker thread.
+
+        Args:
+            - image_id (str): TheCatAPI image ID.
+            - extension (str): File extension, one of MEDIA_TYPES.
+            - content (bytes): Image bytes.
+
+        Returns:
+            - str: Path of the stored file.
+        """
+        self._check_id(image_id)
+        if extension not in MEDIA_TYPES:
+            raise ValueError(f"Unsupported image type '{extension}'")
+        return await asyncio.to_thread(self._write, f"{image_id}{extension}", content)
+
+    def _thumbnail(self, image_id: str, source: str) -> str:
+        with Image.open(source) as image:
+            image.thumbnail((self.thumbnail_size, self.thumbnail_size))
+            buffer = io.BytesIO()
+            image.convert("RGB").save(buffer, format="JPEG", quality=85, optimize=True)
+        return self._write(f"{image_id}.thumb.jpg", buffer.getvalue())
+
+    async def make_thumbnail(self, image_id: str, source: str) -> Optional[str]:
+        """
+        Downsize an original to fit within thumbnail_size pixels and store it as JPEG.
+        Decoding and resizing run in a worker thread.
+
+        Args:
+            - image_id (str): TheCatAPI image ID.
+            - source (str): Path of the original image.
+
+        Returns:
+            - Optional[str]: Path of the thumbnail, or None when Pillow is not installed or
+              cannot decode the original (unknown format, corrupt data, decompression bomb).
+        """
+        self._check_id(image_id)
+        if Image is None:
+            return None
+        try:
+            return await asyncio.to_thread(self._thumbnail, image_id, source)
+        except (Image.DecompressionBombError, OSError, ValueError):
+            # UnidentifiedImageError and truncated-file errors are OSErrors
+            logger.warning("Could not make a thumbnail of image %s", image_id, exc_info=True)
+            return None
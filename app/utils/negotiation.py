@@ -0,0 +1,133 @@
+# Config
+from app.core.config import (
+    COMPRESSION_BROTLI_QUALITY,
+    COMPRESSION_ENABLED,
+    COMPRESSION_GZIP_LEVEL,
+    COMPRESSION_MIN_SIZE,
+    COMPRESSION_ZSTD_LEVEL,
+)
+
+# External
+from typing import Callable, Dict, Optional
+import gzip
+import json
+
+try:
+    import brotli
+except ImportError:  # br is only offered with the optional brotli package
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstd is only offered with the optional zstandard package
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:  # MessagePack bodies need the optional msgpack package
+    msgpack = None
+
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+MSGPACK_ALIASES = (MSGPACK, "application/x-msgpack", "application/vnd.msgpack")
+
+
+def _compressors() -> Dict[str, Callable[[bytes], bytes]]:
+    # In order of preference when the client weighs several codings equally
+    compressors = {}
+    if zstandard is not None:
+        compressors["zstd"] = zstandard.ZstdCompressor(level=COMPRESSION_ZSTD_LEVEL).compress
+    if brotli is not None:
+        compressors["br"] = lambda body: brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    compressors["gzip"] = lambda body: gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+    return compressors
+
+
+COMPRESSORS = _compressors()
+
+
+def parse_quality_list(header: Optional[str]) -> Dict[str, float]:
+    """
+    Parse an Accept or Accept-Encoding header into lowercase tokens and their q-values.
+    Parameters other than q are ignored; a malformed q-value counts as 0.
+    """
+    qualities: Dict[str, float] = {}
+    for item in (header or "").split(","):
+        token, *params = (part.strip() for part in item.split(";"))
+        if not token:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        qualities[token.lower()] = quality
+    return qualities
+
+
+def negotiate_encoding(accept_encoding: Optional[str], size: int) -> Optional[str]:
+    """
+    Pick the content coding for a body from the client's Accept-Encoding.
+
+    Args:
+        - accept_encoding (Optional[str]): Accept-Encoding request header.
+        - size (int): Length of the uncompressed body; bodies under COMPRESSION_MIN_SIZE are not compressed.
+
+    Returns:
+        - Optional[str]: "zstd", "br" or "gzip", or None to send the body as is.
+    """
+    if not COMPRESSION_ENABLED or not accept_encoding or size < COMPRESSION_MIN_SIZE:
+        return None
+    accepted = parse_quality_list(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in COMPRESSORS:
+        quality = accepted.get(coding, accepted.get("x-gzip", wildcard) if coding == "gzip" else wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """
+    Choose between JSON and MessagePack. MessagePack is opt-in: it is only sent when the
+    client lists it at least as high as JSON and the msgpack package is installed.
+
+    Args:
+        - accept (Optional[str]): Accept request header.
+
+    Returns:
+        - str: JSON or MSGPACK.
+    """
+    if msgpack is None or not accept:
+        return JSON
+    accepted = parse_quality_list(accept)
+    msgpack_quality = max(accepted.get(media_type, 0.0) for media_type in MSGPACK_ALIASES)
+    json_quality = max(accepted.get(JSON, 0.0), accepted.get("application/*", 0.0), accepted.get("*/*", 0.0))
+    return MSGPACK if msgpack_quality > 0 and msgpack_quality >= json_quality else JSON
+
+
+def compress(body: bytes, coding: str) -> bytes:
+    """
+    Compress a body with one of the available COMPRESSORS.
+
+    Raises:
+        - KeyError: If the coding is not available.
+    """
+    return COMPRESSORS[coding](body)
+
+
+def json_to_msgpack(body: bytes) -> bytes:
+    """
+    Re-encode a JSON body as MessagePack.
+
+    Raises:
+        - RuntimeError: If the msgpack package is not installed.
+    """
+    if msgpack is None:
+        raise RuntimeError("MessagePack encoding needs the msgpack package")
+    return msgpack.packb(json.loads(body), use_bin_type=True)
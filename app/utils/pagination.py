@@ -0,0 +1,45 @@
+# External
+from typing import Tuple
+import base64
+import binascii
+import json
+
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+def encode_cursor(direction: str, key: str) -> str:
+    """
+    Build an opaque, URL-safe cursor pointing before or after a sort key.
+
+    Args:
+        - direction (str): NEXT to seek after key, PREVIOUS to seek before it.
+        - key (str): Serialized sort key of the boundary document.
+
+    Returns:
+        - str: Opaque cursor token.
+    """
+    payload = json.dumps({"d": direction, "k": key}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        - Tuple[str, str]: Direction and serialized sort key.
+
+    Raises:
+        - ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        direction, key = payload["d"], payload["k"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+    if direction not in (NEXT, PREVIOUS) or not isinstance(key, str):
+        raise ValueError("Invalid cursor")
+    return direction, key
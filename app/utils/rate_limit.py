@@ -0,0 +1,212 @@
+# Utils
+from app.utils.cache_store import CacheStore
+
+# External
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Awaitable, Callable, Deque, Optional, Tuple
+import asyncio
+import logging
+import math
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for sliding-window event timestamps. Implement this to share limiter
+    state between workers (see StoreRateLimitBackend).
+    """
+    @abstractmethod
+    async def add(self, key: str, now: float, window: float) -> int:
+        """Record an event and return the number of events in the window ending now."""
+
+    @abstractmethod
+    async def add_if_below(self, key: str, now: float, window: float, limit: int) -> bool:
+        """Atomically record an event only if fewer than limit events are in the window; return whether it was recorded."""
+
+    @abstractmethod
+    async def remove(self, key: str, timestamp: float, window: float) -> None:
+        """Forget one event recorded at timestamp, if it is still held."""
+
+    @abstractmethod
+    async def count(self, key: str, now: float, window: float) -> int:
+        """Return the number of events in the window ending now."""
+
+    @abstractmethod
+    async def oldest(self, key: str, now: float, window: float) -> Optional[float]:
+        """Return the timestamp of the oldest event still in the window."""
+
+    @abstractmethod
+    async def reset(self, key: str, now: float, window: float) -> None:
+        """Forget every event of key."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Per-process backend. The number of tracked keys is bounded (LRU) so that a spray
+    of random usernames cannot grow memory without limit.
+    """
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._events: "OrderedDict[str, Deque[float]]" = OrderedDict()
+
+    def _window(self, key: str, now: float, window: float) -> Optional[Deque[float]]:
+        events = self._events.get(key)
+        if events is None:
+            return None
+        while events and events[0] <= now - window:
+            events.popleft()
+        if not events:
+            del self._events[key]
+            return None
+        return events
+
+    async def add(self, key: str, now: float, window: float) -> int:
+        events = self._window(key, now, window)
+        if events is None:
+            events = self._events[key] = deque()
+            while len(self._events) > self.max_keys:
+                self._events.popitem(last=False)
+        self._events.move_to_end(key)
+        events.append(now)
+        return len(events)
+
+    async def add_if_below(self, key: str, now: float, window: float, limit: int) -> bool:
+        # No await between the check and the append, so this is atomic within the event loop
+        events = self._window(key, now, window)
+        if events is not None and len(events) >= limit:
+            return False
+        await self.add(key, now, window)
+        return True
+
+    async def remove(self, key: str, timestamp: float, window: float) -> None:
+        events = self._events.get(key)
+        if events is not None and timestamp in events:
+            events.remove(timestamp)
+            if not events:
+                del self._events[key]
+
+    async def count(self, key: str, now: float, window: float) -> int:
+        events = self._window(key, now, window)
+        return 0 if events is None else len(events)
+
+    async def oldest(self, key: str, now: float, window: float) -> Optional[float]:
+        events = self._window(key, now, window)
+        return None if events is None else events[0]
+
+    async def reset(self, key: str, now: float, window: float) -> None:
+        self._events.pop(key, None)
+
+    def clear(self) -> None:
+        self._events.clear()
+
+
+class StoreRateLimitBackend(RateLimitBackend):
+    """
+    Backend on a shared CacheStore, so every worker enforces one limit. Events are counted
+    in fixed windows, as one expiring store counter per key and window: only atomic
+    increments are needed, at the cost of admitting up to twice the limit across a window
+    boundary. Store errors and timeouts are logged and fail open, so logins keep working
+    (unlimited) while the store is down.
+    """
+    def __init__(self, store: CacheStore, prefix: str, timeout: Optional[float] = None):
+        self.store = store
+        self.prefix = prefix
+        self.timeout = timeout
+
+    def _bucket(self, key: str, now: float, window: float) -> Tuple[str, float, float]:
+        index = math.floor(now / window)
+        return f"{self.prefix}:{key}:{index}", index * window, (index + 1) * window
+
+    async def _incr(self, counter: str, amount: int, expires_at: float) -> Optional[int]:
+        operation: Awaitable[int] = self.store.incr(counter, amount, expires_at)
+        try:
+            return await (operation if self.timeout is None else asyncio.wait_for(operation, self.timeout))
+        except Exception:
+            logger.warning("Rate limit store unavailable; not limiting %s", counter, exc_info=True)
+            return None
+
+    async def add(self, key: str, now: float, window: float) -> int:
+        counter, _, end = self._bucket(key, now, window)
+        return await self._incr(counter, 1, end) or 0
+
+    async def add_if_below(self, key: str, now: float, window: float, limit: int) -> bool:
+        counter, _, end = self._bucket(key, now, window)
+        count = await self._incr(counter, 1, end)
+        if count is not None and count > limit:
+            await self._incr(counter, -1, end)
+            return False
+        return True
+
+    async def remove(self, key: str, timestamp: float, window: float) -> None:
+        counter, _, end = self._bucket(key, timestamp, window)
+        if end > time.time():
+            await self._incr(counter, -1, end)
+
+    async def count(self, key: str, now: float, window: float) -> int:
+        counter, _, end = self._bucket(key, now, window)
+        return max(0, await self._incr(counter, 0, end) or 0)
+
+    async def oldest(self, key: str, now: float, window: float) -> Optional[float]:
+        # With fixed windows every event leaves when the current window ends
+        _, start, _ = self._bucket(key, now, window)
+        return start if await self.count(key, now, window) else None
+
+    async def reset(self, key: str, now: float, window: float) -> None:
+        counter, _, end = self._bucket(key, now, window)
+        count = await self._incr(counter, 0, end)
+        if count:
+            await self._incr(counter, -count, end)
+
+
+class SlidingWindowLimiter:
+    """
+    Allow at most limit events per key within a sliding window of window seconds.
+    """
+    def __init__(
+        self,
+        limit: int,
+        window: float,
+        backend: Optional[RateLimitBackend] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.limit = limit
+        self.window = window
+        self.backend = backend or InMemoryRateLimitBackend()
+        self._clock = clock
+
+    async def retry_after(self, key: str) -> float:
+        """
+        Return 0 if key may proceed, otherwise the seconds until the oldest event leaves the window.
+        """
+        now = self._clock()
+        if await self.backend.count(key, now, self.window) < self.limit:
+            return 0
+        oldest = await self.backend.oldest(key, now, self.window)
+        return max(0.0, oldest + self.window - now) if oldest is not None else 0
+
+    async def hit(self, key: str) -> int:
+        return await self.backend.add(key, self._clock(), self.window)
+
+    async def acquire(self, key: str) -> Optional[float]:
+        """
+        Reserve an event for key before doing the work it limits, so concurrent callers
+        cannot all pass a check made before any of them is recorded.
+
+        Returns:
+            - Optional[float]: The reservation timestamp (pass it to release), or None when key is limited.
+        """
+        now = self._clock()
+        return now if await self.backend.add_if_below(key, now, self.window, self.limit) else None
+
+    async def release(self, key: str, reserved_at: float) -> None:
+        """
+        Give back a reservation made by acquire, e.g. when the attempt succeeded.
+        """
+        await self.backend.remove(key, reserved_at, self.window)
+
+    async def reset(self, key: str) -> None:
+        await self.backend.reset(key, self._clock(), self.window)
@@ -0,0 +1,212 @@
+# External
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+import asyncio
+import httpx
+import logging
+import random
+import time
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling an upstream whose circuit breaker is open.
+    """
+    def __init__(self, retry_after: float):
+        super().__init__(f"Circuit open; retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Return True for failures worth retrying (and counting against the breaker):
+    connection errors, timeouts, 429 and 5xx responses.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+        - closed: calls go through; failure_threshold transient failures in a row open it.
+        - open: calls fail fast until reset_timeout has elapsed.
+        - half_open: a single probe call is let through; success closes, failure re-opens.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def retry_after(self) -> float:
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        """
+        Return whether a call may proceed, reserving the probe slot when half open.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or (self._opened_at is None and self._failures >= self.failure_threshold):
+            self._opened_at = self._clock()
+            self.opened += 1
+        self._probing = False
+
+    def reset(self) -> None:
+        self.record_success()
+        self.opened = 0
+        self.rejected = 0
+
+
+class ResilientCaller:
+    """
+    Run idempotent upstream calls with bounded retries (exponential backoff with full
+    jitter), optional hedging and a circuit breaker.
+    """
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        retries: int = 2,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        hedge_delay: float = 0,
+        retry_on: Callable[[BaseException], bool] = is_transient,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.breaker = breaker
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge_delay = hedge_delay
+        self.retry_on = retry_on
+        self._sleep = sleep
+        self.calls = 0
+        self.retried = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay before retry number attempt (0-based): uniform in [0, min(max_delay, base_delay * 2^attempt)].
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def call(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        """
+        Call attempt until it succeeds, fails with a non-transient error, or retries run out.
+
+        Args:
+            - attempt (Callable): Coroutine factory performing one upstream request.
+
+        Returns:
+            - T: Result of the first successful attempt.
+
+        Raises:
+            - CircuitOpenError: If the breaker is open.
+            - Exception: The last error of attempt.
+        """
+        self.calls += 1
+        for retry in range(self.retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError(self.breaker.retry_after())
+            try:
+                result = await self._hedge(attempt)
+            except Exception as error:
+                if not self.retry_on(error):
+                    # The upstream answered (e.g. 404): it is healthy
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                if retry == self.retries:
+                    raise
+                self.retried += 1
+                logger.info("Retrying upstream call after %r", error)
+                await self._sleep(self.backoff(retry))
+            else:
+                self.breaker.record_success()
+                return result
+
+    async def _hedge(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run attempt; when hedging is enabled and it has not finished after hedge_delay,
+        start a second one and return whichever succeeds first.
+        """
+        if not self.hedge_delay:
+            return await attempt()
+
+        tasks = [asyncio.ensure_future(attempt())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay)
+            if not done:
+                self.hedged += 1
+                tasks.append(asyncio.ensure_future(attempt()))
+
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "state": self.breaker.state,
+            "calls": self.calls,
+            "retries": self.retried,
+            "hedges": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "breaker_opened": self.breaker.opened,
+            "breaker_rejected": self.breaker.rejected,
+        }
+
+    def reset_stats(self) -> None:
+        self.calls = self.retried = self.hedged = self.hedge_wins = 0
+        self.breaker.reset()
@@ -1,4 +1,170 @@
+# Config
+from app.core.config import (
+    PASSWORD_HASH_SCHEME,
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_PBKDF2_ITERATIONS,
+    PASSWORD_SCRYPT_N,
+    PASSWORD_SCRYPT_P,
+    PASSWORD_SCRYPT_R,
+)
+
+# External
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+import asyncio
+import base64
 import hashlib
+import hmac
+import os
+import re
+
+
+SCRYPT = "scrypt"
+PBKDF2_SHA256 = "pbkdf2_sha256"
+
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+# Hashes stored before versioned formats existed: unsalted hex SHA-256
+_LEGACY_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+# hashlib's scrypt and pbkdf2_hmac release the GIL, so a thread pool uses every core
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r * p, dklen=KEY_BYTES)
+
+
+def _pbkdf2(password: str, salt: bytes, iterations: int) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations, dklen=KEY_BYTES)
+
+
+def hash_password(password: str, scheme: str = PASSWORD_HASH_SCHEME) -> str:
+    """
+    Hash a password with a per-user random salt.
+
+    Formats:
+        - scrypt$<n>$<r>$<p>$<salt>$<key>
+        - pbkdf2_sha256$<iterations>$<salt>$<key>
+
+    Args:
+        - password (str): Plain password.
+        - scheme (str): SCRYPT or PBKDF2_SHA256.
+
+    Returns:
+        - str: Versioned hash string.
+    """
+    salt = os.urandom(SALT_BYTES)
+    if scheme == SCRYPT:
+        key = _scrypt(password, salt, PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P)
+        return f"{SCRYPT}${PASSWORD_SCRYPT_N}${PASSWORD_SCRYPT_R}${PASSWORD_SCRYPT_P}${_b64encode(salt)}${_b64encode(key)}"
+    if scheme == PBKDF2_SHA256:
+        key = _pbkdf2(password, salt, PASSWORD_PBKDF2_ITERATIONS)
+        return f"{PBKDF2_SHA256}${PASSWORD_PBKDF2_ITERATIONS}${_b64encode(salt)}${_b64encode(key)}"
+    raise ValueError(f"Unsupported password hash scheme '{scheme}'")
+
+
+def verify_password(password: str, stored: str) -> bool:
+    """
+    Check a password against any supported stored hash, including legacy SHA-256.
+
+    Args:
+        - password (str): Plain password.
+        - stored (str): Stored hash.
+
+    Returns:
+        - bool: True if the password matches.
+    """
+    if not stored:
+        return False
+    if _LEGACY_SHA256_RE.match(stored):
+        return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored)
+
+    try:
+        scheme, *params = stored.split("$")
+        if scheme == SCRYPT:
+            n, r, p, salt, key = params
+            derived = _scrypt(password, _b64decode(salt), int(n), int(r), int(p))
+        elif scheme == PBKDF2_SHA256:
+            iterations, salt, key = params
+            derived = _pbkdf2(password, _b64decode(salt), int(iterations))
+        else:
+            return False
+        return hmac.compare_digest(derived, _b64decode(key))
+    except (ValueError, TypeError):
+        return False
+
+
+def needs_rehash(stored: str, scheme: str = PASSWORD_HASH_SCHEME) -> bool:
+    """
+    Tell whether a stored hash uses a legacy format, another scheme or weaker cost
+    parameters than currently configured.
+    """
+    parts = stored.split("$")
+    if parts[0] != scheme:
+        return True
+    if scheme == SCRYPT:
+        return parts[1:4] != [str(PASSWORD_SCRYPT_N), str(PASSWORD_SCRYPT_R), str(PASSWORD_SCRYPT_P)]
+    return parts[1] != str(PASSWORD_PBKDF2_ITERATIONS)
+
+
+def get_hash_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+    return _executor
+
+
+def shutdown_hash_executor() -> None:
+    """
+    Stop the hashing pool: queued hashes are cancelled, running ones are waited for.
+    """
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in the bounded hashing pool without blocking the event loop.
+    """
+    return await asyncio.get_running_loop().run_in_executor(get_hash_executor(), hash_password, password)
+
+
+async def hash_passwords_async(passwords: List[str], batch_size: int = PASSWORD_HASH_WORKERS) -> List[str]:
+    """
+    Hash many passwords across the hashing pool, batch_size at a time. Only one batch is
+    queued in the pool at once, so logins verifying in between wait for at most one batch
+    instead of the whole import.
+
+    Args:
+        - passwords (List[str]): Plain passwords.
+        - batch_size (int): Hashes submitted to the pool at once; defaults to one per worker.
+
+    Returns:
+        - List[str]: Hashes in the order of passwords.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_hash_executor()
+    hashes: List[str] = []
+    for start in range(0, len(passwords), max(1, batch_size)):
+        batch = passwords[start:start + max(1, batch_size)]
+        hashes.extend(await asyncio.gather(*(loop.run_in_executor(executor, hash_password, password) for password in batch)))
+    return hashes
+
 
-def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode()).hexdigest()
+async def verify_password_async(password: str, stored: str) -> bool:
+    """
+    Verify a password in the bounded hashing pool without blocking the event loop.
+    """
+    return await asyncio.get_running_loop().run_in_executor(get_hash_executor(), verify_password, password, stored)
@@ -0,0 +1,46 @@
+# External
+from typing import Any, Awaitable, Callable, Dict, Hashable
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key: the first caller starts the work and
+    every duplicate arriving while it is in flight awaits the same result.
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            - key (Hashable): Identity of the call (e.g. normalized URL and params).
+            - fn (Callable): Coroutine factory doing the actual work.
+
+        Returns:
+            - Any: The shared result; exceptions are propagated to every caller.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            # Run as a task so a cancelled caller does not cancel the shared call.
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.leaders += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller went away.
+            task.exception()
@@ -0,0 +1,23 @@
+"""
+The API wired to the in-memory MongoDB stand-in. CAT_API_URL and the other
+settings are read from the environment set by benchmarks.run.
+
+Run with: uvicorn benchmarks.app_under_test:app
+"""
+# MongoDB
+from app.db import mongodb
+
+# Stand-ins
+from benchmarks.memory_mongo import MemoryDatabase
+
+database = MemoryDatabase()
+mongodb.users_collection = database["users"]
+mongodb.username_counters_collection = database["username_counters"]
+
+# Services import the collections by name, so rebind them there as well
+from app.services import user as user_service  # noqa: E402
+
+user_service.users_collection = mongodb.users_collection
+user_service.username_counters_collection = mongodb.username_counters_collection
+
+from app.main import app  # noqa: E402,F401
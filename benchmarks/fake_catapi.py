@@ -0,0 +1,101 @@
+"""
+Local stand-in for TheCatAPI breed endpoints, used by the benchmark harness.
+
+Configured through environment variables:
+    - FAKE_CATAPI_BREEDS: Number of breeds served (default 67, like the real API).
+    - FAKE_CATAPI_LATENCY_MS: Added latency per request (default 50).
+    - FAKE_CATAPI_JITTER_MS: Uniform random latency added on top (default 0).
+    - FAKE_CATAPI_PAYLOAD_BYTES: Approximate size of each breed description (default 500).
+
+Run with: uvicorn benchmarks.fake_catapi:app --port 8100
+"""
+# FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
+
+# External
+import asyncio
+import hashlib
+import json
+import os
+import random
+
+
+BREEDS = int(os.getenv("FAKE_CATAPI_BREEDS", 67))
+LATENCY_MS = float(os.getenv("FAKE_CATAPI_LATENCY_MS", 50))
+JITTER_MS = float(os.getenv("FAKE_CATAPI_JITTER_MS", 0))
+PAYLOAD_BYTES = int(os.getenv("FAKE_CATAPI_PAYLOAD_BYTES", 500))
+
+ORIGINS = ("Egypt", "Thailand", "United States", "United Kingdom", "Russia", "Turkey", "Canada", "France")
+WORDS = ("Active", "Curious", "Gentle", "Playful", "Loyal", "Intelligent", "Calm", "Social", "Quiet", "Agile")
+
+
+def make_breed(index: int) -> dict:
+    rng = random.Random(index)
+    name = f"{rng.choice(WORDS)} {rng.choice(('Shorthair', 'Longhair', 'Rex', 'Bobtail', 'Mau', 'Curl'))} {index}"
+    return {
+        "id": f"b{index:03d}",
+        "name": name,
+        "origin": rng.choice(ORIGINS),
+        "country_code": "XX",
+        "description": ("lorem ipsum " * (PAYLOAD_BYTES // 12 + 1))[:PAYLOAD_BYTES],
+        "temperament": ", ".join(rng.sample(WORDS, 4)),
+        "weight": {"imperial": "7 - 10", "metric": "3 - 5"},
+        "life_span": "12 - 15",
+        **{
+            trait: rng.randint(1, 5)
+            for trait in ("adaptability", "affection_level", "child_friendly", "dog_friendly", "energy_level",
+                          "grooming", "health_issues", "intelligence", "social_needs", "stranger_friendly",
+                          "vocalisation")
+        },
+        **{flag: rng.randint(0, 1) for flag in ("experimental", "hairless", "hypoallergenic", "indoor", "rare")},
+    }
+
+
+CATALOGUE = [make_breed(index) for index in range(BREEDS)]
+BY_ID = {breed["id"]: breed for breed in CATALOGUE}
+
+app = FastAPI()
+stats = {"requests": 0}
+
+
+async def delay() -> None:
+    seconds = (LATENCY_MS + random.uniform(0, JITTER_MS)) / 1000
+    if seconds > 0:
+        await asyncio.sleep(seconds)
+
+
+def json_response(request: Request, data) -> Response:
+    body = json.dumps(data).encode()
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@app.get("/v1/breeds")
+async def list_breeds(request: Request):
+    stats["requests"] += 1
+    await delay()
+    return json_response(request, CATALOGUE)
+
+
+@app.get("/v1/breeds/search")
+async def search_breeds(request: Request, q: str = ""):
+    stats["requests"] += 1
+    await delay()
+    query = q.lower()
+    return json_response(request, [breed for breed in CATALOGUE if query in breed["name"].lower()])
+
+
+@app.get("/v1/breeds/{breed_id}")
+async def get_breed(request: Request, breed_id: str):
+    stats["requests"] += 1
+    await delay()
+    if breed_id not in BY_ID:
+        raise HTTPException(status_code=404, detail="not found")
+    return json_response(request, BY_ID[breed_id])
+
+
+@app.get("/stats")
+async def get_stats():
+    return stats
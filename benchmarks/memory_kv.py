@@ -0,0 +1,131 @@
+"""
+In-memory stand-in for a network key-value server speaking the Redis protocol
+(RESP2), enough for KVCacheStore: PING, SELECT, GET, SET (EX/PX), DEL, INCR, INCRBY,
+PEXPIREAT and FLUSHALL. Lets several API workers share one breed cache without a Redis server.
+
+Run with: python -m benchmarks.memory_kv --port 6379
+Then start the API with BREED_CACHE_STORE=kv and BREED_CACHE_KV_URL=kv://127.0.0.1:6379
+"""
+# External
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import time
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+class MemoryKVServer:
+    """
+    Single-process key-value server; one dictionary per SELECTed database.
+    """
+    def __init__(self):
+        self.databases: Dict[int, Dict[bytes, Tuple[bytes, Optional[float]]]] = {}
+        self.commands = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def _lookup(self, data: dict, key: bytes) -> Optional[bytes]:
+        item = data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del data[key]
+            return None
+        return value
+
+    def execute(self, database: int, args: List[bytes]) -> Tuple[bytes, int]:
+        """
+        Run one command and return the encoded reply and the (possibly changed) database.
+        """
+        self.commands += 1
+        data = self.databases.setdefault(database, {})
+        command = args[0].upper()
+        if command == b"PING":
+            return b"+PONG\r\n", database
+        if command == b"SELECT":
+            return b"+OK\r\n", int(args[1])
+        if command == b"GET":
+            return _bulk(self._lookup(data, args[1])), database
+        if command == b"SET":
+            expires_at = None
+            options = [option.upper() for option in args[3:]]
+            if b"PX" in options:
+                expires_at = time.monotonic() + int(args[3 + options.index(b"PX") + 1]) / 1000
+            elif b"EX" in options:
+                expires_at = time.monotonic() + int(args[3 + options.index(b"EX") + 1])
+            data[args[1]] = (args[2], expires_at)
+            return b"+OK\r\n", database
+        if command == b"DEL":
+            removed = 0
+            for key in args[1:]:
+                if self._lookup(data, key) is not None:
+                    del data[key]
+                    removed += 1
+            return b":%d\r\n" % removed, database
+        if command in (b"INCR", b"INCRBY"):
+            value = int(self._lookup(data, args[1]) or 0) + (int(args[2]) if command == b"INCRBY" else 1)
+            # Like Redis, incrementing keeps the key's expiry
+            expires_at = data[args[1]][1] if args[1] in data else None
+            data[args[1]] = (str(value).encode(), expires_at)
+            return b":%d\r\n" % value, database
+        if command == b"PEXPIREAT":
+            value = self._lookup(data, args[1])
+            if value is None:
+                return b":0\r\n", database
+            # Convert the wall-clock deadline to the monotonic clock used for expiry
+            data[args[1]] = (value, time.monotonic() + int(args[2]) / 1000 - time.time())
+            return b":1\r\n", database
+        if command == b"FLUSHALL":
+            self.databases.clear()
+            return b"+OK\r\n", database
+        return b"-ERR unknown command '%s'\r\n" % args[0], database
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        database = 0
+        try:
+            while True:
+                header = await reader.readuntil(b"\r\n")
+                if header[:1] != b"*":
+                    writer.write(b"-ERR only RESP arrays are supported\r\n")
+                    break
+                args = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                reply, database = self.execute(database, args)
+                writer.write(reply)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """
+        Start listening and return the bound port (useful with port 0).
+        """
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+async def serve(host: str, port: int) -> None:
+    server = MemoryKVServer()
+    bound = await server.start(host, port)
+    print(f"In-memory KV server listening on {host}:{bound}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="In-memory Redis-protocol stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    arguments = parser.parse_args()
+    asyncio.run(serve(arguments.host, arguments.port))
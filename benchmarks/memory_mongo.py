@@ -0,0 +1,283 @@
+"""
+In-memory stand-in for the subset of the Motor API used by UserService and
+ensure_indexes, so the API can be benchmarked without a MongoDB server.
+
+Supported: find (projection, sort, skip, limit, batch_size, async iteration),
+find_one, insert_one, insert_many (ordered=False), update_one,
+find_one_and_update ($inc, $max, $set, upsert, and pipeline updates made of
+$set stages), count_documents, aggregate ($match, $project, $group with $max
+and $sum), create_indexes and index_information. Expressions support field
+paths, $add, $max, $ifNull, $cond, $eq, $substrCP, $strLenCP and $toLong.
+Indexes declared unique are enforced.
+"""
+# MongoDB
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+# External
+from typing import Any, Dict, List, Optional, Tuple
+import copy
+import re
+
+
+def _matches(document: dict, query: dict) -> bool:
+    for field, condition in query.items():
+        value = document.get(field)
+        if isinstance(condition, dict) and any(key.startswith("$") for key in condition):
+            for operator, operand in condition.items():
+                if operator == "$gt" and not (value is not None and value > operand):
+                    return False
+                if operator == "$lt" and not (value is not None and value < operand):
+                    return False
+                if operator == "$gte" and not (value is not None and value >= operand):
+                    return False
+                if operator == "$lte" and not (value is not None and value <= operand):
+                    return False
+                if operator == "$in" and value not in operand:
+                    return False
+                if operator == "$regex" and not (isinstance(value, str) and re.search(operand, value)):
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+def _evaluate(expression: Any, document: dict) -> Any:
+    if isinstance(expression, str) and expression.startswith("$"):
+        return document.get(expression[1:])
+    if isinstance(expression, list):
+        return [_evaluate(item, document) for item in expression]
+    if not isinstance(expression, dict) or len(expression) != 1 or not next(iter(expression)).startswith("$"):
+        return expression
+    operator, operand = next(iter(expression.items()))
+    if operator == "$cond":
+        # Only the chosen branch is evaluated, as in MongoDB
+        condition, then, otherwise = operand
+        return _evaluate(then if _evaluate(condition, document) else otherwise, document)
+    arguments = _evaluate(operand if isinstance(operand, list) else [operand], document)
+    if operator == "$add":
+        return sum(arguments)
+    if operator == "$max":
+        values = [value for value in arguments if value is not None]
+        return max(values) if values else None
+    if operator == "$ifNull":
+        return next((value for value in arguments if value is not None), None)
+    if operator == "$eq":
+        return arguments[0] == arguments[1]
+    if operator == "$substrCP":
+        string, start, length = arguments
+        return string[start:start + length]
+    if operator == "$strLenCP":
+        return len(arguments[0])
+    if operator == "$toLong":
+        return int(arguments[0])
+    raise NotImplementedError(f"Unsupported expression operator {operator}")
+
+
+def _group(documents: List[dict], spec: dict) -> List[dict]:
+    groups: Dict[Any, dict] = {}
+    for document in documents:
+        key = _evaluate(spec["_id"], document)
+        group = groups.setdefault(key, {"_id": key})
+        for field, accumulator in spec.items():
+            if field == "_id":
+                continue
+            operator, expression = next(iter(accumulator.items()))
+            value = _evaluate(expression, document)
+            if operator == "$max":
+                group[field] = value if group.get(field) is None else max(group[field], value)
+            elif operator == "$sum":
+                group[field] = group.get(field, 0) + value
+            else:
+                raise NotImplementedError(f"Unsupported accumulator {operator}")
+    return list(groups.values())
+
+
+def _project(document: dict, projection: Optional[dict]) -> dict:
+    if not projection:
+        return copy.deepcopy(document)
+    included = {field for field, flag in projection.items() if flag and field != "_id"}
+    if included:
+        result = {field: copy.deepcopy(document[field]) for field in included if field in document}
+        if projection.get("_id", 1):
+            result["_id"] = document["_id"]
+        return result
+    return {field: copy.deepcopy(value) for field, value in document.items() if projection.get(field, 1)}
+
+
+class MemoryCursor:
+    def __init__(self, documents: List[dict], projection: Optional[dict]):
+        self._documents = documents
+        self._projection = projection
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, field: str, direction: int = 1) -> "MemoryCursor":
+        self._documents = sorted(self._documents, key=lambda document: document.get(field), reverse=direction < 0)
+        return self
+
+    def skip(self, count: int) -> "MemoryCursor":
+        self._skip = count
+        return self
+
+    def limit(self, count: int) -> "MemoryCursor":
+        self._limit = count
+        return self
+
+    def batch_size(self, size: int) -> "MemoryCursor":
+        return self
+
+    def _results(self) -> List[dict]:
+        end = self._skip + self._limit if self._limit else None
+        return [_project(document, self._projection) for document in self._documents[self._skip:end]]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self._results():
+            yield document
+
+    async def to_list(self, length: Optional[int] = None) -> List[dict]:
+        results = self._results()
+        return results if length is None else results[:length]
+
+
+class MemoryCollection:
+    def __init__(self, name: str):
+        self.name = name
+        self._documents: Dict[Any, dict] = {}
+        # Unique index name -> (fields, key -> _id); also used for equality lookups
+        self._unique: Dict[str, Tuple[Tuple[str, ...], Dict[tuple, Any]]] = {}
+        self._index_names = ["_id_"]
+
+    def _index(self, document: dict) -> None:
+        for index_name, (fields, entries) in self._unique.items():
+            key = tuple(document.get(field) for field in fields)
+            if entries.get(key, document["_id"]) != document["_id"]:
+                raise DuplicateKeyError(f"E11000 duplicate key error index: {index_name}", 11000)
+        for fields, entries in self._unique.values():
+            entries[tuple(document.get(field) for field in fields)] = document["_id"]
+
+    def _candidates(self, query: dict) -> List[dict]:
+        if "_id" in query and not isinstance(query["_id"], dict):
+            document = self._documents.get(query["_id"])
+            return [document] if document is not None else []
+        for fields, entries in self._unique.values():
+            if all(field in query and not isinstance(query[field], dict) for field in fields):
+                document_id = entries.get(tuple(query[field] for field in fields))
+                return [self._documents[document_id]] if document_id is not None else []
+        return list(self._documents.values())
+
+    async def create_indexes(self, indexes) -> List[str]:
+        names = []
+        for index in indexes:
+            spec = index.document
+            if spec.get("unique") and spec["name"] not in self._unique:
+                fields = tuple(spec["key"].keys())
+                entries = {tuple(doc.get(field) for field in fields): doc["_id"] for doc in self._documents.values()}
+                self._unique[spec["name"]] = (fields, entries)
+            names.append(spec["name"])
+        self._index_names = ["_id_", *names]
+        return names
+
+    async def create_index(self, keys, **kwargs) -> str:
+        return kwargs.get("name", str(keys))
+
+    async def index_information(self) -> Dict[str, dict]:
+        return {name: {} for name in self._index_names}
+
+    def find(self, query: Optional[dict] = None, projection: Optional[dict] = None) -> MemoryCursor:
+        query = query or {}
+        documents = [document for document in self._candidates(query) if _matches(document, query)]
+        return MemoryCursor(documents, projection)
+
+    async def find_one(self, query: Optional[dict] = None, projection: Optional[dict] = None) -> Optional[dict]:
+        results = await self.find(query, projection).limit(1).to_list()
+        return results[0] if results else None
+
+    async def insert_one(self, document: dict):
+        document.setdefault("_id", ObjectId())
+        if document["_id"] in self._documents:
+            raise DuplicateKeyError("E11000 duplicate key error index: _id_", 11000)
+        self._index(document)
+        self._documents[document["_id"]] = copy.deepcopy(document)
+
+    async def insert_many(self, documents: List[dict], ordered: bool = True):
+        errors = []
+        for index, document in enumerate(documents):
+            try:
+                await self.insert_one(document)
+            except DuplicateKeyError as error:
+                errors.append({"index": index, "code": 11000, "errmsg": str(error)})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(documents) - len(errors)})
+
+    def _apply(self, document: dict, update) -> None:
+        if isinstance(update, list):
+            # Pipeline update: $set stages see the document as left by the previous stage
+            for stage in update:
+                values = {field: _evaluate(value, document) for field, value in stage["$set"].items()}
+                document.update(values)
+            return
+        for field, amount in update.get("$inc", {}).items():
+            document[field] = document.get(field, 0) + amount
+        for field, value in update.get("$max", {}).items():
+            document[field] = max(document.get(field, value), value)
+        for field, value in update.get("$set", {}).items():
+            document[field] = value
+
+    async def update_one(self, query: dict, update: dict, upsert: bool = False):
+        await self.find_one_and_update(query, update, upsert=upsert)
+
+    async def find_one_and_update(
+        self, query: dict, update: dict, upsert: bool = False, return_document: bool = ReturnDocument.BEFORE
+    ) -> Optional[dict]:
+        document = next((doc for doc in self._candidates(query) if _matches(doc, query)), None)
+        if document is None:
+            if not upsert:
+                return None
+            document = {key: value for key, value in query.items() if not isinstance(value, dict)}
+            document.setdefault("_id", ObjectId())
+            before = None
+            self._documents[document["_id"]] = document
+        else:
+            before = copy.deepcopy(document)
+        self._apply(document, update)
+        return copy.deepcopy(document) if return_document == ReturnDocument.AFTER else before
+
+    async def count_documents(self, query: dict) -> int:
+        return sum(1 for document in self._candidates(query) if _matches(document, query))
+
+    def aggregate(self, pipeline: List[dict]) -> MemoryCursor:
+        documents = list(self._documents.values())
+        for stage in pipeline:
+            if "$match" in stage:
+                documents = [document for document in documents if _matches(document, stage["$match"])]
+            elif "$project" in stage:
+                documents = [
+                    {"_id": document["_id"], **{
+                        field: document.get(field) if value in (1, True) else _evaluate(value, document)
+                        for field, value in stage["$project"].items()
+                        if field != "_id"
+                    }}
+                    for document in documents
+                ]
+            elif "$group" in stage:
+                documents = _group(documents, stage["$group"])
+            else:
+                raise NotImplementedError(f"Unsupported aggregation stage {next(iter(stage))}")
+        return MemoryCursor(documents, None)
+
+
+class MemoryDatabase:
+    def __init__(self):
+        self._collections: Dict[str, MemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(name)
+        return self._collections[name]
@@ -0,0 +1,245 @@
+"""
+Benchmark the API end to end: the app runs under uvicorn against the local fake
+TheCatAPI and the in-memory MongoDB stand-in, and a closed-loop driver sends a
+weighted mix of list/search/get/create/login requests.
+
+    python -m benchmarks.run --duration 30 --concurrency 50 --latency-ms 50
+    python -m benchmarks.run --compare benchmarks/results/<previous>.json
+
+Results (RPS, p50/p95/p99 and errors per operation) are printed and written as
+JSON to benchmarks/results/, tagged with the current git commit.
+"""
+# External
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import httpx
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+PASSWORD = "bench-password"
+OPERATIONS = ("list", "search", "get", "create", "login")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def percentile(samples: List[float], fraction: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def start_server(module: str, port: int, env: Dict[str, str], workers: int = 1) -> subprocess.Popen:
+    command = [sys.executable, "-m", "uvicorn", module, "--host", "127.0.0.1", "--port", str(port),
+               "--log-level", "warning", "--workers", str(workers)]
+    return subprocess.Popen(command, cwd=ROOT, env={**os.environ, **env})
+
+
+async def wait_ready(url: str, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            with contextlib.suppress(httpx.HTTPError):
+                await client.get(url)
+                return
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"{url} did not become ready within {timeout}s")
+
+
+class Driver:
+    """
+    Closed-loop load generator: each worker sends its next request as soon as the
+    previous one completes.
+    """
+    def __init__(self, base_url: str, weights: Dict[str, int], breed_ids: List[str], usernames: List[str]):
+        self.base_url = base_url
+        self.operations = list(weights)
+        self.weights = [weights[operation] for operation in self.operations]
+        self.breed_ids = breed_ids
+        self.usernames = usernames
+        self.latencies: Dict[str, List[float]] = {operation: [] for operation in self.operations}
+        self.errors: Dict[str, int] = {operation: 0 for operation in self.operations}
+
+    async def request(self, client: httpx.AsyncClient, operation: str) -> httpx.Response:
+        if operation == "list":
+            return await client.get("/breeds/", params={"limit": 10, "page": random.randint(0, 5)})
+        if operation == "search":
+            return await client.get("/breeds/search", params={"query": random.choice(("active", "calm", "rex"))})
+        if operation == "get":
+            return await client.get(f"/breeds/{random.choice(self.breed_ids)}")
+        if operation == "create":
+            name = random.choice(("Ada", "Alan", "Grace", "Linus", "Barbara"))
+            return await client.post("/users/", json={"name": name, "lastname": "Bench", "password": PASSWORD})
+        return await client.post("/users/login", json={"username": random.choice(self.usernames), "password": PASSWORD})
+
+    async def worker(self, client: httpx.AsyncClient, deadline: float) -> None:
+        while time.monotonic() < deadline:
+            operation = random.choices(self.operations, self.weights)[0]
+            start = time.perf_counter()
+            try:
+                response = await self.request(client, operation)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            self.latencies[operation].append(time.perf_counter() - start)
+            if failed:
+                self.errors[operation] += 1
+
+    async def run(self, concurrency: int, duration: float) -> float:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=self.base_url, limits=limits, timeout=30) as client:
+            start = time.perf_counter()
+            deadline = time.monotonic() + duration
+            await asyncio.gather(*(self.worker(client, deadline) for _ in range(concurrency)))
+            return time.perf_counter() - start
+
+    def summary(self, elapsed: float) -> Dict[str, dict]:
+        def describe(samples: List[float], errors: int) -> dict:
+            return {
+                "requests": len(samples),
+                "errors": errors,
+                "rps": round(len(samples) / elapsed, 1),
+                **{
+                    name: None if value is None else round(value * 1000, 2)
+                    for name, value in (
+                        ("p50_ms", percentile(samples, 0.50)),
+                        ("p95_ms", percentile(samples, 0.95)),
+                        ("p99_ms", percentile(samples, 0.99)),
+                    )
+                },
+            }
+
+        every = [sample for samples in self.latencies.values() for sample in samples]
+        report = {operation: describe(self.latencies[operation], self.errors[operation]) for operation in self.operations}
+        report["total"] = describe(every, sum(self.errors.values()))
+        return report
+
+
+async def seed_users(base_url: str, count: int) -> List[str]:
+    rows = [{"name": f"Seed{index % 50}", "lastname": "User", "password": PASSWORD} for index in range(count)]
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        response = await client.post("/users/bulk", json=rows)
+        response.raise_for_status()
+    return [result["username"] for result in response.json()["results"] if result["username"]]
+
+
+def print_report(report: Dict[str, dict], baseline: Optional[Dict[str, dict]] = None) -> None:
+    print(f"{'operation':<10}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for operation, row in report.items():
+        line = (f"{operation:<10}{row['requests']:>10}{row['errors']:>8}{row['rps']:>10}"
+                f"{row['p50_ms'] or '-':>10}{row['p95_ms'] or '-':>10}{row['p99_ms'] or '-':>10}")
+        previous = (baseline or {}).get(operation)
+        if previous and previous.get("rps") and previous.get("p99_ms") and row["p99_ms"]:
+            line += (f"   rps {100 * (row['rps'] / previous['rps'] - 1):+.1f}%"
+                     f"  p99 {100 * (row['p99_ms'] / previous['p99_ms'] - 1):+.1f}%")
+        print(line)
+
+
+async def main(args: argparse.Namespace) -> dict:
+    fake_port, app_port = free_port(), free_port()
+    fake_env = {
+        "FAKE_CATAPI_LATENCY_MS": str(args.latency_ms),
+        "FAKE_CATAPI_JITTER_MS": str(args.jitter_ms),
+        "FAKE_CATAPI_PAYLOAD_BYTES": str(args.payload_bytes),
+        "FAKE_CATAPI_BREEDS": str(args.breeds),
+    }
+    app_env = {
+        "CAT_API_URL": f"http://127.0.0.1:{fake_port}/v1",
+        "CAT_API_KEY": "benchmark",
+        "BREED_CACHE_STORE": "",
+        "METRICS_ENABLED": "true",
+        **dict(pair.split("=", 1) for pair in args.env),
+    }
+
+    processes = [start_server("benchmarks.fake_catapi:app", fake_port, fake_env)]
+    try:
+        await wait_ready(f"http://127.0.0.1:{fake_port}/stats")
+        processes.append(start_server("benchmarks.app_under_test:app", app_port, app_env))
+        base_url = f"http://127.0.0.1:{app_port}"
+        await wait_ready(f"{base_url}/metrics")
+
+        usernames = await seed_users(base_url, args.users)
+        weights = dict(zip(OPERATIONS, args.mix))
+        breed_ids = [f"b{index:03d}" for index in range(args.breeds)]
+        driver = Driver(base_url, {operation: weight for operation, weight in weights.items() if weight}, breed_ids, usernames)
+        elapsed = await driver.run(args.concurrency, args.duration)
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait(timeout=10)
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "mix": weights,
+            "users": args.users,
+            "upstream": fake_env,
+            "env": app_env,
+        },
+        "elapsed": round(elapsed, 3),
+        "results": driver.summary(elapsed),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load per run")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent closed-loop clients")
+    parser.add_argument("--mix", type=int, nargs=5, default=[35, 20, 30, 5, 10], metavar="W",
+                        help="Weights for list search get create login")
+    parser.add_argument("--users", type=int, default=200, help="Users seeded before the run")
+    parser.add_argument("--breeds", type=int, default=67, help="Breeds served by the fake TheCatAPI")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Fake TheCatAPI latency")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra fake TheCatAPI latency")
+    parser.add_argument("--payload-bytes", type=int, default=500, help="Size of each fake breed description")
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=VALUE",
+                        help="Extra setting for the app under test (repeatable)")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<timestamp>-<commit>.json)")
+    parser.add_argument("--compare", help="Previous result file to compare against")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    result = asyncio.run(main(arguments))
+
+    baseline = None
+    if arguments.compare:
+        with open(arguments.compare) as handle:
+            baseline = json.load(handle)["results"]
+    print_report(result["results"], baseline)
+
+    output = arguments.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = os.path.join(RESULTS_DIR, f"{stamp}-{result['commit'] or 'unknown'}.json")
+    with open(output, "w") as handle:
+        json.dump(result, handle, indent=2)
+    print(f"Results written to {output}")
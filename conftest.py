@@ -1,4 +1,7 @@
 pytest_plugins = [
     "app.tests.utilities.fixtures.common",
+    "app.tests.utilities.fixtures.cache",
     "app.tests.utilities.fixtures.httpx_mocks",
+    "app.tests.utilities.fixtures.rate_limit",
+    "app.tests.utilities.fixtures.resilience",
 ]
\ No newline at end of file